@@ -0,0 +1,1131 @@
+"""
+한영자 희망 장학재단 장학생 선발 시스템 — 서류 파싱·점수 계산·선발 코어 (Flask 의존 없음)
+api/index.py는 첫 분석 요청 때 이 모듈을 임포트 → GET / · /api/health 콜드 스타트에서 제외
+"""
+
+import io
+import hashlib
+import importlib.metadata
+import importlib.util
+import heapq
+import os
+import re
+import multiprocessing
+import shutil
+import tempfile
+import zipfile
+import logging
+import random
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from hanyang_metrics import Timings, _timings_local, _current_timings, _timed
+
+# 처리 로그 — 버퍼 핸들러(응답의 log)는 api/index.py에서 같은 이름의 로거에 연결
+logger = logging.getLogger("hanyang_api")
+
+# ──────────────────────────────────────────────────────────────────────
+# 전역 상수
+# ──────────────────────────────────────────────────────────────────────
+# 학년 점수: (현재학년 ÷ 학제총학년) × 50 — 2·3·4년제 공평 정규화
+MAX_SCHOLARS: int = 50
+DEFAULT_GRAD_CREDITS: float = 120.0
+# PDF 병렬 추출 워커 수 (0·1 = 순차) — 서버리스는 프로세스 풀 미지원 시 자동 순차 전환
+EXTRACT_WORKERS: int = int(os.environ.get("HANYANG_EXTRACT_WORKERS", "0") or 0)
+# 추출 풀 대기열 깊이 — 모든 요청을 합쳐 워커에 넘겨 두는 PDF 수 한도 (0 = 워커 수 × 4). 차면 제출 대기
+EXTRACT_QUEUE: int = int(os.environ.get("HANYANG_EXTRACT_QUEUE", "0") or 0)
+PARALLEL_MIN_FILES: int = 8
+# 텍스트 추출 디스크 캐시 — 마스킹된 서류 원문을 디스크에 남기므로 기본 비활성 (HANYANG_CACHE_MAX_MB>0 으로 켬).
+# 폴더는 사용자별·소유자 전용(0700, 파일 0600), 저장 후 HANYANG_CACHE_TTL_HOURS가 지나면 만료. Vercel은 /tmp만 쓰기 가능
+CACHE_DIR: str = os.environ.get("HANYANG_CACHE_DIR", os.path.join(tempfile.gettempdir(), f"hanyang_extract_cache_{os.getuid() if hasattr(os, 'getuid') else 'user'}"))
+CACHE_MAX_BYTES: int = int(os.environ.get("HANYANG_CACHE_MAX_MB", "0") or 0) * 1024 * 1024
+CACHE_TTL_SEC: float = float(os.environ.get("HANYANG_CACHE_TTL_HOURS", "24") or 0) * 3600
+EXCLUDED_NOTE = "⛔ 이전 선발자 — 중복 선발 제외"
+# 2단계 추출: 1쪽으로 먼저 분류해 자립지원 대상자 확인서면 나머지 쪽 생략 (0 이면 항상 전체 추출)
+EARLY_EXIT_EXTRACT: bool = bool(int(os.environ.get("HANYANG_EARLY_EXIT", "1") or 0))
+# PDF 백엔드: "auto"(설치된 것 중 가장 빠른 것) 또는 "pymupdf,pypdf"처럼 시도 순서 지정.
+# PDF_FALLBACK이면 빈 텍스트(스캔 이미지·파싱 실패)일 때 목록의 다음 백엔드로 재시도
+PDF_BACKEND: str = os.environ.get("HANYANG_PDF_BACKEND", "auto")
+PDF_FALLBACK: bool = bool(int(os.environ.get("HANYANG_PDF_FALLBACK", "0") or 0))
+# 문서별 추출 한도 — 넘는 PDF는 건너뛰고 비고에 사유 기록 (0 = 제한 없음)
+MAX_PDF_BYTES: int = int(os.environ.get("HANYANG_MAX_PDF_MB", "25") or 0) * 1024 * 1024
+MAX_PDF_PAGES: int = int(os.environ.get("HANYANG_MAX_PDF_PAGES", "300") or 0)
+MAX_TEXT_CHARS: int = int(os.environ.get("HANYANG_MAX_TEXT_CHARS", "2000000") or 0)
+# 격리 추출: PDF를 하위 프로세스에서 추출, 시간 초과 시 강제 종료 (0 = 요청 스레드에서 직접 추출).
+# 하위 프로세스 메모리는 시작 시 주소 공간 + PDF_MEM_MB로 제한 (Linux). Vercel은 기본 비활성
+PDF_TIMEOUT_SEC: float = float(os.environ.get("HANYANG_PDF_TIMEOUT_SEC", "0" if os.environ.get("VERCEL") else "60") or 0)
+PDF_MEM_BYTES: int = int(os.environ.get("HANYANG_PDF_MEM_MB", "1024") or 0) * 1024 * 1024
+
+CERT_KEYWORDS = ["국가기술자격","국가전문자격","기사","산업기사","기능사","기능장","기술사","TOEIC","TOEFL","IELTS","OPIc","JLPT","HSK","토익","토플","오픽","텝스","TEPS","자격증","면허","어학성적"]
+VOLUNTEER_KEYWORDS = ["봉사","자원봉사","사회봉사","봉사활동","봉사시간"]
+MILITARY_KEYWORDS  = ["병역","현역","예비역","만기전역","군필","복무완료","전역","군복무"]
+DOC_ELIGIBILITY_KW = ["자립지원 대상자 확인서","자립지원대상자확인서","자립준비청년 확인서"]
+DOC_ENROLLMENT_KW  = ["재학증명서","재학 증명서"]
+DOC_TRANSCRIPT_KW  = ["성적증명서","성적표","학업성적","성적 증명서"]
+REGION_MAP: Dict[str, List[str]] = {
+    "서울":["서울특별시"],"인천":["인천광역시"],"경기":["경기도"],
+    "강원":["강원특별자치도","강원도"],"충북":["충청북도"],"충남":["충청남도"],
+    "대전":["대전광역시"],"세종":["세종특별자치시","세종시"],
+    "전북":["전북특별자치도","전라북도"],"전남":["전라남도"],"광주":["광주광역시"],
+    "경북":["경상북도"],"대구":["대구광역시"],"경남":["경상남도"],
+    "울산":["울산광역시"],"부산":["부산광역시"],"제주":["제주특별자치도","제주도"],
+}
+
+# ──────────────────────────────────────────────────────────────────────
+# 데이터 클래스
+# ──────────────────────────────────────────────────────────────────────
+@dataclass(slots=True)
+class ApplicantData:
+    """__slots__ 레코드 — 서류 원문은 보관하지 않음 (process() 안에서 실명 보정 후 해제)"""
+    applicant_key: str = ""; name: str = "미확인"; grade: int = 0; major: str = ""
+    completed_credits: float = 0.0; graduation_credits: float = DEFAULT_GRAD_CREDITS
+    gpa: float = 0.0; has_certificate: bool = False; volunteer_hours: float = 0.0
+    is_military: bool = False; is_eligible: bool = False; has_enrollment: bool = False
+    has_transcript: bool = False; has_bonus_doc: bool = False
+    parse_notes: List[str] = field(default_factory=list)
+    grade_score: float = 0.0; completion_rate: float = 0.0; completion_score: float = 0.0
+    bonus_cert: bool = False; bonus_volunteer: bool = False
+    bonus_score: float = 0.0; total_score: float = 0.0; region: str = ""; max_grade: int = 4
+
+# ──────────────────────────────────────────────────────────────────────
+# 민감 정보 마스킹
+# ──────────────────────────────────────────────────────────────────────
+class MaskingEngine:
+    """순서 있는 (정규식, 치환) 규칙을 본문 1회 스캔으로 적용 — 규칙은 모두 숫자로 시작하고 숫자·공백·하이픈으로만
+    이루어지며 숫자 min_digits개 이상 필요. 숫자로 시작해 그 문자들이 min_digits자 이상 이어지는 후보 구간만 찾아 구간 안에서 규칙을 순서대로 적용하므로
+    (치환이 구간 밖을 바꾸거나 구간을 잇지 않음) 본문 전체에 re.sub를 연쇄 적용한 결과와 같음.
+    규칙 집합은 앱마다 다를 수 있어 추출 경로에 인자로 전달 (격리 추출·워커 프로세스에는 규칙 목록으로 피클).
+    fingerprint: 규칙 집합 식별값 — 추출 캐시 키에 포함해 규칙이 다른 앱·버전끼리 마스킹 결과를 공유하지 않음"""
+    def __init__(self, rules: List[Tuple[str, str]], min_digits: int):
+        self.rules=list(rules); self.min_digits=min_digits
+        self.fingerprint=hashlib.sha256(repr((self.rules, min_digits)).encode("utf-8")).hexdigest()[:16]
+        self._rules=[(re.compile(p), r) for p, r in rules]
+        self._span=re.compile(rf"\d[\d\s\-–]{{{min_digits-1},}}")
+
+    def __reduce__(self): return MaskingEngine, (self.rules, self.min_digits)
+
+    def _mask_span(self, m: "re.Match") -> str:
+        span=m.group()
+        for pattern, repl in self._rules: span=pattern.sub(repl, span)
+        return span
+
+    def mask(self, text: str) -> str: return self._span.sub(self._mask_span, text)
+
+# 주민등록번호 뒷자리(구분자 있음·없음) → 휴대전화 가운데 자리 — 순서 유지, 최소 숫자 10개(전화번호)
+MASKING_RULES: List[Tuple[str, str]] = [
+    (r"(\d{6})\s*[-–]\s*(\d{7})", r"\1-*******"),
+    (r"(\d{6})(\d{7})", r"\1*******"),
+    (r"(01\d)\s*[-–]\s*(\d{3,4})\s*[-–]\s*(\d{4})", r"\1-****-\3"),
+]
+_masker = MaskingEngine(MASKING_RULES, min_digits=10)
+
+def mask_sensitive(text: str) -> str: return _masker.mask(text)
+
+# ──────────────────────────────────────────────────────────────────────
+# 추출 캐시 — SHA-256(백엔드·버전·추출 한도 + 마스킹 규칙 + PDF 바이트) → 마스킹된 텍스트, 용량 한도 LRU.
+# 사용 순서는 atime(조회 때 갱신), 만료는 저장 시각 mtime 기준 (자주 읽혀도 ttl이 지나면 삭제)
+# ──────────────────────────────────────────────────────────────────────
+class _CacheEntry(NamedTuple):
+    atime: float; size: int; path: str; expired: bool   # 필드 순서 = 정렬 순서 (오래 안 쓴 항목부터)
+
+class ExtractionCache:
+    def __init__(self, directory: str, max_bytes: int, backend: str, ttl: float=0):
+        self.directory=directory; self.max_bytes=max_bytes; self.backend=backend; self.ttl=ttl
+        self._size: Optional[int] = None
+        self._private: Optional[bool] = None
+
+    @property
+    def enabled(self) -> bool: return self.max_bytes > 0 and self._check_dir()
+
+    def _check_dir(self) -> bool:
+        """폴더를 소유자 전용(0700)으로 만들고 확인 — 다른 사용자가 만들었거나 다른 사용자도 접근 가능한 폴더면 캐시 끔"""
+        if self._private is None:
+            try:
+                os.makedirs(self.directory, mode=0o700, exist_ok=True); st=os.stat(self.directory)
+                self._private = not hasattr(os, "getuid") or (st.st_uid==os.getuid() and not st.st_mode & 0o077)
+            except OSError: self._private=False
+            if not self._private: logger.warning(f"추출 캐시 비활성 — 현재 사용자 전용(0700) 폴더가 아님: {self.directory}")
+        return self._private
+
+    def _expired(self, st: os.stat_result) -> bool: return bool(self.ttl) and time.time()-st.st_mtime > self.ttl
+
+    def key(self, pdf_bytes: bytes, masking: str="") -> str:
+        """masking: 마스킹 규칙 식별값 (MaskingEngine.fingerprint)"""
+        h=hashlib.sha256(f"{self.backend}\0{masking}\0".encode("utf-8")); h.update(pdf_bytes); return h.hexdigest()
+
+    def _path(self, key: str) -> str: return os.path.join(self.directory, key[:2], key+".txt")
+
+    def get(self, key: str) -> Optional[str]:
+        path=self._path(key)
+        try:
+            st=os.stat(path)
+            if self._expired(st):
+                os.remove(path)
+                if self._size is not None: self._size-=st.st_size
+                return None
+            with open(path, "r", encoding="utf-8") as f: text=f.read()
+            os.utime(path, (time.time(), st.st_mtime)); return text  # 사용 시각(atime)만 갱신 = LRU 순서
+        except OSError: return None
+
+    def put(self, key: str, text: str) -> None:
+        path=self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            tmp=f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(os.open(tmp, os.O_WRONLY|os.O_CREAT|os.O_TRUNC, 0o600), "w", encoding="utf-8") as f: f.write(text)
+            os.replace(tmp, path)
+            if self._size is None: self._evict(sweep=True)   # 첫 저장 — 이전 실행이 남긴 만료 항목 정리, 용량 집계
+            else: self._size+=os.path.getsize(path)
+            if self._size > self.max_bytes: self._evict()
+        except OSError as e:
+            logger.warning(f"추출 캐시 저장 실패: {e}")
+
+    def _entries(self) -> List[_CacheEntry]:
+        out=[]
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir(): continue
+            for e in os.scandir(shard.path):
+                if e.name.endswith(".txt"): i=e.stat(); out.append(_CacheEntry(i.st_atime, i.st_size, e.path, self._expired(i)))
+        return out
+
+    def _evict(self, sweep: bool=False) -> None:
+        """만료 항목 삭제 후, 한도를 넘으면 한도의 90%까지 오래 안 쓴 항목부터 삭제 (sweep: 한도 이하면 만료 항목만)"""
+        entries=sorted(self._entries()); total=sum(e.size for e in entries)
+        limit=self.max_bytes if sweep and total<=self.max_bytes else self.max_bytes*0.9
+        for e in entries:
+            if total <= limit and not e.expired: continue
+            try: os.remove(e.path); total-=e.size
+            except OSError: pass
+        self._size=total
+
+# ──────────────────────────────────────────────────────────────────────
+# PDF 백엔드 — 열기(bytes) → page_count·page_text(i)·close() 만 담당, 한도·조기 종료·마스킹은 PDFParser.
+# 설치 여부는 임포트 없이 확인하고 모듈은 첫 추출 때 임포트 (격리 추출이면 하위 프로세스에서만).
+# 등록 순서 = 빠른 순 (benchmarks/bench_backends.py로 측정)
+# ──────────────────────────────────────────────────────────────────────
+class _MuPdfDoc:
+    def __init__(self, data: bytes):
+        import fitz
+        self._doc=fitz.open(stream=data, filetype="pdf"); self.page_count=self._doc.page_count
+    def page_text(self, i: int) -> str: return self._doc[i].get_text()
+    def close(self) -> None: self._doc.close()
+
+class _PypdfDoc:
+    def __init__(self, data: bytes):
+        from pypdf import PdfReader
+        self._pages=PdfReader(io.BytesIO(data)).pages; self.page_count=len(self._pages)
+    def page_text(self, i: int) -> str: return self._pages[i].extract_text() or ""
+    def close(self) -> None: pass
+
+class _PdfminerDoc:
+    """레이아웃 분석 생략(laparams=None) — 글자를 내용 스트림 순서대로만 모음"""
+    def __init__(self, data: bytes):
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfinterp import PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfparser import PDFParser as _MinerParser
+        self._pages=list(PDFPage.create_pages(PDFDocument(_MinerParser(io.BytesIO(data)))))
+        self.page_count=len(self._pages); self._rsrc=PDFResourceManager(caching=True)
+    def page_text(self, i: int) -> str:
+        from pdfminer.converter import TextConverter
+        from pdfminer.pdfinterp import PDFPageInterpreter
+        out=io.StringIO(); dev=TextConverter(self._rsrc, out, laparams=None)
+        try: PDFPageInterpreter(self._rsrc, dev).process_page(self._pages[i])
+        finally: dev.close()
+        return out.getvalue()
+    def close(self) -> None: pass
+
+@dataclass(frozen=True)
+class PdfBackend:
+    name: str; module: str; dist: str; open: Callable[[bytes], Any]
+    def installed(self) -> bool: return importlib.util.find_spec(self.module) is not None
+    def version(self) -> str:
+        try: return importlib.metadata.version(self.dist)
+        except importlib.metadata.PackageNotFoundError: return "0"
+
+PDF_BACKENDS: Dict[str, PdfBackend] = {b.name: b for b in (
+    PdfBackend("pymupdf", "fitz", "PyMuPDF", _MuPdfDoc),
+    PdfBackend("pypdf", "pypdf", "pypdf", _PypdfDoc),
+    PdfBackend("pdfminer", "pdfminer", "pdfminer.six", _PdfminerDoc),
+)}
+
+def select_pdf_backends(spec: str, fallback: bool) -> List[PdfBackend]:
+    """추출에 쓸 백엔드 목록 — "auto"는 등록 순, 이름 목록은 지정 순 중 설치된 것 (fallback이 아니면 첫 번째만)"""
+    names=list(PDF_BACKENDS) if spec.strip().lower() in ("", "auto") else [n.strip().lower() for n in spec.split(",") if n.strip()]
+    unknown=[n for n in names if n not in PDF_BACKENDS]
+    if unknown: raise ValueError(f"알 수 없는 PDF 백엔드: {', '.join(unknown)} (사용 가능: {', '.join(PDF_BACKENDS)})")
+    chain=[PDF_BACKENDS[n] for n in names if PDF_BACKENDS[n].installed()]
+    if not chain: raise RuntimeError(f"설치된 PDF 백엔드 없음: {', '.join(names)}")
+    return chain if fallback else chain[:1]
+
+_pdf_chain = select_pdf_backends(PDF_BACKEND, PDF_FALLBACK)
+
+# 백엔드·버전·2단계 추출(확인서는 1쪽만) 여부마다 추출 결과가 다르고, 쪽수·글자 수 한도가 작은 설정이 큰 설정의
+# 결과를 읽으면 한도를 우회하므로 캐시 키를 구분 (마스킹 규칙은 조회 시 키에 추가)
+_extract_cache = ExtractionCache(CACHE_DIR, CACHE_MAX_BYTES,
+    "+".join(f"{b.name}-{b.version()}" for b in _pdf_chain)+("-early" if EARLY_EXIT_EXTRACT else "")
+    +f"-p{MAX_PDF_PAGES}-c{MAX_TEXT_CHARS}", CACHE_TTL_SEC)
+
+# ──────────────────────────────────────────────────────────────────────
+# 키워드 매처 — 분류별 키워드 표 전체를 리터럴 교대 정규식 하나로 1회 스캔
+# 결과는 분류별 any(k in text ...)와 동일: 긴 키워드에 포함된 짧은 키워드의 분류는 합산,
+# 다른 키워드와 걸쳐 겹쳐 스캔에서 가려질 수 있는 키워드는 직접 검사.
+# ──────────────────────────────────────────────────────────────────────
+class KeywordMatcher:
+    def __init__(self, tables: Dict[str, List[str]]):
+        cats: Dict[str, set] = {}
+        for cat, kws in tables.items():
+            for k in kws: cats.setdefault(k, set()).add(cat)
+        words=sorted(cats, key=len, reverse=True)   # 같은 위치에서는 긴 키워드 우선
+        self._cats={w: frozenset().union(*(cats[k] for k in words if k in w)) for w in words}
+        self._direct=[(k, frozenset(cats[k])) for k in words
+                      if any(not cats[k]<=self._cats[w] and any(w.endswith(k[:n]) for n in range(1, min(len(w),len(k))))
+                             for w in words if w!=k)]
+        self._regex=re.compile("|".join(re.escape(w) for w in words))
+        self._last: Tuple[Optional[str], frozenset] = (None, frozenset())
+
+    def scan(self, text: str) -> frozenset:
+        """키워드가 등장한 분류명 집합 — 직전 본문과 같은 객체면 재사용"""
+        last_text, last_hits = self._last
+        if text is last_text: return last_hits
+        hits: set = set()
+        for w in set(self._regex.findall(text)): hits|=self._cats[w]
+        for w, wc in self._direct:
+            if not wc<=hits and w in text: hits|=wc
+        result=frozenset(hits); self._last=(text, result)
+        return result
+
+DOC_KEYWORDS = KeywordMatcher({"eligibility": DOC_ELIGIBILITY_KW, "enrollment": DOC_ENROLLMENT_KW,
+                               "transcript": DOC_TRANSCRIPT_KW, "cert": CERT_KEYWORDS,
+                               "volunteer": VOLUNTEER_KEYWORDS, "military": MILITARY_KEYWORDS})
+# 대소문자 무시 비교가 필요한 영문 자격증 키워드 (소문자)
+_CERT_CASED_LOWER = [k.lower() for k in CERT_KEYWORDS if k.lower()!=k.upper()]
+
+# ──────────────────────────────────────────────────────────────────────
+# 필드 추출 패턴 — 임포트 시 1회 컴파일 (목록 순서 = 우선순위)
+# 패턴별 필수 앞/뒤 리터럴(예: '(\d+)\s*시간' → '시간')이 본문에 없으면 정규식 실행을 생략.
+# 결과는 패턴별 re.search 순회와 동일하다.
+# ──────────────────────────────────────────────────────────────────────
+FieldPatterns = List[Tuple["re.Pattern[str]", Tuple[str, ...]]]
+_LIT_HEAD = re.compile(r"[가-힣A-Za-z]+"); _LIT_TAIL = re.compile(r"[가-힣A-Za-z]+$")
+
+def _required_literals(pattern: str, flags: int=0) -> Tuple[str, ...]:
+    """일치에 반드시 필요한 앞/뒤 고정 문자열 — 교대(|) 패턴은 생략, IGNORECASE는 대소문자 없는 글자만"""
+    if "|" in pattern: return ()
+    lits=[]; head=_LIT_HEAD.match(pattern)
+    if head:
+        lit=head.group(0)
+        if pattern[head.end():head.end()+1] in ("?","*","{"): lit=lit[:-1]  # 마지막 글자가 선택적
+        if lit: lits.append(lit)
+    tail=_LIT_TAIL.search(pattern)
+    if tail and (not head or tail.start()>0):
+        lit=tail.group(0)
+        if pattern[tail.start()-1:tail.start()]=="\\": lit=lit[1:]  # '\d' 등 이스케이프 제외
+        if lit and lit not in lits: lits.append(lit)
+    if flags & re.IGNORECASE: lits=[l for l in lits if l.lower()==l.upper()]
+    return tuple(lits)
+
+def _compile_patterns(patterns: List[str], flags: int=0) -> FieldPatterns:
+    return [(re.compile(p, flags), _required_literals(p, flags)) for p in patterns]
+
+def _iter_searches(table: FieldPatterns, text: str):
+    """우선순위 순 패턴별 첫 일치"""
+    for ptn, lits in table:
+        if all(l in text for l in lits):
+            m=ptn.search(text)
+            if m: yield m
+
+def _iter_findall(table: FieldPatterns, text: str):
+    for ptn, lits in table:
+        if all(l in text for l in lits):
+            ms=ptn.findall(text)
+            if ms: yield ms
+
+NAME_PATTERNS = _compile_patterns([r"성\s*명\s*[：:]\s*([가-힣]{2,5})",r"이\s*름\s*[：:]\s*([가-힣]{2,5})",r"학생명\s*[：:]\s*([가-힣]{2,5})"])
+GRADE_PATTERNS = _compile_patterns([r"([1-4])\s*학년",r"학\s*년\s*[：:\s]*([1-4])"])
+MAJOR_PATTERNS = _compile_patterns([r"전\s*공\s*[：:\s]+([^\n\r\t]{2,30})",r"학\s*과\s*[：:\s]+([^\n\r\t]{2,30})",r"학\s*부\s*[：:\s]+([^\n\r\t]{2,30})"])
+GRAD_CREDIT_PATTERNS = _compile_patterns([r"졸업\s*기준\s*학점\s*[：:\s]*(\d+\.?\d*)",r"졸업\s*이수\s*학점\s*[：:\s]*(\d+\.?\d*)",r"졸업\s*학점\s*[：:\s]*(\d+\.?\d*)"])
+COMP_CREDIT_PATTERNS = _compile_patterns([r"취득\s*학점\s*[：:\s]*(\d+\.?\d*)",r"이수\s*학점\s*[：:\s]*(\d+\.?\d*)",r"누적\s*학점\s*[：:\s]*(\d+\.?\d*)"])
+GPA_PATTERNS = _compile_patterns([r"전체\s*평점\s*[：:\s]*(\d+\.\d+)",r"누적\s*평점\s*[：:\s]*(\d+\.\d+)",r"평\s*점\s*[：:\s]*(\d+\.\d+)",r"GPA\s*[：:\s]*(\d+\.\d+)"], re.IGNORECASE)
+VOLUNTEER_PATTERNS = _compile_patterns([r"봉사\s*시간\s*[：:\s]*(\d+\.?\d*)",r"총\s*봉사\s*[：:\s]*(\d+\.?\d*)\s*시간",r"(\d+\.?\d*)\s*시간"])
+MAX_GRADE_PATTERNS = _compile_patterns([r"수업\s*연한\s*[：:\s]*([2-4])\s*년",r"([2-4])\s*년\s*제",r"학\s*제\s*[：:\s]*([2-4])\s*년"])
+REGION_PATTERNS = _compile_patterns([r"(?:주소|거주지|현주소|주거지)\s*[：:]\s*([^\n\r]{4,80})",
+                                     r"([가-힣]+(특별시|광역시|특별자치시|특별자치도|도)\b[^\n\r]{0,30})"])
+_JUNIOR_COLLEGE_RE = re.compile(r"전문대학(?!교)")
+_THREE_YEAR_RE = re.compile(r"3\s*년\s*제|수업연한\s*[：:\s]*3")
+_UNIVERSITY_RE = re.compile(r"[가-힣]+대학교")
+_WS_RE = re.compile(r"\s+")
+
+# ──────────────────────────────────────────────────────────────────────
+# PDF 파서
+# ──────────────────────────────────────────────────────────────────────
+class ExtractionLimit(Exception):
+    """문서별 한도(크기·쪽수·텍스트 길이·시간·메모리) 초과 — 해당 PDF만 건너뛰고 사유를 비고에 기록"""
+    def __init__(self, reason: str): super().__init__(f"건너뜀 — {reason}")
+
+class PDFParser:
+    """텍스트 추출·분류는 공용, 필드 추출 패턴 표는 클래스 속성 — 패턴이 다른 앱(app.py)은 하위 클래스에서 표만 교체"""
+    NAME_PATTERNS = NAME_PATTERNS; GRADE_PATTERNS = GRADE_PATTERNS; MAJOR_PATTERNS = MAJOR_PATTERNS
+    GRAD_CREDIT_PATTERNS = GRAD_CREDIT_PATTERNS; COMP_CREDIT_PATTERNS = COMP_CREDIT_PATTERNS
+    GPA_PATTERNS = GPA_PATTERNS; VOLUNTEER_PATTERNS = VOLUNTEER_PATTERNS
+
+    @staticmethod
+    @_timed("extract_text", len)
+    def extract_text(pdf_bytes: bytes, early_exit: bool=False, masker: Optional[MaskingEngine]=None) -> str:
+        """early_exit: 1쪽이 자립지원 대상자 확인서로 분류되면 나머지 쪽은 추출하지 않음
+        (확인서는 분류 우선순위가 가장 높아 뒤쪽과 무관하게 분류 동일, 마스킹은 숫자만 바꿔 분류에 영향 없음).
+        빈 텍스트면 PDF_FALLBACK일 때 다음 백엔드로 재시도. masker: 마스킹 규칙 (기본 MASKING_RULES)"""
+        text = ""
+        for backend in _pdf_chain:
+            text = PDFParser._extract_with(backend, pdf_bytes, early_exit, masker)
+            if text.strip(): break
+        return text
+
+    @staticmethod
+    def _extract_with(backend: PdfBackend, pdf_bytes: bytes, early_exit: bool, masker: Optional[MaskingEngine]=None) -> str:
+        try:
+            doc = backend.open(pdf_bytes)
+            try:
+                n = doc.page_count
+                if MAX_PDF_PAGES and n > MAX_PDF_PAGES: raise ExtractionLimit(f"{n}쪽 — 한도 {MAX_PDF_PAGES}쪽 초과")
+                texts = []; total = 0
+                for i in range(n):
+                    t = doc.page_text(i); total += len(t)
+                    if MAX_TEXT_CHARS and total > MAX_TEXT_CHARS: raise ExtractionLimit(f"추출 텍스트 {MAX_TEXT_CHARS:,}자 초과")
+                    texts.append(t)
+                    if i == 0 and early_exit and n > 1 and "eligibility" in DOC_KEYWORDS.scan(t): break
+            finally: doc.close()
+            return (masker or _masker).mask("\n".join(texts))
+        except ExtractionLimit: raise
+        except MemoryError: raise ExtractionLimit("메모리 부족")
+        except Exception as e:
+            logger.warning(f"PDF 추출 실패 ({backend.name}): {e}"); return ""
+
+    @staticmethod
+    def extract_text_cached(pdf_bytes: bytes, masker: Optional[MaskingEngine]=None) -> Tuple[str, bool]:
+        """(텍스트, 캐시 적중) — 빈 결과는 일시 오류일 수 있어 저장하지 않음"""
+        if not _extract_cache.enabled: return _extract_guarded(pdf_bytes, masker), False
+        key=_extract_cache.key(pdf_bytes, (masker or _masker).fingerprint); hit=_extract_cache.get(key)
+        if hit is not None: return hit, True
+        text=_extract_guarded(pdf_bytes, masker)
+        if text: _extract_cache.put(key, text)
+        return text, False
+
+    @staticmethod
+    @_timed("classify", len, "chars")
+    def classify(text: str) -> str:
+        hits=DOC_KEYWORDS.scan(text)
+        if "eligibility" in hits: return "eligibility"
+        if "enrollment" in hits:  return "enrollment"
+        if "transcript" in hits:  return "transcript"
+        if hits & {"cert","volunteer","military"}: return "bonus"
+        return "unknown"
+
+    @classmethod
+    @_timed("extract_name", len, "chars", arg=1)
+    def extract_name(cls, text: str) -> Optional[str]:
+        for m in _iter_searches(cls.NAME_PATTERNS, text): return m.group(1).strip()
+        return None
+
+    @classmethod
+    @_timed("extract_grade", len, "chars", arg=1)
+    def extract_grade(cls, text: str) -> Optional[int]:
+        for m in _iter_searches(cls.GRADE_PATTERNS, text):
+            g=int(m.group(1))
+            if 1<=g<=4: return g
+        return None
+
+    @classmethod
+    @_timed("extract_major", len, "chars", arg=1)
+    def extract_major(cls, text: str) -> Optional[str]:
+        for m in _iter_searches(cls.MAJOR_PATTERNS, text):
+            v=_WS_RE.sub(" ",m.group(1)).strip()
+            if 2<=len(v)<=40: return v
+        return None
+
+    @classmethod
+    @_timed("extract_credits", len, "chars", arg=1)
+    def extract_credits(cls, text: str) -> Tuple[Optional[float], Optional[float]]:
+        """(이수학점, 졸업기준학점)"""
+        grad=next((float(m.group(1)) for m in _iter_searches(cls.GRAD_CREDIT_PATTERNS, text)), None)
+        comp=next((float(m.group(1)) for m in _iter_searches(cls.COMP_CREDIT_PATTERNS, text)), None)
+        return comp, grad
+
+    @classmethod
+    @_timed("extract_gpa", len, "chars", arg=1)
+    def extract_gpa(cls, text: str) -> Optional[float]:
+        for m in _iter_searches(cls.GPA_PATTERNS, text):
+            v=float(m.group(1))
+            if 0.0<=v<=4.5: return v
+        return None
+
+    @staticmethod
+    @_timed("check_certificate", len, "chars")
+    def check_certificate(text: str) -> bool:
+        if "cert" in DOC_KEYWORDS.scan(text): return True
+        low=text.lower()   # 한글 키워드는 대소문자가 없으므로 영문만 재확인
+        return any(k in low for k in _CERT_CASED_LOWER)
+
+    @classmethod
+    @_timed("extract_volunteer_hours", len, "chars", arg=1)
+    def extract_volunteer_hours(cls, text: str) -> float:
+        for ms in _iter_findall(cls.VOLUNTEER_PATTERNS, text):
+            h=max(float(x) for x in ms)
+            if 0<h<10000: return h
+        return 0.0
+
+    @staticmethod
+    @_timed("check_military", len, "chars")
+    def check_military(text: str) -> bool:
+        return "military" in DOC_KEYWORDS.scan(text)
+
+    @staticmethod
+    @_timed("extract_max_grade", len, "chars")
+    def extract_max_grade(text: str) -> Optional[int]:
+        """2·3·4년제 감지 — 4단계 우선순위로 판별"""
+        # ① 수업연한 명시 (가장 확실)
+        for m in _iter_searches(MAX_GRADE_PATTERNS, text):
+            return int(m.group(1))
+        # ② 학교명에 '전문대학' 포함 여부 ('전문대학교'는 4년제이므로 제외)
+        if "전문대학" in text and _JUNIOR_COLLEGE_RE.search(text):
+            if _THREE_YEAR_RE.search(text):
+                return 3
+            return 2
+        # ③ 학위 종류 (전문학사 = 2·3년제)
+        if "전문학사" in text:
+            return 2
+        # ④ '대학교' 명시이면 4년제 확정
+        if "대학교" in text and _UNIVERSITY_RE.search(text):
+            return 4
+        return None
+
+    @staticmethod
+    @_timed("extract_region", len, "chars")
+    def extract_region(text: str) -> Optional[str]:
+        for m in _iter_searches(REGION_PATTERNS, text):
+            addr = m.group(1).strip()
+            for region, keywords in REGION_MAP.items():
+                if any(kw in addr for kw in keywords):
+                    return region
+        return None
+
+# ──────────────────────────────────────────────────────────────────────
+# 점수 계산 엔진
+# ──────────────────────────────────────────────────────────────────────
+class ScoringEngine:
+    @staticmethod
+    @_timed("calculate")
+    def calculate(a: ApplicantData) -> ApplicantData:
+        # 학년 점수: (현재학년 ÷ 학제총학년) × 50 — 2·3·4년제 정규화
+        if a.grade > 0 and a.max_grade > 0:
+            a.grade_score = round((a.grade / a.max_grade) * 50, 2)
+        else:
+            a.grade_score = 0.0
+        if a.graduation_credits > 0:
+            rate = min(a.completed_credits / a.graduation_credits, 1.0)
+            a.completion_rate = rate; a.completion_score = round(rate*50, 2)
+        bonus = 0
+        a.bonus_cert      = a.has_certificate
+        a.bonus_volunteer = a.volunteer_hours >= 50.0
+        if a.bonus_cert:      bonus += 3
+        if a.bonus_volunteer: bonus += 2
+        a.bonus_score = float(min(bonus, 5))
+        a.total_score = round(a.grade_score + a.completion_score + a.bonus_score, 2)
+        return a
+
+# ──────────────────────────────────────────────────────────────────────
+# 격리 추출 — PDF 1건씩 하위 프로세스에서 PDFParser.extract_text 실행.
+# 시간 한도를 넘기면 프로세스를 종료하고 다음 PDF에서 새로 띄움 → 비정상 PDF 1건이 요청 전체를 붙잡지 않음.
+# 스레드마다 하위 프로세스 1개 (동시 요청·작업 간 파이프 공유 없음), 스레드 종료 시 정리
+# ──────────────────────────────────────────────────────────────────────
+def _mp_context() -> multiprocessing.context.BaseContext:
+    """하위 프로세스 시작 방식 — forkserver(코어·백엔드 미리 임포트), 미지원 플랫폼은 spawn. fork는 쓰지 않음:
+    요청·세션 스레드가 도는 부모를 fork하면 다른 스레드가 잡은 잠금이 자식에 잠긴 채 복사될 수 있고,
+    Streamlit의 __main__(app.py)은 자식에서 다시 임포트되지 않으므로 워커 함수는 이 모듈에 둠"""
+    method="forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    ctx=multiprocessing.get_context(method)
+    if method=="forkserver": ctx.set_forkserver_preload(["hanyang_core"]+[b.module for b in _pdf_chain])
+    return ctx
+
+def _limit_memory(mem_bytes: int) -> None:
+    """현재(하위) 프로세스 주소 공간을 시작 시 크기(미리 임포트한 코어·백엔드 포함) + mem_bytes로 제한 — 넘는 할당은 MemoryError (Linux)"""
+    if not mem_bytes: return
+    try:
+        import resource
+        with open("/proc/self/statm") as f: vm=int(f.read().split()[0])*os.sysconf("SC_PAGE_SIZE")
+        resource.setrlimit(resource.RLIMIT_AS, (vm+mem_bytes, vm+mem_bytes))
+    except (ImportError, OSError, ValueError): pass
+
+def _guard_main(conn, mem_bytes: int) -> None:
+    """하위 프로세스 루프: (PDF 바이트, early_exit, 마스킹 규칙) 수신 → ("ok", 텍스트) | ("limit"·"err", 사유) 송신"""
+    _limit_memory(mem_bytes)
+    while True:
+        try: pdf_bytes, early_exit, masker = conn.recv()
+        except (EOFError, OSError): return
+        try: conn.send(("ok", PDFParser.extract_text(pdf_bytes, early_exit, masker)))
+        except ExtractionLimit as e: conn.send(("limit", str(e)))
+        except MemoryError: conn.send(("limit", "메모리 한도 초과"))
+        except Exception as e: conn.send(("err", str(e)))
+
+class ExtractionGuard:
+    def __init__(self, timeout: float, mem_bytes: int):
+        self.timeout=timeout; self.mem_bytes=mem_bytes; self._proc=None; self._conn=None
+        self._pid=os.getpid()   # fork된 하위 프로세스에 복사된 다른 스레드의 객체는 정리 대상 아님
+
+    def extract(self, pdf_bytes: bytes, early_exit: bool, masker: Optional[MaskingEngine]=None) -> str:
+        if self._proc is None or not self._proc.is_alive(): self._start()
+        try:
+            self._conn.send((pdf_bytes, early_exit, masker))
+            if not self._conn.poll(self.timeout):
+                self.close(); raise ExtractionLimit(f"처리 시간 {self.timeout:g}초 초과")
+            status, value = self._conn.recv()
+        except (EOFError, OSError, BrokenPipeError):
+            self.close(); raise ExtractionLimit("추출 프로세스 비정상 종료 (메모리 한도 초과 추정)")
+        if status=="limit": raise ExtractionLimit(value.removeprefix("건너뜀 — "))
+        if status=="err": logger.warning(f"PDF 추출 실패: {value}"); return ""
+        return value
+
+    def _start(self) -> None:
+        self.close()
+        ctx=_mp_context()   # 요청·세션 스레드가 도는 부모를 fork하지 않음 (워커 풀과 같은 시작 방식)
+        self._conn, child = ctx.Pipe()
+        self._proc=ctx.Process(target=_guard_main, args=(child, self.mem_bytes), daemon=True, name="hanyang-pdf-guard")
+        self._proc.start(); child.close()
+
+    def close(self) -> None:
+        if self._conn is not None: self._conn.close(); self._conn=None
+        if self._proc is not None:
+            if os.getpid()!=self._pid: self._proc=None; return
+            if self._proc.is_alive(): self._proc.kill()
+            self._proc.join(1); self._proc=None
+
+    def __del__(self): self.close()
+
+_guard_local = threading.local()
+
+_in_pool_worker = False   # 추출 풀 워커에서 True (_warm_worker) — 시간·메모리 한도는 풀이 적용
+
+def _extract_guarded(pdf_bytes: bytes, masker: Optional[MaskingEngine]=None) -> str:
+    """PDF_TIMEOUT_SEC>0 이면 격리 추출. 풀 워커는 이미 격리된 프로세스라 직접 추출 (시간 한도는 ExtractionPool이 적용),
+    데몬 프로세스 안에서는 하위 프로세스를 만들 수 없어 직접 추출"""
+    if PDF_TIMEOUT_SEC<=0 or _in_pool_worker or multiprocessing.current_process().daemon:
+        return PDFParser.extract_text(pdf_bytes, EARLY_EXIT_EXTRACT, masker)
+    return _extract_isolated(pdf_bytes, masker)
+
+@_timed("extract_text", len)
+def _extract_isolated(pdf_bytes: bytes, masker: Optional[MaskingEngine]=None) -> str:
+    """하위 프로세스의 계측은 부모 수집기에 없으므로 여기서 같은 단계명으로 기록"""
+    guard=getattr(_guard_local, "guard", None)
+    if guard is None: guard=_guard_local.guard=ExtractionGuard(PDF_TIMEOUT_SEC, PDF_MEM_BYTES)
+    return guard.extract(pdf_bytes, EARLY_EXIT_EXTRACT, masker)
+
+# ──────────────────────────────────────────────────────────────────────
+# ZIP 처리기
+# ──────────────────────────────────────────────────────────────────────
+# 진행 상황 콜백: (단계, 완료 파일 수, 전체 파일 수)
+ProgressFn = Callable[[str, int, int], None]
+# 처리 이벤트 콜백: (종류, 내용) — "file" 파일 1건 병합, "applicant" 신청자 1명 점수 확정, "warning" 확정 시점의 비고
+EventFn = Callable[[str, Dict[str, Any]], None]
+
+# ──────────────────────────────────────────────────────────────────────
+# ZIP 읽기
+# ──────────────────────────────────────────────────────────────────────
+def _open_zip(src: Union[bytes, str]) -> zipfile.ZipFile:
+    """ZIP 바이트 또는 스풀된 임시 파일 경로"""
+    return zipfile.ZipFile(io.BytesIO(src) if isinstance(src, (bytes, bytearray)) else src)
+
+def _spool_upload(stream) -> str:
+    """업로드를 임시 파일로 스풀 (1MB 청크) — 최대 메모리를 가장 큰 PDF 1건으로 제한"""
+    fd, path = tempfile.mkstemp(prefix="hanyang_", suffix=".zip")
+    with os.fdopen(fd, "wb") as out: shutil.copyfileobj(stream, out, 1024*1024)
+    return path
+
+def _read_entry(zf: zipfile.ZipFile, fp: str) -> bytes:
+    """ZIP 항목 1건 읽기 — 크기 한도는 압축 해제 전에 헤더로 확인"""
+    size=zf.getinfo(fp).file_size
+    if MAX_PDF_BYTES and size>MAX_PDF_BYTES:
+        raise ExtractionLimit(f"파일 크기 {size/1048576:.1f}MB — 한도 {MAX_PDF_BYTES//1048576}MB 초과")
+    return zf.read(fp)
+
+def _extract_bytes(pdf_bytes: bytes, masker: Optional[MaskingEngine]=None) -> Tuple[str, str, bool]:
+    """PDF 1건: 텍스트 추출(캐시) → 분류"""
+    text, hit = PDFParser.extract_text_cached(pdf_bytes, masker)
+    return text, (PDFParser.classify(text) if text.strip() else ""), hit
+
+def _extract_entry(zf: zipfile.ZipFile, fp: str, masker: Optional[MaskingEngine]=None) -> Tuple[str, str, bool]:
+    return _extract_bytes(_read_entry(zf, fp), masker)
+
+# ──────────────────────────────────────────────────────────────────────
+# 추출 워커 풀 — 프로세스 전역, 요청 사이에 재사용 (워커 기동·백엔드 임포트·정규식 컴파일은 워커마다 1회)
+# 워커는 ZIP을 열지 않고 부모가 읽은 PDF 바이트만 받음 → 요청별 상태·임시 파일 핸들 없음.
+# 요청 스레드가 도는 서버에서 fork하지 않도록 forkserver(미지원 플랫폼은 spawn) — forkserver에 코어·백엔드를 미리 임포트해
+# 워커 기동(비정상 종료 후 재기동 포함)은 fork 1회 비용.
+# 격리 추출을 켜면(PDF_TIMEOUT_SEC>0) 워커 안에서 격리 프로세스를 또 띄우지 않고 워커 자체에 메모리 한도를 걸며,
+# 시간 한도는 부모가 결과를 기다리며 적용 — 넘긴 PDF는 건너뛰고 멈춘 워커째 풀을 폐기, 남은 제출은 새 풀로
+# ──────────────────────────────────────────────────────────────────────
+def _warm_worker() -> None:
+    """워커 초기화 — 격리 표시·메모리 한도, PDF 백엔드 임포트, 마스킹·분류 정규식 첫 실행 (표 컴파일은 모듈 임포트 때 완료)"""
+    global _in_pool_worker
+    _in_pool_worker=True
+    if PDF_TIMEOUT_SEC>0: _limit_memory(PDF_MEM_BYTES)
+    for b in _pdf_chain: importlib.import_module(b.module)
+    PDFParser.classify(mask_sensitive("자립지원 대상자 확인서 재학증명서 성적증명서 900101-1234567"))
+
+def _worker_ready(_: int) -> int:
+    time.sleep(0.05)   # 작업이 워커마다 하나씩 돌아가도록 잠시 점유
+    return os.getpid()
+
+def _extract_pooled(fp: str, pdf_bytes: bytes, masker: Optional[MaskingEngine]) -> Tuple[str, str, str, Optional[str], bool, Timings]:
+    """워커: PDF 1건 추출·분류 — 마지막 요소는 이 파일의 계측 기록 (부모 프로세스의 요청 수집기에 합산)"""
+    t=_timings_local.t=Timings()
+    try:
+        text, dt, hit = _extract_bytes(pdf_bytes, masker); return fp, text, dt, None, hit, t
+    except Exception as e:
+        return fp, "", "", str(e), False, t
+
+class ExtractionPool:
+    """워커 workers개를 처음 쓸 때(또는 warm()) 기동해 프로세스가 끝날 때까지 재사용.
+    queue_depth: 모든 요청을 합쳐 제출했지만 아직 소비하지 않은 PDF 수 한도 — 메모리 상한 ≈ 한도 × PDF 크기"""
+    def __init__(self, workers: int, queue_depth: int=0):
+        self.workers=workers; self.queue_depth=queue_depth or workers*4
+        self._slots=threading.BoundedSemaphore(self.queue_depth)
+        self._lock=threading.Lock(); self._pool: Optional[ProcessPoolExecutor]=None; self.started=0
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool=ProcessPoolExecutor(self.workers, mp_context=_mp_context(), initializer=_warm_worker); self.started+=1
+            return self._pool
+
+    def _discard(self, pool: ProcessPoolExecutor, kill: bool=False) -> None:
+        """비정상 종료·시간 초과 풀 폐기 — 다음 제출이 새로 기동. kill: 실행 중인 워커도 강제 종료
+        (이 풀에 제출한 다른 요청은 BrokenProcessPool → 남은 파일 순차 처리)"""
+        with self._lock:
+            if self._pool is pool: self._pool=None
+        if kill:
+            for proc in list((pool._processes or {}).values()): proc.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _result(fut: Future) -> Tuple:
+        """워커 결과 — PDF_TIMEOUT_SEC>0 이면 실행 시작 후 한도 안에 끝나지 않을 때 ExtractionLimit.
+        실행 시작은 워커 호출 대기열에 넘겨진 시점이라 앞 작업 1건만큼(최대 한도의 약 2배) 더 기다릴 수 있음"""
+        if PDF_TIMEOUT_SEC<=0: return fut.result()
+        deadline=None
+        while True:
+            if deadline is None and fut.running(): deadline=time.monotonic()+PDF_TIMEOUT_SEC
+            try: return fut.result(timeout=0.05 if deadline is None else max(deadline-time.monotonic(), 0))
+            except FutureTimeout:
+                if deadline is not None and time.monotonic()>=deadline: raise ExtractionLimit(f"처리 시간 {PDF_TIMEOUT_SEC:g}초 초과")
+
+    def warm(self) -> None:
+        """워커 전부를 기동·초기화한 뒤 돌아옴 — 앱 시작 때 호출하면 첫 분석도 기동 비용 없음"""
+        t0=time.perf_counter(); pids=set(self._executor().map(_worker_ready, range(self.workers)))
+        logger.info(f"추출 워커 풀 준비 — 워커 {len(pids)}개, 대기열 {self.queue_depth}건 ({time.perf_counter()-t0:.2f}초)")
+
+    def status(self) -> Dict[str, Any]:
+        return {"workers":self.workers,"queue_depth":self.queue_depth,"running":self._pool is not None,"starts":self.started}
+
+    def extract(self, zf: zipfile.ZipFile, pdfs: List[str], masker: Optional[MaskingEngine]=None):
+        """(경로, 텍스트, 서류종류, 오류, 캐시적중)을 ZIP 순서대로 생성. 부모가 항목을 읽어 제출하고, 대기열이 차면
+        자기 요청의 가장 앞 결과를 소비해 자리를 비움 (다른 요청이 대기열을 채웠으면 자리가 날 때까지 대기)"""
+        pool=self._executor(); cur=_current_timings()
+        # (Future, 경로, PDF 바이트)는 대기열 1자리 점유 — 바이트는 시간 초과로 풀을 바꿀 때 재제출용. 그 밖의 튜플은 읽기 실패(즉시 결과)
+        pending: "deque[Tuple]"=deque()
+        submitted=lambda p: isinstance(p[0], Future)
+        def take() -> Tuple:
+            nonlocal pool
+            head=pending.popleft()
+            if not submitted(head): return head
+            try: *item, t = self._result(head[0])
+            except ExtractionLimit as e:   # 시간 초과 — 멈춘 워커째 풀 폐기, 끝나지 않은 제출은 새 풀로
+                self._discard(pool, kill=True); pool=self._executor()
+                for i in range(len(pending)):
+                    if not submitted(pending[i]): continue
+                    fut, fp, data = pending[i]
+                    if not fut.done() or fut.cancelled() or fut.exception() is not None:
+                        pending[i]=(pool.submit(_extract_pooled, fp, data, masker), fp, data)
+                return head[1], "", "", str(e), False
+            finally: self._slots.release()
+            if cur is not None: cur.merge(t)
+            return tuple(item)
+        try:
+            for fp in pdfs:
+                while not self._slots.acquire(blocking=False):
+                    if any(submitted(p) for p in pending): yield take()
+                    else: self._slots.acquire(); break
+                try: data=_read_entry(zf, fp)
+                except Exception as e:
+                    self._slots.release(); pending.append((fp, "", "", str(e), False)); continue
+                pending.append((pool.submit(_extract_pooled, fp, data, masker), fp, data))
+                while pending and (not submitted(pending[0]) or pending[0][0].done()): yield take()
+            while pending: yield take()
+        except BrokenProcessPool:
+            self._discard(pool); raise
+        finally:
+            for p in pending:   # 중단(예외·클라이언트 연결 끊김) 시 남은 제출 취소, 자리 반납
+                if submitted(p): p[0].cancel(); self._slots.release()
+
+_extract_pools: Dict[int, ExtractionPool] = {}
+_extract_pools_lock = threading.Lock()
+
+def extraction_pool(workers: int=EXTRACT_WORKERS) -> ExtractionPool:
+    """워커 수별 프로세스 전역 풀 (기본 HANYANG_EXTRACT_WORKERS) — 기동은 첫 추출 또는 warm() 때"""
+    with _extract_pools_lock:
+        pool=_extract_pools.get(workers)
+        if pool is None: pool=_extract_pools[workers]=ExtractionPool(workers, EXTRACT_QUEUE)
+        return pool
+
+@_timed("dedup")
+def _find_duplicates(zf: zipfile.ZipFile, pdfs: List[str]) -> Dict[str, str]:
+    """내용이 같은 PDF → {뒤에 나온 경로: 처음 나온 경로}. ZIP 헤더의 CRC32·크기가 겹치는 항목만 읽어 SHA-256으로 확인
+    (대부분 고유한 항목은 읽지 않음). 읽기 실패 항목은 고유로 취급 — 추출 단계에서 오류로 기록됨"""
+    groups: Dict[Tuple[int,int], List[str]]={}
+    for fp in pdfs:
+        info=zf.getinfo(fp); groups.setdefault((info.CRC,info.file_size), []).append(fp)
+    dup: Dict[str,str]={}
+    for fps in groups.values():
+        if len(fps)<2 or (MAX_PDF_BYTES and zf.getinfo(fps[0]).file_size>MAX_PDF_BYTES): continue   # 한도 초과는 어차피 건너뜀
+        first: Dict[bytes,str]={}
+        for fp in fps:
+            try: h=hashlib.sha256(zf.read(fp)).digest()
+            except Exception: continue
+            if h in first: dup[fp]=first[h]
+            else: first[h]=fp
+    return dup
+
+class DocumentProcessor:
+    """ZIP → 신청자별 ApplicantData. 신청자 레코드·필드 해석기·마스킹 규칙은 클래스 속성 — app.py는 하위 클래스에서 교체"""
+    record: Callable[..., Any] = ApplicantData
+    resolver: Callable[[Any], "FieldResolver"] = None   # 정의 후 FieldResolver로 설정
+    masker: Optional[MaskingEngine] = None              # None = MASKING_RULES
+
+    def __init__(self, workers: Optional[int]=None):
+        self._p=PDFParser(); self._s=ScoringEngine()
+        self._workers = EXTRACT_WORKERS if workers is None else workers
+
+    def process(self, src: Union[bytes, str], progress: Optional[ProgressFn]=None,
+                events: Optional[EventFn]=None) -> List[ApplicantData]:
+        """src: ZIP 바이트 또는 _spool_upload() 임시 파일 경로 (PDF를 한 건씩 읽음)
+        progress(단계, 완료 파일 수, 전체 파일 수): PDF 1건 병합마다, 점수 계산 시작 시 호출
+        events(종류, 내용): 파일 병합·신청자 점수 확정마다 호출 (EventFn) — 스트리밍 응답용"""
+        applicants: Dict[str, ApplicantData] = {}; hits = misses = 0
+        resolvers: Dict[str, FieldResolver] = {}   # 신청자 키 → 서류 원문, 점수 확정 시 해제
+        with _open_zip(src) as zf:
+            pdfs = [fp for fp in zf.namelist() if fp.lower().endswith(".pdf") and "__MACOSX" not in fp]
+            if progress: progress("extract", 0, len(pdfs))
+            # 내용이 같은 PDF는 처음 나온 1건만 추출하고 결과(텍스트·분류)를 공유
+            dup=_find_duplicates(zf, pdfs); pending=Counter(dup.values())
+            shared: Dict[str, Tuple[str,str,Optional[str]]]={}
+            keys=[self._key(fp) for fp in pdfs]; finish=self._finish_points(pdfs, keys, dup)
+            extracted=self._extract_all(zf, [fp for fp in pdfs if fp not in dup])
+            # 병합은 항상 ZIP 내 순서 → 순차/병렬 결과(원문 순서, 순위) 동일
+            for done, (fp, key) in enumerate(zip(pdfs, keys), 1):
+                orig=dup.get(fp)
+                if orig is None:
+                    _, text, dt, err, hit = next(extracted)
+                    if err is None: hits += hit; misses += not hit
+                    if fp in pending: shared[fp]=(text, dt, err)
+                else:
+                    text, dt, err = shared[orig]; pending[orig]-=1
+                    if not pending[orig]: del shared[orig]
+                self._merge(applicants, resolvers, key, fp, text, dt, err)
+                if orig is not None: self._note_duplicate(applicants, fp, orig)
+                if events: events("file", {"path":fp,"applicant":key,"doc_type":dt,"error":err,"done":done,"total":len(pdfs)})
+                for k in finish.get(done-1, ()): self._finish(applicants[k], resolvers.pop(k, None), events)
+                if progress: progress("extract", done, len(pdfs))
+            if progress: progress("score", len(pdfs), len(pdfs))
+        if _extract_cache.enabled: logger.info(f"추출 캐시 — 적중 {hits}건 / 미스 {misses}건")
+        if dup: logger.info(f"중복 PDF — {len(dup)}건 추출 생략 (같은 내용 {len(pending)}종)")
+        return list(applicants.values())
+
+    @staticmethod
+    def _finish_points(pdfs: List[str], keys: List[str], dup: Dict[str, str]) -> Dict[int, List[str]]:
+        """파일 위치 → 그 파일 병합 직후 점수를 확정할 신청자 키 목록. 신청자의 마지막 서류, 또는 다른 신청자가 낸
+        사본(원본 신청자 비고에 덧붙임) 중 더 뒤의 위치 — 이후로는 그 신청자를 건드리는 파일이 없음"""
+        last: Dict[str, int]={}
+        for i, (fp, key) in enumerate(zip(pdfs, keys)):
+            last[key]=i
+            if fp in dup: last[DocumentProcessor._key(dup[fp])]=i
+        points: Dict[int, List[str]]={}
+        for key, i in last.items(): points.setdefault(i, []).append(key)
+        return points
+
+    def _finish(self, a: ApplicantData, r: Optional["FieldResolver"], events: Optional[EventFn]) -> None:
+        """필드 해석 → 자격 표시 → 점수 계산 (신청자마다 독립 → 처리 순서와 무관하게 결과 동일). 서류 원문은 여기서 해제"""
+        if r is not None: r.resolve()
+        if not a.is_eligible: a.parse_notes.insert(0,"⛔ 자립지원 대상자 확인서 미확인 — 제외")
+        self._s.calculate(a)
+        if events:
+            events("applicant", {"applicant":_applicant_record(a),"eligible":a.is_eligible})
+            if a.parse_notes: events("warning", {"name":a.name,"note":" | ".join(a.parse_notes)})
+
+    def _extract_all(self, zf: zipfile.ZipFile, pdfs: List[str]):
+        """(경로, 텍스트, 서류종류, 오류, 캐시적중)을 ZIP 순서대로 생성 — 워커 2개 이상이면 전역 추출 풀(extraction_pool)에
+        제출, 풀 사용 불가 시 남은 파일 순차 처리"""
+        if self._workers > 1 and len(pdfs) >= PARALLEL_MIN_FILES:
+            done = 0
+            try:
+                for item in extraction_pool(self._workers).extract(zf, pdfs, self.masker):
+                    done += 1; yield item
+                return
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                logger.warning(f"병렬 추출 불가 — 순차 처리: {e}"); pdfs = pdfs[done:]
+        for fp in pdfs:
+            try:
+                text, dt, hit = _extract_entry(zf, fp, self.masker); yield fp, text, dt, None, hit
+            except Exception as e:
+                yield fp, "", "", str(e), False
+
+    def _merge(self, applicants: Dict[str, ApplicantData], resolvers: Dict[str, "FieldResolver"],
+               key: str, fp: str, text: str, dt: str, err: Optional[str]) -> None:
+        if key not in applicants: applicants[key]=self.record(applicant_key=key,name=key)
+        a = applicants[key]
+        if err is not None: a.parse_notes.append(f"❌ '{fp}': {err}"); return
+        if not text.strip(): a.parse_notes.append(f"⚠ '{fp}': 텍스트 추출 불가"); return
+        r=resolvers.get(key) or resolvers.setdefault(key, self.resolver(a))
+        r.add(fp, dt, text)
+
+    def _note_duplicate(self, applicants: Dict[str, ApplicantData], fp: str, orig: str) -> None:
+        """다른 신청자가 같은 파일을 낸 경우 양쪽 비고에 표시 — 사본마다 원본 경로, 원본에는 1회만 (같은 신청자 안의 중복은 표시 안 함)"""
+        key, orig_key = self._key(fp), self._key(orig)
+        if key==orig_key: return
+        applicants[key].parse_notes.append(f"⚠ '{fp}': '{orig}'과(와) 같은 파일 — 다른 신청자 제출본과 중복")
+        note=f"⚠ '{orig}': 다른 신청자도 같은 파일을 제출함"; notes=applicants[orig_key].parse_notes
+        if note not in notes: notes.append(note)
+
+    @staticmethod
+    def _key(fp: str) -> str:
+        parts=fp.replace("\\","/").split("/")
+        if len(parts)>=2: return parts[0].strip()
+        base=os.path.splitext(parts[0])[0]
+        for sep in ("_","-"," "):
+            if sep in base: return base.split(sep)[0].strip()
+        return base.strip()
+
+# ──────────────────────────────────────────────────────────────────────
+# 필드 해석기 — 신청자별 서류를 모아 두었다가 필요한 필드만, 값을 결정하는 서류에서만 추출
+# 결과는 서류를 ZIP 순서대로 하나씩 적용한 것과 같음:
+#   덮어쓰는 값(재학증명서 학년·전공, 성적증명서 학점·평점)은 뒤에서부터 첫 값,
+#   빈 값만 채우는 값(보완 학년·전공·지역)은 앞에서부터 첫 값, 자격증은 하나라도(단락 평가), 봉사시간은 최댓값.
+#   학제는 뒤에서부터 첫 명시 값에서 시작해 이후 성적증명서의 졸업기준학점 추론만 재생.
+# 추출 결과는 서류별로 1회만 계산(메모), 추출 중 예외는 해당 서류 비고로 남기고 값 없음으로 처리
+# ──────────────────────────────────────────────────────────────────────
+# 필드 → 파서 메서드 이름 (FieldResolver.parser에서 찾음)
+_EXTRACTORS: Dict[str, str] = {
+    "region":"extract_region","max_grade":"extract_max_grade","grade":"extract_grade",
+    "major":"extract_major","credits":"extract_credits","gpa":"extract_gpa",
+    "cert":"check_certificate","volunteer":"extract_volunteer_hours","military":"check_military",
+}
+_NO_CREDITS: Tuple[Optional[float], Optional[float]] = (None, None)
+
+class _Doc:
+    __slots__=("fp","dt","text","memo")
+    def __init__(self, fp: str, dt: str, text: str): self.fp=fp; self.dt=dt; self.text=text; self.memo={}
+
+class FieldResolver:
+    """parser: 필드 추출 패턴 표를 가진 PDFParser (하위 클래스), school_fields: 지역·학제도 해석 (이 API 전용 필드),
+    unknown_zero_grad: 미분류 서류의 졸업기준학점 0도 값으로 인정 (app.py 규칙 — 이 API는 0이 아닌 값만)"""
+    parser = PDFParser
+    school_fields = True
+    unknown_zero_grad = False
+
+    def __init__(self, a: ApplicantData):
+        self.a=a; self.docs: List[_Doc]=[]
+
+    def add(self, fp: str, dt: str, text: str) -> None:
+        """서류 1건 등록 — 서류 종류로 정해지는 표시만 즉시 기록, 필드 추출은 resolve()에서"""
+        a=self.a; self.docs.append(_Doc(fp, dt, text))
+        if dt=="eligibility": a.is_eligible=True
+        elif dt=="enrollment": a.has_enrollment=True
+        elif dt=="transcript": a.has_transcript=True
+        elif dt=="bonus": a.has_bonus_doc=True
+
+    def _get(self, d: _Doc, field: str) -> Any:
+        if field not in d.memo:
+            try: d.memo[field]=getattr(self.parser, _EXTRACTORS[field])(d.text)
+            except Exception as e:
+                d.memo[field]=_NO_CREDITS if field=="credits" else None
+                self._note_error(d.fp, e)
+        return d.memo[field]
+
+    def _note_error(self, fp: str, e: Exception) -> None:
+        self.a.parse_notes.append(f"❌ '{fp}': {e}")
+
+    def _last(self, types: Optional[Tuple[str, ...]], get: Callable[[_Doc], Any],
+              ok: Callable[[Any], bool]=bool) -> Tuple[Any, int]:
+        """뒤에서부터 ok(값)인 첫 서류의 (값, 위치) — 없으면 (None, -1). types=None 이면 모든 서류"""
+        for i in range(len(self.docs)-1, -1, -1):
+            d=self.docs[i]
+            if types is None or d.dt in types:
+                v=get(d)
+                if ok(v): return v, i
+        return None, -1
+
+    def _first(self, types: Optional[Tuple[str, ...]], get: Callable[[_Doc], Any], after: int=-1) -> Any:
+        """after 이후 앞에서부터 값이 있는(참) 첫 서류의 값"""
+        return next((v for d in self.docs[after+1:] if (types is None or d.dt in types) and (v:=get(d))), None)
+
+    def resolve(self) -> None:
+        a=self.a; docs=self.docs
+        field=lambda name: (lambda d: self._get(d, name))
+        comp=lambda d: (self._get(d,"credits") or _NO_CREDITS)[0]
+        grad=lambda d: (self._get(d,"credits") or _NO_CREDITS)[1]
+        not_none=lambda v: v is not None
+        # 실명 보정: 서류 종류별(처음 나온 순서) 원문을 이어 붙여 성명 탐색
+        texts: Dict[str, str]={}
+        for d in docs: texts[d.dt]=texts.get(d.dt,"") + "\n" + d.text
+        for text in texts.values():
+            name=self.parser.extract_name(text)
+            if name: a.name=name; break
+        if self.school_fields: a.region=self._first(None, field("region")) or a.region
+        # 학년·전공: 재학증명서(덮어씀) 마지막 값 → 없으면 성적증명서·미분류(빈 값만 채움) 첫 값
+        for name in ("grade","major"):
+            v=self._last(("enrollment",), field(name))[0] or self._first(("transcript","unknown"), field(name))
+            if v: setattr(a, name, v)
+        # 이수학점·평점: 성적증명서 마지막 값(0 포함), 그 값이 0이면 이후 미분류 서류의 첫 값
+        for name, get in (("completed_credits", comp), ("gpa", field("gpa"))):
+            v, i=self._last(("transcript",), get, not_none)
+            if v is not None: setattr(a, name, v)
+            if getattr(a, name)==0:
+                v=self._first(("unknown",), get, i)
+                if v: setattr(a, name, v)
+        # 졸업기준학점: 성적증명서(값 있음)·미분류(0 아님, unknown_zero_grad면 값 있음) 중 마지막 값
+        keep=("transcript","unknown") if self.unknown_zero_grad else ("transcript",)
+        v=self._last(("transcript","unknown"), lambda d: grad(d) if d.dt in keep else (grad(d) or None), not_none)[0]
+        if v is not None: a.graduation_credits=v
+        # 가산점 근거: 자격증·병역은 하나라도, 봉사시간은 최댓값
+        bonus=[d for d in docs if d.dt in ("bonus","unknown")]
+        a.has_certificate=a.has_certificate or any(self._get(d,"cert") for d in bonus)
+        a.volunteer_hours=max([a.volunteer_hours]+[h for d in bonus if (h:=self._get(d,"volunteer") or 0.0)>0])
+        a.is_military=a.is_military or any(self._get(d,"military") for d in bonus)
+        if not self.school_fields: return
+        # 학제: 마지막 명시 서류부터 성적증명서 졸업기준학점 추론 재생 (명시 없으면 처음부터, 기본값에서 시작)
+        mg, i=self._last(None, field("max_grade"), lambda v: v in (2,3,4))
+        mg=mg or a.max_grade
+        for d in docs[max(i,0):]:
+            g=grad(d) if d.dt=="transcript" else None
+            if g is not None and mg==4: mg=2 if g<90 else 3 if g<115 else 4
+        a.max_grade=mg
+
+DocumentProcessor.resolver = FieldResolver
+
+# ──────────────────────────────────────────────────────────────────────
+# 선발 함수
+# ──────────────────────────────────────────────────────────────────────
+def _rank_key(a: ApplicantData) -> Tuple[float, float, int, float]:
+    """총점 ↓ → 이수율 ↓ → 학년 ↓ → GPA ↓ — heapq.nlargest·sorted(reverse) 모두 동점 시 입력 순서 유지"""
+    return (a.total_score, a.completion_rate, a.grade, a.gpa)
+
+def _applicant_record(a: ApplicantData, rank: Optional[int]=None) -> Dict:
+    """결과 표 1행 — 순위 미정(rank=None)은 처리 중 스트리밍용"""
+    return {"성명":a.name,"학년":f"{a.grade}학년" if a.grade>0 else "미확인",
+            "학제":f"{a.max_grade}년제","지역":a.region or "미확인",
+            "전공":a.major or "미확인","이수학점":a.completed_credits,"졸업기준학점":a.graduation_credits,
+            "이수율":round(a.completion_rate*100,1),"GPA":a.gpa,
+            "학년점수":a.grade_score,"이수율점수":a.completion_score,"가산점":a.bonus_score,"총점":a.total_score,
+            "자격증어학":"✓" if a.bonus_cert else "","봉사50h":"✓" if a.bonus_volunteer else "",
+            "자립확인서":"✓" if a.is_eligible else "미확인","재학증명서":"✓" if a.has_enrollment else "미확인","성적증명서":"✓" if a.has_transcript else "미확인",
+            "비고":" | ".join(a.parse_notes) if a.parse_notes else "정상 처리","순위":rank}
+
+def _ranked_records(ranked: List[ApplicantData], first_rank: int=1) -> List[Dict]:
+    return [_applicant_record(a, rank) for rank,a in enumerate(ranked,first_rank)]
+
+class Ranking:
+    """자격자 순위 — 상위 n명(top)은 heapq로 O(M log n), 전체 순위(all)는 처음 요청 시 1회 정렬. len() = 자격자 수.
+    표 형식은 _records·_concat — 기본은 행 dict 목록, app.py는 하위 클래스에서 DataFrame"""
+    def __init__(self, eligible: List[ApplicantData], n: int):
+        self._eligible=eligible; self._n=n
+        self._top=heapq.nlargest(n, eligible, key=_rank_key)
+        self.top=self._records(self._top, 1)
+        self._all=None
+        self._views: Dict[Tuple[str,bool], List[Dict]]={}
+        self._order: Optional[List[ApplicantData]]=None
+
+    def __len__(self) -> int: return len(self._eligible)
+
+    @staticmethod
+    def _records(ranked: List[ApplicantData], first_rank: int) -> Any: return _ranked_records(ranked, first_rank)
+
+    @staticmethod
+    def _concat(top: Any, rest: Any) -> Any: return top+rest
+
+    def top_ranks(self) -> Dict[int,int]:
+        """id(신청자) → 순위, 선발자(상위 n명)만 — 전체 정렬 없이 (결과 DB 저장용)"""
+        return {id(a):i for i,a in enumerate(self._top,1)}
+
+    @property
+    def order(self) -> List[ApplicantData]:
+        """자격자 전체를 순위 순서로 — 처음 요청 시 1회 정렬 (전체 순위표)"""
+        if self._order is None: self._order=sorted(self._eligible, key=_rank_key, reverse=True)
+        return self._order
+
+    @property
+    @_timed("ranking_all")
+    def all(self) -> List[Dict]:
+        if self._all is None:
+            n=len(self._top); self._all=self._concat(self.top, self._records(self.order[n:], n+1))
+        return self._all
+
+    def view(self, sort: str="순위", desc: bool=False) -> List[Dict]:
+        """전체 순위를 sort 열로 정렬한 목록 — (열, 방향)마다 처음 요청 시 1회 정렬. 같은 값은 순위 순서 유지"""
+        key=(sort,desc)
+        if key not in self._views:
+            self._views[key]=self.all if key==("순위",False) else sorted(self.all, key=lambda r: r[sort], reverse=desc)
+        return self._views[key]
+
+@_timed("rank_scholars")
+def rank_scholars(applicants: List[ApplicantData], n: int=MAX_SCHOLARS, excluded: set=None,
+                  cls: Callable[[List[ApplicantData], int], Ranking]=Ranking) -> Ranking:
+    """cls: 순위 표 형식 (Ranking 하위 클래스)"""
+    excluded = excluded or set()
+    for a in applicants:
+        # 같은 신청자 집합을 제외 명단만 바꿔 재선발할 수 있도록 이전 표시는 지우고 다시 기록
+        if EXCLUDED_NOTE in a.parse_notes: a.parse_notes.remove(EXCLUDED_NOTE)
+        if a.name in excluded: a.parse_notes.insert(0, EXCLUDED_NOTE)
+    return cls([a for a in applicants if a.is_eligible and a.name not in excluded], n)
+
+def select_scholars(applicants: List[ApplicantData], n: int=MAX_SCHOLARS, excluded: set=None) -> Tuple[List[Dict],List[Dict]]:
+    r=rank_scholars(applicants,n,excluded)
+    return r.top, r.all
+
+@_timed("build_report")
+def build_report(selected: List[Dict], total: int) -> Dict[str,Any]:
+    if not selected: return {}
+    n=len(selected); scores=[r["총점"] for r in selected]; comp=[r["이수율"] for r in selected]; gpas=[r["GPA"] for r in selected]
+    gd: Dict[str,int]={}
+    for r in selected: gd[r["학년"]]=gd.get(r["학년"],0)+1
+    rd: Dict[str,int]={}
+    for r in selected: rd[r.get("지역","미확인")]=rd.get(r.get("지역","미확인"),0)+1
+    cert=sum(1 for r in selected if r["자격증어학"]=="✓")
+    vol =sum(1 for r in selected if r["봉사50h"]=="✓")
+    return {"total_applicants":total,"selected_count":n,"selection_rate":round(n/total*100,1) if total else 0,
+            "avg_score":round(sum(scores)/n,2),"max_score":round(max(scores),2),"min_score":round(min(scores),2),
+            "avg_completion":round(sum(comp)/n,1),"avg_gpa":round(sum(gpas)/n,2),"grade_dist":gd,"region_dist":rd,
+            "cert_count":cert,"vol_count":vol}
+
+def make_demo_applicants(n: int=30) -> List[ApplicantData]:
+    random.seed(42)
+    names=["김민준","이서연","박도윤","최서현","정예은","강지호","조수아","윤민서","장하은","임준혁","오지원","한소율","신재현","권나연","유태양","배수빈","노현우","심지유","문성민","허다은","서지훈","안채원","남기태","고은서","류민호","전수현","양준서","설아린","마지현","제갈민"]
+    majors=["컴퓨터공학과","전자공학과","기계공학과","국방학과","경영학과","사회복지학과","심리학과","소프트웨어학과","방위산업학과","화학공학과"]
+    demo_regions=["서울","서울","서울","경기","경기","경기","인천","부산","대구","광주","대전","충남","충북","전북","전남","경북","경남","강원","울산","세종","제주","서울","경기","부산","대구","인천","경남","충남","전북","경북"]
+    # 학제 구성: 4년제 22명, 3년제 5명, 2년제 3명
+    demo_max_grades=[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,3,3,3,3,3,2,2,2]
+    results=[]
+    for i in range(n):
+        mg=demo_max_grades[i%len(demo_max_grades)]
+        gc={4:random.choice([120.0,130.0,140.0]),3:random.choice([95.0,105.0]),2:random.choice([65.0,75.0])}[mg]
+        a=ApplicantData(applicant_key=f"demo_{i}",name=names[i%len(names)],grade=random.randint(1,mg),
+            max_grade=mg,major=majors[random.randint(0,len(majors)-1)],
+            completed_credits=round(random.uniform(10,gc),1),graduation_credits=gc,
+            gpa=round(random.uniform(1.5,4.3),2),has_certificate=random.random()>0.5,
+            volunteer_hours=random.choice([0,20,55,80,100]),
+            is_eligible=random.random()>0.1,has_enrollment=True,has_transcript=True,
+            region=demo_regions[i%len(demo_regions)])
+        ScoringEngine.calculate(a); results.append(a)
+    return results
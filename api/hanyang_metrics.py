@@ -0,0 +1,83 @@
+"""
+한영자 희망 장학재단 장학생 선발 시스템 — 단계별 성능 계측 (표준 라이브러리만 사용)
+api/index.py(요청·응답)와 hanyang_core.py(파싱·선발)가 같은 수집기를 공유
+"""
+
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+# 단계별 p50/p95 계산에 쓰는 최근 표본 수 (요청별·누적 각각, 단계마다)
+METRICS_SAMPLES: int = 4096
+
+# ──────────────────────────────────────────────────────────────────────
+# 성능 계측 — 단계별 호출 수·소요 시간(합계·p50·p95)·처리 크기
+# 요청마다 스레드 로컬 수집기에 기록 → 응답의 timings, 요청 종료 시 인스턴스 누적(/api/metrics)에 합산.
+# 수집기가 없는 호출(데모·스크립트)은 측정하지 않음. 병렬 추출 시 추출 단계 합계는 워커 합산이라 경과 시간보다 클 수 있음
+# ──────────────────────────────────────────────────────────────────────
+class StageStats:
+    __slots__=("count","total","size","unit","samples")
+    def __init__(self, unit: str="bytes"):
+        self.count=0; self.total=0.0; self.size=0; self.unit=unit
+        self.samples: deque = deque(maxlen=METRICS_SAMPLES)
+
+    def merge(self, other: "StageStats") -> None:
+        self.count+=other.count; self.total+=other.total; self.size+=other.size
+        self.samples.extend(other.samples)
+
+    def summary(self) -> Dict[str,Any]:
+        s=sorted(self.samples); pick=lambda q: s[min(len(s)-1, int(q*len(s)))]*1000 if s else 0.0
+        out={"count":self.count,"total_ms":round(self.total*1000,3),
+             "p50_ms":round(pick(0.5),3),"p95_ms":round(pick(0.95),3)}
+        if self.size: out[self.unit]=self.size
+        return out
+
+class Timings:
+    """단계명 → StageStats — 처리 크기는 PDF 단계는 bytes, 텍스트 단계는 chars(글자 수)"""
+    def __init__(self):
+        self.stages: Dict[str, StageStats]={}; self.started=time.perf_counter()
+
+    def add(self, name: str, sec: float, size: int=0, unit: str="bytes") -> None:
+        st=self.stages.get(name) or self.stages.setdefault(name, StageStats(unit))
+        st.count+=1; st.total+=sec; st.size+=size; st.samples.append(sec)
+
+    def merge(self, other: "Timings") -> None:
+        for name, st in other.stages.items(): self.stages.setdefault(name, StageStats(st.unit)).merge(st)
+
+    def summary(self) -> Dict[str,Any]:
+        return {"elapsed_ms":round((time.perf_counter()-self.started)*1000,3),
+                "stages":{name: st.summary() for name, st in self.stages.items()}}
+
+_timings_local = threading.local()
+_metrics = Timings(); _metrics_lock = threading.Lock()
+_metrics_info: Dict[str,Any] = {"requests":0,"since":datetime.now().isoformat()}
+
+def _current_timings() -> Optional[Timings]:
+    return getattr(_timings_local, "t", None)
+
+@contextmanager
+def collect_timings():
+    """with 블록 안(같은 스레드)의 계측 호출을 새 Timings에 모으고, 끝나면 누적 지표에 합산"""
+    prev=_current_timings(); t=Timings(); _timings_local.t=t
+    try: yield t
+    finally:
+        _timings_local.t=prev
+        with _metrics_lock: _metrics.merge(t); _metrics_info["requests"]+=1
+
+def _timed(name: str, size: Optional[Callable[..., int]]=None, unit: str="bytes", arg: int=0):
+    """함수 호출 시간을 현재 수집기에 name 단계로 기록 — size(arg번째 인자)는 처리 크기(unit 단위).
+    클래스 메서드는 arg=1 (첫 인자가 cls)"""
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            t=_current_timings()
+            if t is None: return fn(*args, **kwargs)
+            start=time.perf_counter()
+            try: return fn(*args, **kwargs)
+            finally: t.add(name, time.perf_counter()-start, size(args[arg]) if size else 0, unit)
+        return wrapper
+    return deco
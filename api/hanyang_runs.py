@@ -0,0 +1,121 @@
+"""
+한영자 희망 장학재단 장학생 선발 시스템 — 분석 결과 영구 보관 (SQLite, 표준 라이브러리만 사용)
+api/index.py(Flask)와 app.py(Streamlit)가 같은 스키마·같은 파일을 이 모듈 하나로 사용 (runs.source로 구분)
+"""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import asdict, fields
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from hanyang_metrics import _timed
+
+# ──────────────────────────────────────────────────────────────────────
+# 신청자는 전체 필드(점수·비고 포함)를 JSON으로, 성명·지역·선발 여부·선발자 순위는 색인 열로 저장.
+# 순위 열은 선발자(상위 n명)만 — 전체 정렬을 하지 않도록, 전체 순위는 불러올 때 rank_scholars로 다시 계산.
+# 지역을 추출하지 않는 신청자 형식(app.py)은 빈 값. 선발 이력은 양쪽 회차 합산으로 제외 명단 조회
+# ──────────────────────────────────────────────────────────────────────
+_RUN_DB_SCHEMA = """
+PRAGMA journal_mode=WAL;
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY, source TEXT NOT NULL, created TEXT NOT NULL,
+    total INTEGER NOT NULL, eligible INTEGER NOT NULL, selected INTEGER NOT NULL,
+    excluded TEXT NOT NULL DEFAULT '[]');
+CREATE TABLE IF NOT EXISTS applicants (
+    run_id TEXT NOT NULL REFERENCES runs(id) ON DELETE CASCADE, seq INTEGER NOT NULL,
+    name TEXT NOT NULL, region TEXT NOT NULL DEFAULT '', rank INTEGER, selected INTEGER NOT NULL DEFAULT 0,
+    total_score REAL NOT NULL DEFAULT 0, data TEXT NOT NULL, PRIMARY KEY (run_id, seq));
+CREATE INDEX IF NOT EXISTS idx_runs_source_created ON runs(source, created);
+CREATE INDEX IF NOT EXISTS idx_applicants_rank ON applicants(run_id, rank);
+CREATE INDEX IF NOT EXISTS idx_applicants_name ON applicants(name, selected);
+CREATE INDEX IF NOT EXISTS idx_applicants_region ON applicants(run_id, region);
+"""
+
+class RunDB:
+    """runs(회차) + applicants(신청자) — source: 저장·조회·삭제할 회차의 앱 구분 ("api"·"app").
+    연결은 호출마다 열고 닫음 (요청 스레드·Streamlit 재실행 간 공유 없음).
+    폴더는 소유자 전용(0700)으로 만들고, 저장할 때 keep_days보다 오래된 회차(양쪽 앱 모두)를 정리.
+    ranking은 top·top_ranks()·len()을 가진 hanyang_core.Ranking (하위 클래스 포함)"""
+    def __init__(self, path: str, source: str, keep_days: int=0):
+        self.path=path; self.source=source; self.keep_days=keep_days; self._ready=False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready: os.makedirs(os.path.dirname(os.path.abspath(self.path)), mode=0o700, exist_ok=True)
+        conn=sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA foreign_keys=ON")   # 연결마다 설정해야 ON DELETE CASCADE가 동작
+        if not self._ready: conn.executescript(_RUN_DB_SCHEMA); self._ready=True
+        return conn
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        if self.keep_days<=0: return
+        cutoff=datetime.fromtimestamp(time.time()-self.keep_days*86400).isoformat(timespec="seconds")
+        conn.execute("DELETE FROM runs WHERE created<?", (cutoff,))
+
+    @staticmethod
+    def _rows(applicants: List[Any], ranking: Any) -> List[Tuple]:
+        """(seq, 성명, 지역, 순위, 선발 여부, 총점, 전체 필드 JSON) — 순위는 선발자만"""
+        ranks=ranking.top_ranks()
+        return [(seq,a.name,getattr(a,"region",""),ranks.get(id(a)),int(id(a) in ranks),a.total_score,
+                 json.dumps(asdict(a),ensure_ascii=False)) for seq,a in enumerate(applicants)]
+
+    @_timed("run_db")
+    def save(self, rid: str, applicants: List[Any], ranking: Any, excluded: set) -> bool:
+        rows=self._rows(applicants, ranking)
+        with closing(self._connect()) as conn, conn:
+            self._prune(conn)
+            conn.execute("INSERT INTO runs VALUES (?,?,?,?,?,?,?)",
+                         (rid,self.source,datetime.now().isoformat(timespec="seconds"),len(applicants),len(ranking),
+                          len(ranking.top),json.dumps(sorted(excluded),ensure_ascii=False)))
+            conn.executemany("INSERT INTO applicants VALUES (?,?,?,?,?,?,?,?)", [(rid,*r) for r in rows])
+        return True
+
+    @_timed("run_db")
+    def update(self, rid: str, applicants: List[Any], ranking: Any, excluded: set) -> bool:
+        """재선발 결과로 선발자 순위·선발 여부, 제외 여부가 바뀐 신청자의 비고(제외 표시)만 갱신 — 선발 인원 + 변경분만 기록.
+        회차가 없으면 False"""
+        ranks=ranking.top_ranks()
+        with closing(self._connect()) as conn, conn:
+            row=conn.execute("SELECT excluded FROM runs WHERE id=?", (rid,)).fetchone()
+            if row is None: return False
+            changed=set(json.loads(row[0]))^excluded
+            conn.execute("UPDATE runs SET eligible=?, selected=?, excluded=? WHERE id=?",
+                         (len(ranking),len(ranking.top),json.dumps(sorted(excluded),ensure_ascii=False),rid))
+            conn.execute("UPDATE applicants SET rank=NULL, selected=0 WHERE run_id=? AND selected=1", (rid,))
+            conn.executemany("UPDATE applicants SET rank=?, selected=1 WHERE run_id=? AND seq=?",
+                             [(ranks[id(a)],rid,seq) for seq,a in enumerate(applicants) if id(a) in ranks])
+            conn.executemany("UPDATE applicants SET data=? WHERE run_id=? AND seq=?",
+                             [(json.dumps(asdict(a),ensure_ascii=False),rid,seq) for seq,a in enumerate(applicants) if a.name in changed])
+        return True
+
+    @_timed("run_db")
+    def load(self, rid: str, record: type) -> Optional[Tuple[List[Any], set]]:
+        """보관된 회차 → (record 목록, 제외 명단) — record: 신청자 데이터클래스 (앱마다 다름), 저장된 필드 중 record에 있는 것만.
+        점수는 저장된 값 그대로 (재계산 없음) — rank_scholars만 다시 실행하면 저장 당시와 같은 선발 결과"""
+        with closing(self._connect()) as conn:
+            row=conn.execute("SELECT excluded FROM runs WHERE id=? AND source=?", (rid,self.source)).fetchone()
+            if row is None: return None
+            data=conn.execute("SELECT data FROM applicants WHERE run_id=? ORDER BY seq", (rid,)).fetchall()
+        names={f.name for f in fields(record)}
+        return [record(**{k:v for k,v in json.loads(d).items() if k in names}) for (d,) in data], set(json.loads(row[0]))
+
+    @_timed("run_db")
+    def delete(self, rid: str) -> bool:
+        """회차와 신청자 행 삭제 (이 source가 저장한 회차만) — 없으면 False"""
+        with closing(self._connect()) as conn, conn:
+            return conn.execute("DELETE FROM runs WHERE id=? AND source=?", (rid,self.source)).rowcount>0
+
+    def recent(self, limit: int=20) -> List[Dict[str,Any]]:
+        """이 source의 최근 회차 목록 (최신순)"""
+        with closing(self._connect()) as conn:
+            rows=conn.execute("SELECT id, created, total, eligible, selected FROM runs WHERE source=? "
+                              "ORDER BY created DESC LIMIT ?", (self.source,limit)).fetchall()
+        return [{"result_id":r[0],"created":r[1],"total_applicants":r[2],"eligible_count":r[3],"selected_count":r[4]} for r in rows]
+
+    def selected_names(self) -> set:
+        """지금까지 모든 회차(양쪽 앱)에서 선발된 성명 — 이전 선발자 제외 명단"""
+        with closing(self._connect()) as conn:
+            return {n for (n,) in conn.execute("SELECT DISTINCT name FROM applicants WHERE selected=1")}
@@ -24,17 +24,53 @@ import io
 import json
 import os
 import re
-import zipfile
+import sqlite3
+import sys
 import logging
-import tempfile
+import threading
+import uuid
+import zipfile
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # ── 서드파티 라이브러리 ──────────────────────────────────────────────
 import streamlit as st
+import numpy as np
 import pandas as pd
-import fitz  # PyMuPDF
+
+# ── 공용 코어 — api/ 의 PDF 추출·마스킹·캐시·격리·병렬 풀·필드 해석·순위 코드를 함께 쓴다 ──
+_API_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "api")
+if _API_DIR not in sys.path:
+    sys.path.insert(0, _API_DIR)
+
+import hanyang_core as core  # noqa: E402
+# 키워드 표·백엔드·패턴 순회 함수 등은 benchmarks/ 의 --target app 측정용으로도 내보낸다
+from hanyang_core import (  # noqa: E402, F401
+    CERT_KEYWORDS,
+    DOC_ELIGIBILITY_KW,
+    DOC_ENROLLMENT_KW,
+    DOC_TRANSCRIPT_KW,
+    EARLY_EXIT_EXTRACT,
+    EXTRACT_WORKERS,
+    MASKING_RULES as CORE_MASKING_RULES,
+    MAX_SCHOLARS,
+    MILITARY_KEYWORDS,
+    PDF_BACKENDS,
+    VOLUNTEER_KEYWORDS,
+    KeywordMatcher,
+    MaskingEngine,
+    _compile_patterns,
+    _extract_isolated,
+    _iter_findall,
+    _iter_searches,
+    _open_zip,
+    _pdf_chain,
+    _spool_upload,
+    extraction_pool,
+)
+from hanyang_metrics import _timed, collect_timings  # noqa: E402
+from hanyang_runs import RunDB  # noqa: E402
 
 # ──────────────────────────────────────────────────────────────────────
 # 로깅 설정 — 투명성 원칙: 모든 처리 과정을 이력으로 기록
@@ -50,9 +86,16 @@ if not logger.handlers:
     logger.addHandler(_log_handler_buf)
     logger.addHandler(logging.StreamHandler())
 
+# 공용 코어의 처리 로그(추출 실패·캐시 적중 등)도 같은 이력에 기록
+_core_logger = logging.getLogger("hanyang_api")
+_core_logger.setLevel(logging.INFO)
+if not _core_logger.handlers:
+    _core_logger.addHandler(_log_handler_buf)
+    _core_logger.addHandler(logging.StreamHandler())
+
 
 # ──────────────────────────────────────────────────────────────────────
-# 전역 상수
+# 전역 상수 — 서류 분류·가산점 키워드와 처리 설정(HANYANG_* 환경변수)은 공용 코어 값을 쓴다
 # ──────────────────────────────────────────────────────────────────────
 
 # 학년별 기본 점수
@@ -68,42 +111,23 @@ STEM_KEYWORDS: List[str] = [
     "방위산업", "드론", "무기체계", "레이더", "탄약",
 ]
 
-# 국가 자격증 / 어학 성적 키워드 (가산점 +3)
-CERT_KEYWORDS: List[str] = [
-    "국가기술자격", "국가전문자격",
-    "기사", "산업기사", "기능사", "기능장", "기술사",
-    "TOEIC", "TOEFL", "IELTS", "OPIc", "JLPT", "HSK",
-    "토익", "토플", "오픽", "텝스", "TEPS",
-    "자격증", "면허", "어학성적",
-]
-
-# 봉사 활동 관련 키워드
-VOLUNTEER_KEYWORDS: List[str] = ["봉사", "자원봉사", "사회봉사", "봉사활동", "봉사시간"]
-
-# 병역 관련 키워드
-MILITARY_KEYWORDS: List[str] = [
-    "병역", "현역", "예비역", "만기전역", "군필", "복무완료",
-    "전역", "군복무", "병역이행",
-]
-
-# 필수 서류 식별 키워드
-DOC_ELIGIBILITY_KW: List[str] = [
-    "자립지원 대상자 확인서",
-    "자립지원대상자확인서",
-    "자립준비청년 확인서",
-]
-DOC_ENROLLMENT_KW: List[str] = ["재학증명서", "재학 증명서"]
-DOC_TRANSCRIPT_KW: List[str] = ["성적증명서", "성적표", "학업성적", "성적 증명서"]
-
-# 최대 선발 인원
-MAX_SCHOLARS: int = 50
-
 # 졸업 기준 학점 기본값 (학교별 상이하므로 추출 실패 시 사용)
 DEFAULT_GRADUATION_CREDITS: float = 120.0
 
 # 이전 선발자 제외 명단 저장 파일 (중복 선발 방지)
 _EXCLUDED_FILE: str = "excluded_names.json"
 
+# 데이터 폴더 (결과 DB) — 기본은 이 파일 옆의 data/ (api/index.py와 같은 폴더, 실행 위치와 무관)
+DATA_DIR: str = os.path.abspath(
+    os.environ.get("HANYANG_DATA_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+)
+
+# 분석 결과 영구 보관 SQLite 파일 (빈 값이면 비활성) — api/index.py와 같은 파일을 공유
+RUN_DB_PATH: str = os.environ.get("HANYANG_RUN_DB", os.path.join(DATA_DIR, "hanyang_runs.sqlite3"))
+
+# 결과 DB 보관 기간(일) — 저장할 때 이보다 오래된 회차를 삭제 (0 = 기한 없음)
+RUN_DB_KEEP_DAYS: int = int(os.environ.get("HANYANG_RUN_DB_KEEP_DAYS", "365") or 0)
+
 
 def load_excluded_names() -> set:
     """이전 선발 명단을 JSON 파일에서 불러옴"""
@@ -126,9 +150,14 @@ def save_excluded_names(names: set) -> None:
 # ──────────────────────────────────────────────────────────────────────
 # 데이터 클래스 — 신청자 1인의 모든 정보를 저장
 # ──────────────────────────────────────────────────────────────────────
-@dataclass
+@dataclass(slots=True)
 class ApplicantData:
-    """신청자 정보 컨테이너"""
+    """
+    신청자 정보 컨테이너 (__slots__ — 인스턴스별 __dict__ 없음)
+
+    서류 원문은 보관하지 않는다. 원문은 DocumentProcessor.process() 안에서만
+    유지되다가 필드 추출(실명 보정)이 끝나면 해제된다.
+    """
 
     # ─── 식별 정보
     applicant_key: str = ""          # ZIP 내 폴더/파일 기반 식별자
@@ -153,7 +182,6 @@ class ApplicantData:
     has_bonus_doc: bool = False      # 가산점 서류 ✓
 
     # ─── 내부 처리용
-    raw_texts: Dict[str, str] = field(default_factory=dict)   # 서류종류 → 추출 텍스트
     parse_notes: List[str] = field(default_factory=list)       # 파싱 경고·메모
 
     # ─── 점수 계산 결과 (ScoringEngine이 채움)
@@ -170,6 +198,15 @@ class ApplicantData:
 # ──────────────────────────────────────────────────────────────────────
 # 민감 정보 마스킹 — 개인정보보호법 준수
 # ──────────────────────────────────────────────────────────────────────
+
+# 공용 규칙(주민등록번호·휴대전화)에 계좌번호 규칙을 더한다 — 적용 순서 유지
+MASKING_RULES: List[Tuple[str, str]] = CORE_MASKING_RULES + [
+    # 계좌번호 (XXX-XXXXXX-XXXX 형태)
+    (r"(\d{3,4})\s*[-–]\s*(\d{4,6})\s*[-–]\s*(\d{4,7})", r"\1-******-\3"),
+]
+_MASKER = MaskingEngine(MASKING_RULES, min_digits=10)
+
+
 def mask_sensitive_info(text: str) -> str:
     """
     PDF 추출 텍스트에서 개인 식별 정보를 마스킹한다.
@@ -179,210 +216,94 @@ def mask_sensitive_info(text: str) -> str:
       - 전화번호:    010-1234-5678   → 010-****-5678
       - 계좌번호:    XXX-XXXXXX-XXXX → XXX-******-XXXX
     """
-    # 주민등록번호 뒷자리 마스킹
-    text = re.sub(r"(\d{6})\s*[-–]\s*(\d{7})", r"\1-*******", text)
-    text = re.sub(r"(\d{6})(\d{7})", r"\1*******", text)
-
-    # 휴대전화 가운데 4자리 마스킹
-    text = re.sub(r"(01\d)\s*[-–]\s*(\d{3,4})\s*[-–]\s*(\d{4})", r"\1-****-\3", text)
+    return _MASKER.mask(text)
 
-    # 계좌번호 마스킹 (XXX-XXXXXX-XXXX 형태)
-    text = re.sub(r"(\d{3,4})\s*[-–]\s*(\d{4,6})\s*[-–]\s*(\d{4,7})", r"\1-******-\3", text)
 
-    return text
+# 전공명 이공계 판별용 — 전공 문자열은 짧고, 본문 스캔에 넣으면 과목명마다 걸리므로 분리
+STEM_MATCHER = KeywordMatcher({"stem": STEM_KEYWORDS})
 
 
 # ──────────────────────────────────────────────────────────────────────
-# PDF 파서 — PyMuPDF 기반 텍스트 추출 및 필드 파싱
+# 필드 추출 패턴 — 임포트 시 1회 컴파일
+#
+#   각 목록의 순서가 곧 우선순위다. 공용 코어(API)보다 서식 변형을 넓게 인식한다.
+#   필수 리터럴이 없는 문서에서는 정규식 실행 자체를 건너뛴다 (_compile_patterns 참고).
 # ──────────────────────────────────────────────────────────────────────
-class PDFParser:
-    """단일 PDF 파일을 파싱하여 구조화된 데이터를 추출한다."""
-
-    # ── 텍스트 추출 ────────────────────────────────────────
-    @staticmethod
-    def extract_text(pdf_bytes: bytes) -> str:
-        """PDF 바이트 → 마스킹된 텍스트 문자열"""
-        try:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            pages_text = [page.get_text() for page in doc]
-            doc.close()
-            raw = "\n".join(pages_text)
-            return mask_sensitive_info(raw)
-        except Exception as exc:
-            logger.warning(f"PDF 텍스트 추출 실패: {exc}")
-            return ""
-
-    # ── 서류 분류 ───────────────────────────────────────────
-    @staticmethod
-    def classify(text: str) -> str:
-        """
-        텍스트 내 키워드로 서류 종류를 판별.
-
-        반환값: 'eligibility' | 'enrollment' | 'transcript' | 'bonus' | 'unknown'
-        """
-        if any(kw in text for kw in DOC_ELIGIBILITY_KW):
-            return "eligibility"
-        if any(kw in text for kw in DOC_ENROLLMENT_KW):
-            return "enrollment"
-        if any(kw in text for kw in DOC_TRANSCRIPT_KW):
-            return "transcript"
-        # 가산점 서류: 자격증, 봉사, 병역 중 하나라도 포함
-        if (
-            any(kw in text for kw in CERT_KEYWORDS)
-            or any(kw in text for kw in VOLUNTEER_KEYWORDS)
-            or any(kw in text for kw in MILITARY_KEYWORDS)
-        ):
-            return "bonus"
-        return "unknown"
-
-    # ── 이름 추출 ───────────────────────────────────────────
-    @staticmethod
-    def extract_name(text: str) -> Optional[str]:
-        """성명 필드에서 한글 이름 추출"""
-        patterns = [
-            r"성\s*명\s*[：:]\s*([가-힣]{2,5})",
-            r"이\s*름\s*[：:]\s*([가-힣]{2,5})",
-            r"신청인\s*[：:]\s*([가-힣]{2,5})",
-            r"학생명\s*[：:]\s*([가-힣]{2,5})",
-            r"학\s*생\s*[：:]\s*([가-힣]{2,5})",
-            r"^([가-힣]{2,5})\s+학생",
-        ]
-        for ptn in patterns:
-            m = re.search(ptn, text, re.MULTILINE)
-            if m:
-                return m.group(1).strip()
-        return None
-
-    # ── 학년 추출 ───────────────────────────────────────────
-    @staticmethod
-    def extract_grade(text: str) -> Optional[int]:
-        """현재 학년(1~4) 추출"""
-        patterns = [
-            r"([1-4])\s*학년",
-            r"재학\s*학년\s*[：:\s]*([1-4])",
-            r"학\s*년\s*[：:\s]*([1-4])",
-            r"Grade\s*[：:\s]*([1-4])",
-        ]
-        for ptn in patterns:
-            m = re.search(ptn, text)
-            if m:
-                g = int(m.group(1))
-                if 1 <= g <= 4:
-                    return g
-        return None
-
-    # ── 전공 추출 ───────────────────────────────────────────
-    @staticmethod
-    def extract_major(text: str) -> Optional[str]:
-        """학과/전공명 추출"""
-        patterns = [
-            r"전\s*공\s*[：:\s]+([^\n\r\t]{2,30})",
-            r"학\s*과\s*[：:\s]+([^\n\r\t]{2,30})",
-            r"학\s*부\s*[：:\s]+([^\n\r\t]{2,30})",
-            r"소\s*속\s*[：:\s]+([^\n\r\t]{2,30})",
-            r"Department\s*[：:\s]+([^\n\r\t]{2,40})",
-        ]
-        for ptn in patterns:
-            m = re.search(ptn, text)
-            if m:
-                major = re.sub(r"\s+", " ", m.group(1)).strip()
-                # 너무 길거나 짧은 경우 제외
-                if 2 <= len(major) <= 40:
-                    return major
-        return None
-
-    # ── 학점 추출 ───────────────────────────────────────────
-    @staticmethod
-    def extract_credits(text: str) -> Tuple[Optional[float], Optional[float]]:
-        """
-        (이수 학점, 졸업 기준 학점) 추출.
-        추출 실패 시 해당 값은 None.
-        """
-        # ① 졸업 기준 학점
-        grad_patterns = [
-            r"졸업\s*기준\s*학점\s*[：:\s]*(\d+\.?\d*)",
-            r"졸업\s*이수\s*학점\s*[：:\s]*(\d+\.?\d*)",
-            r"총\s*졸업\s*학점\s*[：:\s]*(\d+\.?\d*)",
-            r"졸업\s*학점\s*[：:\s]*(\d+\.?\d*)",
-        ]
-        graduation: Optional[float] = None
-        for ptn in grad_patterns:
-            m = re.search(ptn, text)
-            if m:
-                graduation = float(m.group(1))
-                break
-
-        # ② 현재 이수(취득) 학점
-        comp_patterns = [
-            r"취득\s*학점\s*[：:\s]*(\d+\.?\d*)",
-            r"이수\s*학점\s*[：:\s]*(\d+\.?\d*)",
-            r"현재\s*이수\s*[：:\s]*(\d+\.?\d*)",
-            r"누적\s*학점\s*[：:\s]*(\d+\.?\d*)",
-            r"합\s*계\s*[：:\s]*(\d+\.?\d*)\s*학점",
-            r"취득\s*[：:\s]*(\d+\.?\d*)\s*학점",
-        ]
-        completed: Optional[float] = None
-        for ptn in comp_patterns:
-            m = re.search(ptn, text)
-            if m:
-                completed = float(m.group(1))
-                break
+NAME_PATTERNS = _compile_patterns([
+    r"성\s*명\s*[：:]\s*([가-힣]{2,5})",
+    r"이\s*름\s*[：:]\s*([가-힣]{2,5})",
+    r"신청인\s*[：:]\s*([가-힣]{2,5})",
+    r"학생명\s*[：:]\s*([가-힣]{2,5})",
+    r"학\s*생\s*[：:]\s*([가-힣]{2,5})",
+    r"^([가-힣]{2,5})\s+학생",
+], re.MULTILINE)
+
+GRADE_PATTERNS = _compile_patterns([
+    r"([1-4])\s*학년",
+    r"재학\s*학년\s*[：:\s]*([1-4])",
+    r"학\s*년\s*[：:\s]*([1-4])",
+    r"Grade\s*[：:\s]*([1-4])",
+])
+
+MAJOR_PATTERNS = _compile_patterns([
+    r"전\s*공\s*[：:\s]+([^\n\r\t]{2,30})",
+    r"학\s*과\s*[：:\s]+([^\n\r\t]{2,30})",
+    r"학\s*부\s*[：:\s]+([^\n\r\t]{2,30})",
+    r"소\s*속\s*[：:\s]+([^\n\r\t]{2,30})",
+    r"Department\s*[：:\s]+([^\n\r\t]{2,40})",
+])
+
+GRAD_CREDIT_PATTERNS = _compile_patterns([
+    r"졸업\s*기준\s*학점\s*[：:\s]*(\d+\.?\d*)",
+    r"졸업\s*이수\s*학점\s*[：:\s]*(\d+\.?\d*)",
+    r"총\s*졸업\s*학점\s*[：:\s]*(\d+\.?\d*)",
+    r"졸업\s*학점\s*[：:\s]*(\d+\.?\d*)",
+])
+
+COMP_CREDIT_PATTERNS = _compile_patterns([
+    r"취득\s*학점\s*[：:\s]*(\d+\.?\d*)",
+    r"이수\s*학점\s*[：:\s]*(\d+\.?\d*)",
+    r"현재\s*이수\s*[：:\s]*(\d+\.?\d*)",
+    r"누적\s*학점\s*[：:\s]*(\d+\.?\d*)",
+    r"합\s*계\s*[：:\s]*(\d+\.?\d*)\s*학점",
+    r"취득\s*[：:\s]*(\d+\.?\d*)\s*학점",
+])
+
+GPA_PATTERNS = _compile_patterns([
+    r"전체\s*평점\s*[：:\s]*(\d+\.\d+)",
+    r"누적\s*평점\s*[：:\s]*(\d+\.\d+)",
+    r"평\s*점\s*[：:\s]*(\d+\.\d+)",
+    r"평균\s*[：:\s]*(\d+\.\d+)",
+    r"GPA\s*[：:\s]*(\d+\.\d+)",
+], re.IGNORECASE)
+
+VOLUNTEER_PATTERNS = _compile_patterns([
+    r"봉사\s*시간\s*[：:\s]*(\d+\.?\d*)",
+    r"총\s*봉사\s*[：:\s]*(\d+\.?\d*)\s*시간",
+    r"누적\s*봉사\s*[：:\s]*(\d+\.?\d*)",
+    r"활동\s*시간\s*[：:\s]*(\d+\.?\d*)",
+    r"(\d+\.?\d*)\s*시간",
+])
 
-        return completed, graduation
 
-    # ── GPA 추출 ────────────────────────────────────────────
-    @staticmethod
-    def extract_gpa(text: str) -> Optional[float]:
-        """전체 평점 평균(GPA, 0.0~4.5) 추출"""
-        patterns = [
-            r"전체\s*평점\s*[：:\s]*(\d+\.\d+)",
-            r"누적\s*평점\s*[：:\s]*(\d+\.\d+)",
-            r"평\s*점\s*[：:\s]*(\d+\.\d+)",
-            r"평균\s*[：:\s]*(\d+\.\d+)",
-            r"GPA\s*[：:\s]*(\d+\.\d+)",
-        ]
-        for ptn in patterns:
-            m = re.search(ptn, text, re.IGNORECASE)
-            if m:
-                val = float(m.group(1))
-                # 일반적 GPA 범위(0.0~4.5) 검증
-                if 0.0 <= val <= 4.5:
-                    return val
-        return None
+# ──────────────────────────────────────────────────────────────────────
+# PDF 파서 — 텍스트 추출·서류 분류는 공용 코어, 필드 패턴 표만 이 앱의 것
+# ──────────────────────────────────────────────────────────────────────
+class PDFParser(core.PDFParser):
+    """
+    단일 PDF 파일을 파싱하여 구조화된 데이터를 추출한다.
 
-    # ── 자격증 / 어학 성적 보유 여부 ───────────────────────
-    @staticmethod
-    def check_certificate(text: str) -> bool:
-        """국가 자격증 또는 어학 성적 키워드 존재 여부 확인"""
-        text_lower = text.lower()
-        return any(kw.lower() in text_lower for kw in CERT_KEYWORDS)
+    텍스트 추출(백엔드 선택·한도·마스킹)과 서류 분류, 필드 추출 메서드는
+    hanyang_core.PDFParser 를 그대로 쓰고, 필드 추출 패턴 표만 위의 표로 바꾼다.
+    """
 
-    # ── 봉사 시간 추출 ──────────────────────────────────────
-    @staticmethod
-    def extract_volunteer_hours(text: str) -> float:
-        """봉사 활동 총 시간 추출 (단위: 시간)"""
-        patterns = [
-            r"봉사\s*시간\s*[：:\s]*(\d+\.?\d*)",
-            r"총\s*봉사\s*[：:\s]*(\d+\.?\d*)\s*시간",
-            r"누적\s*봉사\s*[：:\s]*(\d+\.?\d*)",
-            r"활동\s*시간\s*[：:\s]*(\d+\.?\d*)",
-            r"(\d+\.?\d*)\s*시간",
-        ]
-        for ptn in patterns:
-            matches = re.findall(ptn, text)
-            if matches:
-                # 가장 큰 값 = 누적 총 시간
-                hours = max(float(h) for h in matches)
-                # 비정상적으로 큰 값(예: 연도 숫자) 제외
-                if 0 < hours < 10_000:
-                    return hours
-        return 0.0
-
-    # ── 병역 이행 여부 ──────────────────────────────────────
-    @staticmethod
-    def check_military(text: str) -> bool:
-        """병역 이행 완료 키워드 존재 여부 확인"""
-        return any(kw in text for kw in MILITARY_KEYWORDS)
+    NAME_PATTERNS = NAME_PATTERNS
+    GRADE_PATTERNS = GRADE_PATTERNS
+    MAJOR_PATTERNS = MAJOR_PATTERNS
+    GRAD_CREDIT_PATTERNS = GRAD_CREDIT_PATTERNS
+    COMP_CREDIT_PATTERNS = COMP_CREDIT_PATTERNS
+    GPA_PATTERNS = GPA_PATTERNS
+    VOLUNTEER_PATTERNS = VOLUNTEER_PATTERNS
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -392,6 +313,7 @@ class ScoringEngine:
     """ApplicantData를 받아 각 항목별 점수 및 총점을 계산한다."""
 
     @staticmethod
+    @_timed("calculate")
     def calculate(applicant: ApplicantData) -> ApplicantData:
         """
         점수 계산 후 applicant 객체를 갱신하여 반환.
@@ -416,7 +338,7 @@ class ScoringEngine:
         bonus = 0
 
         # 이공계/방산 전공 여부 (+5)
-        applicant.bonus_stem = any(kw in applicant.major for kw in STEM_KEYWORDS)
+        applicant.bonus_stem = "stem" in STEM_MATCHER.scan(applicant.major)
         if applicant.bonus_stem:
             bonus += 5
 
@@ -437,6 +359,98 @@ class ScoringEngine:
             applicant.grade_score + applicant.completion_score + applicant.bonus_score, 2
         )
 
+        ScoringEngine._log_score(applicant)
+        return applicant
+
+    @staticmethod
+    def calculate_batch(
+        grade: np.ndarray,
+        completed_credits: np.ndarray,
+        graduation_credits: np.ndarray,
+        has_certificate: np.ndarray,
+        volunteer_hours: np.ndarray,
+        is_stem: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        calculate()의 벡터화 버전 — 신청자 M명의 열(column) 배열을 받아 점수 열을 반환.
+
+        반환 키: grade_score, completion_rate, completion_score,
+                 bonus_stem, bonus_cert, bonus_volunteer, bonus_score, total_score
+
+        결과는 calculate()와 비트 단위까지 같다. 덧셈·나눗셈 순서를 그대로 따르고,
+        round(x, 2)는 _round2()로 재현한다.
+        """
+        grade = np.asarray(grade, dtype=np.int64)
+        completed = np.asarray(completed_credits, dtype=np.float64)
+        graduation = np.asarray(graduation_credits, dtype=np.float64)
+
+        # ① 학년 점수 — GRADE_SCORES에 없는 학년은 0점
+        grade_score = np.zeros(grade.shape, dtype=np.float64)
+        for g, score in GRADE_SCORES.items():
+            grade_score[grade == g] = float(score)
+
+        # ② 학업 이수율 점수 — 졸업 기준 학점이 0 이하이면 0
+        has_grad = graduation > 0
+        rate = np.minimum(completed / np.where(has_grad, graduation, 1.0), 1.0)
+        completion_rate = np.where(has_grad, rate, 0.0)
+        completion_score = np.where(has_grad, _round2(rate * 50), 0.0)
+
+        # ③ 가산점 — 이공계 +5, 자격증 +3, 봉사 50시간 이상 +2 (10점 한도)
+        bonus_stem = np.asarray(is_stem, dtype=bool)
+        bonus_cert = np.asarray(has_certificate, dtype=bool)
+        bonus_volunteer = np.asarray(volunteer_hours, dtype=np.float64) >= 50.0
+        bonus = 5 * bonus_stem + 3 * bonus_cert + 2 * bonus_volunteer
+        bonus_score = np.minimum(bonus, 10).astype(np.float64)
+
+        total_score = _round2(grade_score + completion_score + bonus_score)
+        return {
+            "grade_score": grade_score,
+            "completion_rate": completion_rate,
+            "completion_score": completion_score,
+            "bonus_stem": bonus_stem,
+            "bonus_cert": bonus_cert,
+            "bonus_volunteer": bonus_volunteer,
+            "bonus_score": bonus_score,
+            "total_score": total_score,
+        }
+
+    @staticmethod
+    @_timed("calculate_all")
+    def calculate_all(applicants: List[ApplicantData]) -> List[ApplicantData]:
+        """
+        신청자 목록 전체를 calculate_batch()로 한 번에 계산해 각 객체에 기록.
+
+        결과와 신청자별 [점수] 로그는 calculate()를 차례로 호출한 것과 같다.
+        """
+        if not applicants:
+            return applicants
+
+        # 이공계 판별은 문자열 검사 — 같은 전공명은 한 번만 검사
+        stem_by_major: Dict[str, bool] = {}
+        for a in applicants:
+            if a.major not in stem_by_major:
+                stem_by_major[a.major] = "stem" in STEM_MATCHER.scan(a.major)
+
+        cols = ScoringEngine.calculate_batch(
+            grade=[a.grade for a in applicants],
+            completed_credits=[a.completed_credits for a in applicants],
+            graduation_credits=[a.graduation_credits for a in applicants],
+            has_certificate=[a.has_certificate for a in applicants],
+            volunteer_hours=[a.volunteer_hours for a in applicants],
+            is_stem=[stem_by_major[a.major] for a in applicants],
+        )
+        # tolist() → 파이썬 float/bool (직렬화·비교 결과가 스칼라 경로와 동일)
+        values = {k: v.tolist() for k, v in cols.items()}
+        for i, a in enumerate(applicants):
+            for k, v in values.items():
+                setattr(a, k, v[i])
+        if logger.isEnabledFor(logging.INFO):
+            for a in applicants:
+                ScoringEngine._log_score(a)
+        return applicants
+
+    @staticmethod
+    def _log_score(applicant: ApplicantData) -> None:
         logger.info(
             f"[점수] {applicant.name!r:8s} │ "
             f"학년({applicant.grade}학년)={applicant.grade_score:4.0f}pt │ "
@@ -444,13 +458,54 @@ class ScoringEngine:
             f"가산={applicant.bonus_score:.0f}pt │ "
             f"총점={applicant.total_score:.2f}pt"
         )
-        return applicant
+
+
+def _round2(values: np.ndarray) -> np.ndarray:
+    """
+    파이썬 round(x, 2)와 같은 결과를 내는 벡터 반올림.
+
+    np.round는 x*100을 반올림하므로, 곱셈 오차로 x*100이 .5 경계에 걸친 값은
+    round()(정확한 10진 값 기준 반올림)와 결과가 다를 수 있다. 경계 근처 값만
+    골라 round()로 다시 계산한다.
+    """
+    scaled = values * 100
+    out = np.rint(scaled) / 100
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        out[near_half] = [round(float(v), 2) for v in values[near_half]]
+    return out
+
+
+# ──────────────────────────────────────────────────────────────────────
+# 필드 해석기 — 점수·결과표에 필요한 필드만, 값을 결정하는 서류에서만 추출
+# ──────────────────────────────────────────────────────────────────────
+class FieldResolver(core.FieldResolver):
+    """
+    신청자 1명의 서류를 모아 두었다가 필드를 한 번에 결정한다 (규칙은 hanyang_core.FieldResolver).
+
+    이 앱의 필드 패턴(PDFParser)을 쓰며, 지역·학제는 점수·결과표에 쓰지 않으므로 해석하지 않는다.
+    미분류 서류의 졸업기준학점은 0이라도 그대로 반영한다 (이 앱의 기존 규칙).
+    """
+
+    parser = PDFParser
+    school_fields = False
+    unknown_zero_grad = True
+
+    def add(self, fp: str, dt: str, text: str) -> None:
+        """서류 1건 등록 — 서류 종류로 정해지는 표시만 즉시 기록"""
+        super().add(fp, dt, text)
+        if dt == "eligibility":
+            logger.info(f"자격 확인: {self.a.name!r}")
+
+    def _note_error(self, fp: str, e: Exception) -> None:
+        self.a.parse_notes.append(f"❌ '{fp}': 오류 — {e}")
+        logger.error(f"파싱 오류 ({fp}): {e}", exc_info=True)
 
 
 # ──────────────────────────────────────────────────────────────────────
 # ZIP 처리기 — 압축 파일에서 신청자 데이터를 수집
 # ──────────────────────────────────────────────────────────────────────
-class DocumentProcessor:
+class DocumentProcessor(core.DocumentProcessor):
     """
     ZIP 파일을 열어 신청자별 PDF를 파싱하고 점수를 계산한다.
 
@@ -466,192 +521,153 @@ class DocumentProcessor:
     파일명형 구조도 허용:
         홍길동_자립지원대상자확인서.pdf
         홍길동_재학증명서.pdf
+
+    ZIP 읽기·중복 PDF 확인·추출(캐시·격리·병렬 풀)·병합 순서는 hanyang_core.DocumentProcessor 와
+    같고, 이 앱의 신청자 레코드·필드 해석기·마스킹 규칙(계좌번호 포함)을 쓴다.
+    점수는 모든 신청자의 필드가 정해진 뒤 calculate_all()로 한 번에 계산한다.
     """
 
-    def __init__(self):
+    record = ApplicantData
+    resolver = FieldResolver
+    masker = _MASKER
+
+    def __init__(self, workers: Optional[int] = None):
+        super().__init__(workers)
         self._parser = PDFParser()
         self._scorer = ScoringEngine()
 
-    def process(self, zip_bytes: bytes) -> List[ApplicantData]:
-        """ZIP 바이트를 처리하여 점수가 계산된 ApplicantData 목록 반환"""
-        applicants: Dict[str, ApplicantData] = {}
+    def process(
+        self,
+        zip_source: Union[bytes, str],
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[ApplicantData]:
+        """
+        ZIP을 처리하여 점수가 계산된 ApplicantData 목록 반환.
+
+        zip_source: ZIP 바이트 또는 spool_upload()로 저장한 임시 파일 경로.
+        경로를 넘기면 PDF를 한 건씩 읽으므로 아카이브 전체가 메모리에 올라가지 않는다.
+        progress:   progress(완료 PDF 수, 전체 PDF 수) — PDF 1건 병합마다 호출
+        """
+        def on_progress(stage: str, done: int, total: int) -> None:
+            if stage == "extract" and done:
+                progress(done, total)
+
+        results = super().process(zip_source, on_progress if progress else None)
+        self._scorer.calculate_all(results)
 
-        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
-            names = zf.namelist()
-            logger.info(f"ZIP 파일 열기 완료 — 내부 파일 수: {len(names)}")
+        logger.info(
+            f"처리 완료 — 총 {len(results)}명 / "
+            f"자격 충족: {sum(1 for a in results if a.is_eligible)}명"
+        )
+        return results
 
-            for filepath in names:
-                # PDF 파일만 처리
-                if not filepath.lower().endswith(".pdf"):
-                    continue
-                # macOS 메타데이터 폴더 제외
-                if "__MACOSX" in filepath:
-                    continue
+    # ── 내부 헬퍼 ─────────────────────────────────────────
 
-                key = self._to_applicant_key(filepath)
+    def _finish(self, a: ApplicantData, r: Optional[FieldResolver], events: Any) -> None:
+        """필드 해석(서류 원문 해제)과 자격 표시 — 점수는 process()에서 일괄 계산"""
+        if r is not None:
+            r.resolve()
+        if not a.is_eligible:
+            a.parse_notes.insert(0, "⛔ 자립지원 대상자 확인서 미확인 — 선발 대상 제외")
+            logger.warning(f"자격 미달: {a.name!r} (자립확인서 없음)")
+
+    def _merge(
+        self,
+        applicants: Dict[str, ApplicantData],
+        resolvers: Dict[str, FieldResolver],
+        key: str,
+        fp: str,
+        text: str,
+        dt: str,
+        err: Optional[str],
+    ) -> None:
+        """추출 결과 1건을 신청자별 ApplicantData에 병합"""
+        if key not in applicants:
+            applicants[key] = ApplicantData(applicant_key=key, name=key)
 
-                if key not in applicants:
-                    applicants[key] = ApplicantData(applicant_key=key, name=key)
+        appl = applicants[key]
 
-                appl = applicants[key]
+        if err is not None:
+            appl.parse_notes.append(f"❌ '{fp}': 오류 — {err}")
+            logger.error(f"파싱 오류 ({fp}): {err}")
+            return
 
-                try:
-                    pdf_bytes = zf.read(filepath)
-                    text = self._parser.extract_text(pdf_bytes)
+        if not text.strip():
+            appl.parse_notes.append(f"⚠ '{fp}': 텍스트 추출 불가 (스캔 이미지로 추정)")
+            logger.warning(f"텍스트 없음: {fp}")
+            return
 
-                    if not text.strip():
-                        appl.parse_notes.append(
-                            f"⚠ '{filepath}': 텍스트 추출 불가 (스캔 이미지로 추정)"
-                        )
-                        logger.warning(f"텍스트 없음: {filepath}")
-                        continue
+        # 필드 추출은 신청자의 서류가 모두 모인 뒤 FieldResolver.resolve() 에서 필요한 것만 수행
+        if key not in resolvers:
+            resolvers[key] = FieldResolver(appl)
+        resolvers[key].add(fp, dt, text)
+        logger.info(f"파싱 완료: {fp} → [{dt}]")
 
-                    doc_type = self._parser.classify(text)
-                    # 중복 타입 처리: 같은 종류 서류가 여러 개일 경우 내용 합산
-                    if doc_type in appl.raw_texts:
-                        appl.raw_texts[doc_type] += "\n" + text
-                    else:
-                        appl.raw_texts[doc_type] = text
 
-                    self._apply_document(appl, doc_type, text)
-                    logger.info(f"파싱 완료: {filepath} → [{doc_type}]")
+# ──────────────────────────────────────────────────────────────────────
+# 최종 선발 함수 — 동점자 처리 포함 (순위 계산은 공용 코어)
+# ──────────────────────────────────────────────────────────────────────
+def _selection_record(a: ApplicantData) -> Dict[str, Any]:
+    """선발 결과 표의 한 행 (순위 컬럼 제외)"""
+    return {
+        # ─ 식별
+        "성명": a.name,
+        # ─ 학적 (표시용)
+        "학년": f"{a.grade}학년" if a.grade > 0 else "미확인",
+        "전공": a.major or "미확인",
+        "이수학점": a.completed_credits,
+        "졸업기준학점": a.graduation_credits,
+        "이수율(%)": round(a.completion_rate * 100, 1),
+        "GPA": a.gpa,
+        # ─ 점수
+        "학년점수": a.grade_score,
+        "이수율점수": a.completion_score,
+        "가산점": a.bonus_score,
+        "총점": a.total_score,
+        # ─ 가산점 세부
+        "이공계/방산": "✓" if a.bonus_stem else "",
+        "자격증/어학": "✓" if a.bonus_cert else "",
+        "봉사50h+": "✓" if a.bonus_volunteer else "",
+        # ─ 서류 제출 현황
+        "자립확인서": "✓" if a.is_eligible else "✗",
+        "재학증명서": "✓" if a.has_enrollment else "미확인",
+        "성적증명서": "✓" if a.has_transcript else "미확인",
+        # ─ 처리 메모
+        "비고": " | ".join(a.parse_notes) if a.parse_notes else "정상 처리",
+    }
 
-                except Exception as exc:
-                    appl.parse_notes.append(f"❌ '{filepath}': 오류 — {exc}")
-                    logger.error(f"파싱 오류 ({filepath}): {exc}", exc_info=True)
-
-        # ── 이름 보정: PDF에서 실명 추출 시 파일명 기반 키를 덮어씀
-        for appl in applicants.values():
-            for text in appl.raw_texts.values():
-                real_name = self._parser.extract_name(text)
-                if real_name:
-                    appl.name = real_name
-                    break
-
-        # ── 자격 검증 및 점수 계산
-        results: List[ApplicantData] = []
-        for appl in applicants.values():
-            if not appl.is_eligible:
-                appl.parse_notes.insert(
-                    0, "⛔ 자립지원 대상자 확인서 미확인 — 선발 대상 제외"
-                )
-                logger.warning(f"자격 미달: {appl.name!r} (자립확인서 없음)")
 
-            self._scorer.calculate(appl)
-            results.append(appl)
+def _ranking_frame(ranked: List[ApplicantData], first_rank: int = 1) -> pd.DataFrame:
+    """정렬된 신청자 목록 → 순위 컬럼이 맨 앞에 붙은 DataFrame"""
+    df = pd.DataFrame([_selection_record(a) for a in ranked])
+    if not df.empty:
+        df.insert(0, "순위", range(first_rank, first_rank + len(df)))
+    return df
 
-        logger.info(
-            f"처리 완료 — 총 {len(results)}명 / "
-            f"자격 충족: {sum(1 for a in results if a.is_eligible)}명"
-        )
-        return results
 
-    # ── 내부 헬퍼 ─────────────────────────────────────────
+class Ranking(core.Ranking):
+    """
+    자격자 순위 — 상위 n명은 생성 시 heapq.nlargest로 O(M log n)에 구하고,
+    전체 순위표는 처음 요청될 때 한 번만 정렬해 만든다 (hanyang_core.Ranking).
+
+    순위표는 DataFrame (.top: 선발자, .all: 전체 자격자). len(ranking) 은 자격자 수.
+    """
+
+    _records = staticmethod(_ranking_frame)
 
     @staticmethod
-    def _to_applicant_key(filepath: str) -> str:
-        """파일 경로에서 신청자 구분 키(폴더명 또는 파일명 앞부분) 추출"""
-        normalized = filepath.replace("\\", "/")
-        parts = normalized.split("/")
-
-        if len(parts) >= 2:
-            # 폴더형: 첫 번째 디렉터리를 신청자 키로 사용
-            return parts[0].strip()
-
-        # 파일명형: 구분자로 분리
-        basename = os.path.splitext(parts[0])[0]
-        for sep in ("_", "-", " "):
-            if sep in basename:
-                return basename.split(sep)[0].strip()
-        return basename.strip()
-
-    def _apply_document(
-        self, appl: ApplicantData, doc_type: str, text: str
-    ) -> None:
-        """서류 종류별로 해당 필드를 채운다"""
-
-        if doc_type == "eligibility":
-            # ── 자립지원 대상자 확인서
-            appl.is_eligible = True
-            logger.info(f"자격 확인: {appl.name!r}")
-
-        elif doc_type == "enrollment":
-            # ── 재학증명서: 학년, 전공
-            appl.has_enrollment = True
-            grade = self._parser.extract_grade(text)
-            if grade:
-                appl.grade = grade
-            major = self._parser.extract_major(text)
-            if major:
-                appl.major = major
-
-        elif doc_type == "transcript":
-            # ── 성적증명서: 학점, GPA (학년/전공 보완 추출도 시도)
-            appl.has_transcript = True
-            completed, graduation = self._parser.extract_credits(text)
-            if completed is not None:
-                appl.completed_credits = completed
-            if graduation is not None:
-                appl.graduation_credits = graduation
-            gpa = self._parser.extract_gpa(text)
-            if gpa is not None:
-                appl.gpa = gpa
-            # 재학증명서가 없을 경우 학년·전공 보완
-            if appl.grade == 0:
-                g = self._parser.extract_grade(text)
-                if g:
-                    appl.grade = g
-            if not appl.major:
-                m = self._parser.extract_major(text)
-                if m:
-                    appl.major = m
-
-        elif doc_type == "bonus":
-            # ── 가산점 서류: 자격증, 봉사, 병역
-            appl.has_bonus_doc = True
-            if self._parser.check_certificate(text):
-                appl.has_certificate = True
-            hours = self._parser.extract_volunteer_hours(text)
-            if hours > 0:
-                appl.volunteer_hours = max(appl.volunteer_hours, hours)
-            if self._parser.check_military(text):
-                appl.is_military = True
+    def _concat(top: pd.DataFrame, rest: pd.DataFrame) -> pd.DataFrame:
+        return pd.concat([top, rest], ignore_index=True) if not rest.empty else top.copy()
 
-        else:
-            # ── 미분류: 모든 필드 추출 시도 (포괄적 파싱)
-            if any(kw in text for kw in DOC_ELIGIBILITY_KW):
-                appl.is_eligible = True
-            if appl.grade == 0:
-                g = self._parser.extract_grade(text)
-                if g:
-                    appl.grade = g
-            if not appl.major:
-                m = self._parser.extract_major(text)
-                if m:
-                    appl.major = m
-            completed, graduation = self._parser.extract_credits(text)
-            if completed is not None and appl.completed_credits == 0:
-                appl.completed_credits = completed
-            if graduation is not None:
-                appl.graduation_credits = graduation
-            gpa = self._parser.extract_gpa(text)
-            if gpa is not None and appl.gpa == 0:
-                appl.gpa = gpa
-            if self._parser.check_certificate(text):
-                appl.has_certificate = True
-            hours = self._parser.extract_volunteer_hours(text)
-            if hours > 0:
-                appl.volunteer_hours = max(appl.volunteer_hours, hours)
-            if self._parser.check_military(text):
-                appl.is_military = True
+    @property
+    def has_all(self) -> bool:
+        """전체 순위표가 이미 만들어졌는지 여부"""
+        return self._all is not None
 
 
-# ──────────────────────────────────────────────────────────────────────
-# 최종 선발 함수 — 동점자 처리 포함
-# ──────────────────────────────────────────────────────────────────────
-def select_scholars(
+def rank_scholars(
     applicants: List[ApplicantData], n: int = MAX_SCHOLARS, excluded: set = None
-) -> Tuple[pd.DataFrame, pd.DataFrame]:
+) -> Ranking:
     """
     자격 요건(자립지원 대상자 확인서) 충족자 중 점수 상위 n명을 선발.
 
@@ -662,79 +678,74 @@ def select_scholars(
 
     excluded: 이전 선발자 이름 집합 — 해당 인원은 선발 대상에서 제외
 
-    반환: (선발자 DataFrame, 전체 자격자 DataFrame)
+    반환: Ranking (선발자 .top, 전체 자격자 .all — 전체는 요청 시 정렬)
     """
-    excluded = excluded or set()
-    for a in applicants:
-        if a.name in excluded:
-            a.parse_notes.insert(0, "⛔ 이전 선발자 — 중복 선발 제외")
-    eligible = [a for a in applicants if a.is_eligible and a.name not in excluded]
-
-    if not eligible:
-        return pd.DataFrame(), pd.DataFrame()
-
-    records = []
-    for a in eligible:
-        records.append(
-            {
-                # ─ 식별
-                "성명": a.name,
-                # ─ 학적 (표시용)
-                "학년": f"{a.grade}학년" if a.grade > 0 else "미확인",
-                "_학년정렬": a.grade,           # 정렬용 숨김 컬럼
-                "전공": a.major or "미확인",
-                "이수학점": a.completed_credits,
-                "졸업기준학점": a.graduation_credits,
-                "이수율(%)": round(a.completion_rate * 100, 1),
-                "_이수율정렬": a.completion_rate,  # 정렬용 숨김 컬럼
-                "GPA": a.gpa,
-                # ─ 점수
-                "학년점수": a.grade_score,
-                "이수율점수": a.completion_score,
-                "가산점": a.bonus_score,
-                "총점": a.total_score,
-                # ─ 가산점 세부
-                "이공계/방산": "✓" if a.bonus_stem else "",
-                "자격증/어학": "✓" if a.bonus_cert else "",
-                "봉사50h+": "✓" if a.bonus_volunteer else "",
-                # ─ 서류 제출 현황
-                "자립확인서": "✓" if a.is_eligible else "✗",
-                "재학증명서": "✓" if a.has_enrollment else "미확인",
-                "성적증명서": "✓" if a.has_transcript else "미확인",
-                # ─ 처리 메모
-                "비고": " | ".join(a.parse_notes) if a.parse_notes else "정상 처리",
-            }
+    ranking = core.rank_scholars(applicants, n, excluded, cls=Ranking)
+    if len(ranking):
+        logger.info(
+            f"최종 선발 완료 — 자격자 {len(ranking)}명 중 {len(ranking.top)}명 선발"
         )
+    return ranking
 
-    df = pd.DataFrame(records)
 
-    # 정렬: 총점 ↓ → 이수율 ↓ → 학년 ↓ → GPA ↓
-    df_sorted = df.sort_values(
-        by=["총점", "_이수율정렬", "_학년정렬", "GPA"],
-        ascending=[False, False, False, False],
-    ).reset_index(drop=True)
+@_timed("select_scholars")
+def select_scholars(
+    applicants: List[ApplicantData], n: int = MAX_SCHOLARS, excluded: set = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    rank_scholars 의 전체 순위 버전.
+
+    반환: (선발자 DataFrame, 전체 자격자 DataFrame)
+    """
+    ranking = rank_scholars(applicants, n, excluded)
+    return ranking.top, ranking.all
 
-    # 순위 부여
-    df_sorted.insert(0, "순위", range(1, len(df_sorted) + 1))
 
-    # 정렬용 숨김 컬럼 제거
-    df_sorted.drop(columns=["_학년정렬", "_이수율정렬"], inplace=True)
+@st.cache_resource(show_spinner=False)
+def _warm_extraction_pool() -> None:
+    """앱 시작 시 1회 — 병렬 추출을 켰으면 백그라운드에서 공용 워커 풀 기동 (첫 분석도 기동 비용 없음)"""
+    def run() -> None:
+        try:
+            extraction_pool().warm()
+        except Exception as exc:
+            logger.warning(f"추출 워커 풀 사전 기동 실패 — 첫 분석 때 기동: {exc}")
 
-    selected = df_sorted.head(n).copy()
+    if EXTRACT_WORKERS > 1:
+        threading.Thread(target=run, name="hanyang-pool-warm", daemon=True).start()
 
-    logger.info(
-        f"최종 선발 완료 — 자격자 {len(eligible)}명 중 {len(selected)}명 선발"
-    )
-    return selected, df_sorted
+
+# ──────────────────────────────────────────────────────────────────────
+# 분석 결과 영구 보관 (SQLite) — 스키마·RunDB는 api/hanyang_runs.py 하나를 api/index.py와 함께 쓴다
+# (같은 파일, runs.source="app"으로 구분). 새로고침·재시작 후에도 PDF 재처리 없이
+# 선발 결과·CSV·리포트를 다시 보여 주고 재선발할 수 있다.
+# ──────────────────────────────────────────────────────────────────────
+_run_db: Optional[RunDB] = RunDB(RUN_DB_PATH, "app", RUN_DB_KEEP_DAYS) if RUN_DB_PATH else None
+
+
+def run_db_call(what: str, method: str, *args) -> Any:
+    """
+    결과 DB 메서드 호출 — DB 오류는 경고 로그만 남기고 None 반환
+    (보관에 실패해도 이번 분석 결과는 세션에서 그대로 사용)
+    """
+    if _run_db is None:
+        return None
+    try:
+        return getattr(_run_db, method)(*args)
+    except (sqlite3.Error, OSError, ValueError) as e:
+        logger.warning(f"결과 DB {what} 실패: {e}")
+        return None
 
 
 # ──────────────────────────────────────────────────────────────────────
 # 통계 리포트 생성
 # ──────────────────────────────────────────────────────────────────────
+@_timed("build_report")
 def build_report(
-    selected: pd.DataFrame, all_eligible: pd.DataFrame, total_applicants: int
+    selected: pd.DataFrame,
+    all_eligible: Union[pd.DataFrame, Ranking],
+    total_applicants: int,
 ) -> Dict[str, Any]:
-    """선발 결과 기반 통계 딕셔너리 생성"""
+    """선발 결과 기반 통계 딕셔너리 생성 (all_eligible 은 자격자 수만 사용)"""
     if selected.empty:
         return {}
 
@@ -801,15 +812,72 @@ def make_demo_applicants(n: int = 20) -> List[ApplicantData]:
             has_enrollment=True,
             has_transcript=True,
         )
-        ScoringEngine.calculate(a)
         results.append(a)
 
-    return results
+    return ScoringEngine.calculate_all(results)
 
 
 # ──────────────────────────────────────────────────────────────────────
 # Streamlit UI
 # ──────────────────────────────────────────────────────────────────────
+def reselect_session(excluded: set) -> Optional[int]:
+    """
+    세션에 보관된 신청자 목록을 새 제외 명단으로 재선발 — PDF 재파싱 없이
+    제외·정렬만 다시 수행한다.
+
+    excluded: 현재 제외 명단. 이번 분석에서 추가된 선발자는 '이전 선발자'가 아니므로
+              빼고 재선발한 뒤, 업로드 때와 같이 새 선발자를 명단에 추가한다.
+
+    반환: 선발 인원 (재선발할 업로드 결과가 없으면 None)
+    """
+    applics = st.session_state.get("applicants")
+    if not applics or st.session_state.get("is_demo", False):
+        return None
+    excluded = excluded - st.session_state.get("run_selected", set())
+    ranking = rank_scholars(applics, MAX_SCHOLARS, excluded)
+    sel_df = ranking.top
+    run_selected = set() if sel_df.empty else set(sel_df["성명"].tolist())
+    save_excluded_names(excluded | run_selected)
+    if st.session_state.get("run_id"):
+        run_db_call("갱신", "update", st.session_state["run_id"], applics, ranking, excluded)
+    st.session_state.update(
+        {"selected_df": sel_df, "ranking": ranking, "run_selected": run_selected}
+    )
+    logger.info(f"재선발 — 신청자 {len(applics)}명, 제외 명단 {len(excluded)}명")
+    return len(sel_df)
+
+
+def restore_run(run_id: str) -> Optional[int]:
+    """
+    결과 DB에 보관된 회차를 세션으로 불러옴 — PDF 재처리 없이 저장된 점수로
+    저장 당시의 제외 명단을 적용해 다시 순위를 매긴다.
+
+    그 회차의 선발자는 이번 분석 선발자(run_selected)로 취급하므로
+    이후 재선발 시 제외 대상에서 빠진다.
+
+    반환: 선발 인원 (불러올 수 없으면 None)
+    """
+    loaded = run_db_call("조회", "load", run_id, ApplicantData)
+    if not loaded:
+        return None
+    applics, excluded = loaded
+    ranking = rank_scholars(applics, MAX_SCHOLARS, excluded)
+    sel_df = ranking.top
+    st.session_state.update(
+        {
+            "selected_df": sel_df,
+            "ranking": ranking,
+            "applicants": applics,
+            "run_selected": set() if sel_df.empty else set(sel_df["성명"].tolist()),
+            "run_id": run_id,
+            "log": "",
+            "timings": None,
+            "is_demo": False,
+        }
+    )
+    return len(sel_df)
+
+
 def main() -> None:
     # ── 페이지 기본 설정 ──────────────────────────────────────
     st.set_page_config(
@@ -818,6 +886,7 @@ def main() -> None:
         layout="wide",
         initial_sidebar_state="expanded",
     )
+    _warm_extraction_pool()
 
     # ── 전역 CSS ──────────────────────────────────────────────
     st.markdown(
@@ -909,9 +978,54 @@ def main() -> None:
             st.warning(f"이전 선발자 **{len(_excl_set)}명**은 이번 선발에서 자동 제외됩니다.")
             if st.button("🗑️ 이전 명단 초기화", key="clear_excluded", use_container_width=True):
                 save_excluded_names(set())
+                reselect_session(set())
                 st.rerun()
         else:
             st.info("이전 선발자 없음 (첫 선발 또는 초기화됨)")
+        # 결과 DB의 선발 이력(모든 보관 회차의 선발자)으로 excluded_names.json 보충
+        if _run_db is not None and st.button(
+            "🗂️ 선발 이력으로 제외 명단 보충", key="excluded_from_history", use_container_width=True,
+            help="보관된 모든 분석 회차의 선발자를 제외 명단에 추가합니다.",
+        ):
+            history = run_db_call("선발 이력 조회", "selected_names")
+            if history is not None:
+                save_excluded_names(_excl_set | history)
+                st.rerun()
+        # excluded_names.json을 직접 수정한 경우 — 재업로드 없이 현재 명단으로 재선발
+        if "applicants" in st.session_state and not st.session_state.get("is_demo", False):
+            if st.button("🔁 현재 제외 명단으로 재선발", key="reselect", use_container_width=True,
+                         help="이번 분석의 선발자는 제외 대상에서 빼고 다시 선발합니다."):
+                reselect_session(_excl_set)
+                st.rerun()
+        if _run_db is not None:
+            st.markdown("---")
+            st.markdown("## 📂 이전 분석 결과")
+            past_runs = run_db_call("목록 조회", "recent") or []
+            if past_runs:
+                labels = {
+                    r["result_id"]: (
+                        f"{r['created'].replace('T', ' ')} — "
+                        f"신청 {r['total_applicants']}명 · 선발 {r['selected_count']}명"
+                    )
+                    for r in past_runs
+                }
+                chosen = st.selectbox(
+                    "보관된 회차", list(labels), format_func=labels.get, key="past_run",
+                    label_visibility="collapsed",
+                )
+                if st.button("📂 불러오기 (PDF 재처리 없음)", key="restore_run", use_container_width=True):
+                    if restore_run(chosen) is None:
+                        st.error("보관된 결과를 불러오지 못했습니다.")
+                    else:
+                        st.rerun()
+                if st.button("🗑️ 이 회차 삭제", key="delete_run", use_container_width=True,
+                             help="보관된 회차와 신청자 기록을 결과 DB에서 삭제합니다."):
+                    if run_db_call("삭제", "delete", chosen):
+                        st.rerun()
+                    else:
+                        st.error("보관된 결과를 삭제하지 못했습니다.")
+            else:
+                st.caption("보관된 분석 결과가 없습니다.")
         st.markdown("---")
         st.caption(
             "🔒 개인정보보호법 준수\n"
@@ -957,13 +1071,16 @@ def main() -> None:
                 _log_buffer.truncate(0)
                 _log_buffer.seek(0)
                 demo_applics = make_demo_applicants(30)
-                sel_df, all_df = select_scholars(demo_applics, MAX_SCHOLARS)
+                ranking = rank_scholars(demo_applics, MAX_SCHOLARS)
+                sel_df = ranking.top
                 st.session_state.update(
                     {
                         "selected_df": sel_df,
-                        "all_df": all_df,
+                        "ranking": ranking,
                         "applicants": demo_applics,
                         "log": _log_buffer.getvalue(),
+                        "timings": None,
+                        "run_id": None,
                         "is_demo": True,
                     }
                 )
@@ -978,65 +1095,96 @@ def main() -> None:
 
             progress = st.progress(0, text="ZIP 파일 압축 해제 중...")
 
-            try:
-                zip_bytes = uploaded.read()
-
-                # ZIP 유효성 사전 검사
-                if not zipfile.is_zipfile(io.BytesIO(zip_bytes)):
-                    st.error("❌ 유효하지 않은 ZIP 파일입니다.")
-                    st.stop()
-
-                progress.progress(15, text="PDF 파싱 중...")
-                processor = DocumentProcessor()
-                applics = processor.process(zip_bytes)
-
-                progress.progress(70, text="점수 계산 및 선발 처리 중...")
-
-                if not applics:
-                    st.error(
-                        "❌ ZIP 파일에서 신청자 데이터를 찾을 수 없습니다. "
-                        "파일 구조를 확인해 주세요."
+            zip_path = None
+            with collect_timings() as timings:
+                try:
+                    # 업로드를 임시 파일로 스풀 — 아카이브 사본을 메모리에 만들지 않음
+                    zip_path = _spool_upload(uploaded)
+
+                    # ZIP 유효성 사전 검사
+                    if not zipfile.is_zipfile(zip_path):
+                        st.error("❌ 유효하지 않은 ZIP 파일입니다.")
+                        st.stop()
+
+                    progress.progress(15, text="PDF 파싱 중...")
+                    processor = DocumentProcessor()
+                    # PDF 파싱 구간(15→70%)을 파일 단위 진행률로 표시
+                    applics = processor.process(
+                        zip_path,
+                        lambda done, total: progress.progress(
+                            15 + 55 * done // total, text=f"PDF 파싱 중... ({done}/{total})"
+                        ),
                     )
-                    st.stop()
 
-                excl = load_excluded_names()
-                sel_df, all_df = select_scholars(applics, MAX_SCHOLARS, excl)
+                    progress.progress(70, text="점수 계산 및 선발 처리 중...")
 
-                # 이번에 선발된 인원을 이전 선발 명단에 추가 (중복 선발 방지)
-                if not sel_df.empty:
-                    new_excl = excl | set(sel_df["성명"].tolist())
-                    save_excluded_names(new_excl)
-
-                progress.progress(95, text="결과 저장 중...")
-                st.session_state.update(
-                    {
-                        "selected_df": sel_df,
-                        "all_df": all_df,
-                        "applicants": applics,
-                        "log": _log_buffer.getvalue(),
-                        "is_demo": False,
-                    }
-                )
-                progress.progress(100, text="완료!")
+                    if not applics:
+                        st.error(
+                            "❌ ZIP 파일에서 신청자 데이터를 찾을 수 없습니다. "
+                            "파일 구조를 확인해 주세요."
+                        )
+                        st.stop()
+
+                    excl = load_excluded_names()
+                    ranking = rank_scholars(applics, MAX_SCHOLARS, excl)
+                    sel_df = ranking.top
+
+                    # 이번에 선발된 인원을 이전 선발 명단에 추가 (중복 선발 방지)
+                    run_selected = set() if sel_df.empty else set(sel_df["성명"].tolist())
+                    if run_selected:
+                        save_excluded_names(excl | run_selected)
+
+                    progress.progress(95, text="결과 저장 중...")
+                    run_id = uuid.uuid4().hex
+                    if not run_db_call("저장", "save", run_id, applics, ranking, excl):
+                        run_id = None
+                    st.session_state.update(
+                        {
+                            "selected_df": sel_df,
+                            "ranking": ranking,
+                            "applicants": applics,
+                            "run_selected": run_selected,
+                            "run_id": run_id,
+                            "log": _log_buffer.getvalue(),
+                            "timings": timings.summary(),
+                            "is_demo": False,
+                        }
+                    )
+                    progress.progress(100, text="완료!")
 
-                st.success(
-                    f"🎉 분석 완료! 총 **{len(applics)}명** 신청자 중 "
-                    f"**{len(sel_df)}명** 최종 선발"
-                )
+                    st.success(
+                        f"🎉 분석 완료! 총 **{len(applics)}명** 신청자 중 "
+                        f"**{len(sel_df)}명** 최종 선발"
+                    )
 
-            except zipfile.BadZipFile:
-                st.error("❌ ZIP 파일이 손상되었거나 형식이 올바르지 않습니다.")
-            except MemoryError:
-                st.error("❌ 파일이 너무 큽니다. 더 작은 파일로 분할 후 업로드하세요.")
-            except Exception as exc:
-                st.error(f"❌ 처리 중 오류 발생: {exc}")
-                logger.error(f"처리 오류: {exc}", exc_info=True)
+                except zipfile.BadZipFile:
+                    st.error("❌ ZIP 파일이 손상되었거나 형식이 올바르지 않습니다.")
+                except MemoryError:
+                    st.error("❌ 파일이 너무 큽니다. 더 작은 파일로 분할 후 업로드하세요.")
+                except Exception as exc:
+                    st.error(f"❌ 처리 중 오류 발생: {exc}")
+                    logger.error(f"처리 오류: {exc}", exc_info=True)
+                finally:
+                    if zip_path:
+                        os.unlink(zip_path)
 
         # ── 처리 로그 (투명성 원칙) ───────────────────────────
         if "log" in st.session_state and st.session_state["log"]:
             with st.expander("📋 처리 로그 보기 — 투명성 원칙에 따른 처리 이력", expanded=False):
                 st.code(st.session_state["log"], language=None)
 
+        # ── 단계별 처리 시간 (성능 계측) ──────────────────────
+        if st.session_state.get("timings"):
+            timings = st.session_state["timings"]
+            with st.expander(
+                f"⏱ 단계별 처리 시간 — 총 {timings['elapsed_ms'] / 1000:.2f}초", expanded=False
+            ):
+                st.dataframe(
+                    pd.DataFrame.from_dict(timings["stages"], orient="index")
+                    .sort_values("total_ms", ascending=False),
+                    use_container_width=True,
+                )
+
         # ── 파싱 경고사항 표시 ────────────────────────────────
         if "applicants" in st.session_state:
             warnings = [
@@ -1132,9 +1280,13 @@ def main() -> None:
             )
 
         with c2:
-            all_df = st.session_state.get("all_df", pd.DataFrame())
-            if not all_df.empty:
-                csv_all = all_df.to_csv(index=False, encoding="utf-8-sig")
+            # 전체 순위는 정렬 비용이 크므로 요청할 때만 생성 (이후 세션에서 재사용)
+            ranking = st.session_state.get("ranking")
+            if ranking is not None and len(ranking) > 0 and (
+                ranking.has_all
+                or st.button("📋 전체 자격자 명단 준비", use_container_width=True)
+            ):
+                csv_all = ranking.all.to_csv(index=False, encoding="utf-8-sig")
                 st.download_button(
                     label="📥 전체 자격자 명단 CSV 다운로드",
                     data=csv_all,
@@ -1154,14 +1306,14 @@ def main() -> None:
             st.stop()
 
         sel_df = st.session_state["selected_df"]
-        all_df = st.session_state.get("all_df", pd.DataFrame())
+        ranking = st.session_state.get("ranking", [])
         all_applics = st.session_state.get("applicants", [])
 
         if sel_df.empty:
             st.warning("통계를 표시할 선발 데이터가 없습니다.")
             st.stop()
 
-        rpt = build_report(sel_df, all_df, len(all_applics))
+        rpt = build_report(sel_df, ranking, len(all_applics))
 
         # ── 핵심 지표 카드 ────────────────────────────────────
         c1, c2, c3, c4, c5 = st.columns(5)
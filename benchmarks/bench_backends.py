@@ -0,0 +1,68 @@
+"""
+PDF 백엔드 벤치마크 — 설치된 백엔드별 추출 속도와 분류 일치 여부
+
+  python benchmarks/bench_backends.py                      # 합성 코퍼스 신청자 200명
+  python benchmarks/bench_backends.py --applicants 1000 --bundle-pages 8
+  python benchmarks/bench_backends.py --zip 신청서류.zip    # 기존 ZIP 측정
+
+PDF_BACKENDS에 등록된 백엔드 중 설치된 것마다 ZIP 안의 PDF 전체를 PDFParser._extract_with로
+추출해 (2단계 추출·마스킹 포함, 캐시 없음) 시간을 재고, 첫 번째 백엔드와 분류 결과가
+다른 PDF 수를 센다. 등록 순서(= "auto" 선택 순서)는 이 측정의 빠른 순을 따른다.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import zipfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+from bench_field_extraction import load_target, timed  # noqa: E402
+from make_corpus import build_corpus  # noqa: E402
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--target", choices=["api", "app"], default="api")
+    ap.add_argument("--applicants", type=int, default=200, help="합성 코퍼스 신청자 수 (50 ~ 20000)")
+    ap.add_argument("--bundle-pages", type=int, default=0, help="확인서 뒤 첨부 쪽 수 (make_corpus.py 참고)")
+    ap.add_argument("--zip", help="합성 코퍼스 대신 측정할 기존 ZIP")
+    ap.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수 (최솟값 보고)")
+    args = ap.parse_args()
+
+    module = load_target(args.target)
+    logging.getLogger("pypdf").setLevel(logging.ERROR)   # 한글 CMap "Advanced encoding" 경고 반복 억제
+    with tempfile.TemporaryDirectory(prefix="hanyang_bench_") as tmp:
+        path = args.zip
+        if not path:
+            path = os.path.join(tmp, "corpus.zip")
+            build_corpus(path, args.applicants, "mixed", bundle_pages=args.bundle_pages)
+        with zipfile.ZipFile(path) as zf:
+            pdfs = [zf.read(n) for n in zf.namelist() if n.lower().endswith(".pdf") and "__MACOSX" not in n]
+
+    early = module.EARLY_EXIT_EXTRACT
+    rows, baseline = [], None
+    for backend in module.PDF_BACKENDS.values():
+        if not backend.installed():
+            print(f"  {backend.name:<10} 미설치 — 건너뜀")
+            continue
+        texts = [module.PDFParser._extract_with(backend, b, early) for b in pdfs]   # 임포트·첫 호출 비용 제외
+        kinds = [module.PDFParser.classify(t) if t.strip() else "" for t in texts]
+        sec = timed(lambda: [module.PDFParser._extract_with(backend, b, early) for b in pdfs], args.repeat)
+        if baseline is None:
+            baseline = kinds
+        diff = sum(a != b for a, b in zip(kinds, baseline))
+        rows.append((backend, sec, diff, sum(not t.strip() for t in texts)))
+
+    print(f"대상: {args.target}  |  PDF {len(pdfs)}건  |  2단계 추출 {'켬' if early else '끔'}")
+    print(f"  {'백엔드':<10}{'버전':>10}{'시간(s)':>10}{'PDF/s':>9}{'분류 불일치':>12}{'빈 텍스트':>10}")
+    for backend, sec, diff, empty in rows:
+        print(f"  {backend.name:<10}{backend.version():>10}{sec:>10.3f}{len(pdfs) / sec:>9.0f}{diff:>12}{empty:>10}")
+    fastest = [backend.name for backend, *_ in sorted(rows, key=lambda r: r[1])]
+    print(f"  빠른 순: {' > '.join(fastest)}  |  auto 선택: {module._pdf_chain[0].name}")
+
+
+if __name__ == "__main__":
+    main()
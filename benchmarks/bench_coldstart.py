@@ -0,0 +1,97 @@
+"""
+API 콜드 스타트 벤치마크 — 새 인터프리터에서 api/index.py 임포트 + 첫 요청까지
+
+  python benchmarks/bench_coldstart.py                  # 라이브러리만 바이트코드 캐시 (서버리스 첫 기동과 같음)
+  python benchmarks/bench_coldstart.py --cache all      # 프로젝트 소스도 캐시 있음
+  python benchmarks/bench_coldstart.py --cache none     # 라이브러리까지 모두 새로 컴파일
+  python benchmarks/bench_coldstart.py --runs 10 --top 15
+
+회차마다 새 하위 프로세스에서 python -X importtime 으로 index를 임포트한 뒤
+GET /api/health, GET / , POST /api/demo 를 차례로 호출해 각각의 소요 시간을 잰다.
+서버리스 배포본은 설치된 라이브러리의 바이트코드는 있지만 읽기 전용 파일 시스템이라 프로젝트 소스(api/*.py)의
+바이트코드는 남지 않으므로, 기본(--cache libs)은 회차마다 api/__pycache__를 지우고 쓰기를 막은 채 잰다.
+--cache none 은 회차마다 빈 PYTHONPYCACHEPREFIX를 써서 모든 모듈을 새로 컴파일한다.
+결과는 회차별 중앙값이며, 임포트 시간이 큰 모듈(누적 기준)을 함께 보여 준다.
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+API_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "api")
+
+CHILD = """
+import sys, time
+t0 = time.perf_counter()
+import index
+t1 = time.perf_counter()
+c = index.app.test_client()   # 테스트 클라이언트 임포트(flask.testing 등)는 측정에서 제외
+print("PHASE request", file=sys.stderr, flush=True)
+t1b = time.perf_counter()
+c.get("/api/health"); t2 = time.perf_counter()
+c.get("/"); t3 = time.perf_counter()
+c.post("/api/demo"); t4 = time.perf_counter()
+print(f"TIMES {t1 - t0} {t2 - t1b} {t3 - t2} {t4 - t3}")
+"""
+
+
+def run_once(cache: str, cache_dir: str) -> Dict[str, object]:
+    env = dict(os.environ, HANYANG_RUN_DB="", HANYANG_CACHE_MAX_MB="0")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    if cache == "none":
+        env["PYTHONPYCACHEPREFIX"] = tempfile.mkdtemp(dir=cache_dir)
+    elif cache == "libs":
+        shutil.rmtree(os.path.join(API_DIR, "__pycache__"), ignore_errors=True)
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", CHILD], cwd=API_DIR, env=env,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        sys.exit(f"❌ 측정 실패:\n{proc.stderr[-2000:]}")
+    times = next(line for line in proc.stdout.splitlines() if line.startswith("TIMES")).split()[1:]
+    modules: Dict[str, Dict[str, int]] = {"import": {}, "request": {}}
+    phase = "import"
+    for line in proc.stderr.splitlines():
+        if line.startswith("PHASE "):
+            phase = line.split()[1]
+        elif line.startswith("import time:") and "cumulative" not in line:
+            _, cum_us, name = [p.strip() for p in line[len("import time:"):].split("|")]
+            modules[phase][name] = int(cum_us)
+    return {"import": float(times[0]), "health": float(times[1]), "index": float(times[2]),
+            "demo": float(times[3]), "modules": modules}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=5, help="측정 회차 수 (중앙값 보고)")
+    ap.add_argument("--cache", choices=["libs", "all", "none"], default="libs",
+                    help="바이트코드 캐시 범위 (libs = 라이브러리만, all = 프로젝트 소스 포함, none = 없음)")
+    ap.add_argument("--top", type=int, default=10, help="임포트 시간 상위 모듈 수")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="hanyang_pyc_") as cache_dir:
+        if args.cache == "all":
+            run_once("all", cache_dir)   # 바이트코드 캐시 생성
+        runs: List[Dict[str, object]] = [run_once(args.cache, cache_dir) for _ in range(args.runs)]
+
+    med = {k: statistics.median(r[k] for r in runs) for k in ("import", "health", "index", "demo")}
+    label = {"libs": "라이브러리만 바이트코드 캐시", "all": "바이트코드 캐시 있음", "none": "바이트코드 캐시 없음"}
+    print(f"콜드 스타트 ({label[args.cache]}, {args.runs}회 중앙값)")
+    print(f"  import index        : {med['import'] * 1e3:8.1f} ms")
+    print(f"  첫 GET /api/health  : {med['health'] * 1e3:8.1f} ms  (누적 {(med['import'] + med['health']) * 1e3:.1f} ms)")
+    print(f"  첫 GET /            : {med['index'] * 1e3:8.1f} ms")
+    print(f"  첫 POST /api/demo   : {med['demo'] * 1e3:8.1f} ms  (코어 지연 임포트 포함)")
+    for phase, title in (("import", "인터프리터 기동 + import index"), ("request", "첫 요청들에서 지연 임포트")):
+        names = set().union(*(r["modules"][phase] for r in runs))
+        cum = {n: statistics.median(r["modules"][phase].get(n, 0) for r in runs) for n in names}
+        print(f"  {title} — 누적 임포트 시간 상위 {args.top}개 모듈:")
+        for name, us in sorted(cum.items(), key=lambda kv: -kv[1])[:args.top]:
+            print(f"    {name:<40}{us / 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+필드 추출 마이크로 벤치마크 — 사전 컴파일 패턴 테이블 vs 기존 패턴별 re.search 순회
+
+  python benchmarks/bench_field_extraction.py                 # api/hanyang_core.py (API 코어)
+  python benchmarks/bench_field_extraction.py --target app    # app.py (Streamlit 버전)
+  python benchmarks/bench_field_extraction.py --docs 2000 --repeat 5
+
+합성 서류(재학증명서·성적증명서·가산점 서류·기타) 본문에 대해 '미분류' 분기와 같이
+모든 필드를 추출하며, 두 방식의 추출 결과가 완전히 같은지 먼저 검증한 뒤 시간을 잰다.
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SURNAMES = "김이박최정강조윤장임오한신권유배노심문허"
+GIVEN = ["민준", "서연", "도윤", "서현", "예은", "지호", "수아", "민서", "하은", "준혁"]
+MAJORS = ["컴퓨터공학과", "전자공학과", "경영학과", "사회복지학과", "국어국문학과", "기계공학부"]
+ADDRS = ["서울특별시 강남구 테헤란로 1", "경기도 수원시 팔달구", "부산광역시 해운대구", "전라남도 목포시"]
+
+
+def load_target(target: str):
+    """벤치마크 대상 모듈 임포트 (api/hanyang_core.py 또는 app.py)"""
+    if target == "api":
+        sys.path.insert(0, os.path.join(ROOT, "api"))
+        import hanyang_core as module
+    else:
+        sys.path.insert(0, ROOT)
+        import app as module
+    return module
+
+
+def synth_documents(n: int, seed: int = 7) -> List[str]:
+    """서류 종류별 합성 본문 n건 생성 (성적증명서는 과목 행 수십~수백 줄)"""
+    rnd = random.Random(seed)
+    docs = []
+    for i in range(n):
+        name = rnd.choice(SURNAMES) + rnd.choice(GIVEN)
+        kind = i % 4
+        if kind == 0:
+            lines = ["재학증명서", f"성명: {name}", f"{rnd.randint(1, 4)}학년",
+                     f"전공: {rnd.choice(MAJORS)}", "한국대학교 총장", f"주소: {rnd.choice(ADDRS)}"]
+        elif kind == 1:
+            lines = ["성적증명서", f"이름: {name}", "수업연한: 4년", f"학과: {rnd.choice(MAJORS)}"]
+            for k in range(rnd.randint(40, 240)):
+                lines.append(
+                    f"{2021 + k % 4}-{k % 2 + 1}학기 과목{k:03d} "
+                    f"{rnd.choice(['전공필수', '전공선택', '교양'])} 3학점 "
+                    f"{rnd.choice(['A+', 'A0', 'B+', 'B0', 'C+'])} {rnd.choice(['4.5', '4.0', '3.5', '3.0'])}"
+                )
+            lines += [f"취득학점: {rnd.randint(20, 130)}", f"졸업기준학점: {rnd.choice([120, 130, 140])}",
+                      f"전체평점: {rnd.uniform(2.0, 4.5):.2f}"]
+        elif kind == 2:
+            lines = ["봉사활동 확인서", f"성명: {name}", f"봉사시간: {rnd.choice([12, 48, 55, 120])}시간",
+                     "정보처리기사 자격증", "TOEIC 855", "만기전역"]
+        else:
+            lines = ["기타 제출 서류", f"{name} 학생", f"학부: {rnd.choice(MAJORS)}",
+                     "GPA 3.42", "이수학점 88", "2년제 전문대학"]
+        docs.append("\n".join(lines))
+    return docs
+
+
+def extract_all(module, text: str) -> tuple:
+    """'미분류' 분기와 같이 모든 필드를 추출"""
+    p = module.PDFParser
+    out = (p.extract_name(text), p.extract_grade(text), p.extract_major(text),
+           p.extract_credits(text), p.extract_gpa(text), p.extract_volunteer_hours(text))
+    if hasattr(p, "extract_max_grade"):
+        out += (p.extract_max_grade(text), p.extract_region(text))
+    return out
+
+
+def legacy_engine(module) -> Callable[[], None]:
+    """
+    기존 방식(패턴 문자열마다 re.search/re.findall, 리터럴 사전 검사 없음)으로 교체하고
+    원래 엔진을 되돌리는 함수를 반환
+    """
+    orig = (module._iter_searches, module._iter_findall)
+
+    def searches(table, text):
+        for ptn, _ in table:
+            m = re.search(ptn.pattern, text, ptn.flags)
+            if m:
+                yield m
+
+    def findall(table, text):
+        for ptn, _ in table:
+            ms = re.findall(ptn.pattern, text, ptn.flags)
+            if ms:
+                yield ms
+
+    module._iter_searches, module._iter_findall = searches, findall
+
+    def restore() -> None:
+        module._iter_searches, module._iter_findall = orig
+    return restore
+
+
+def timed(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--target", choices=["api", "app"], default="api")
+    ap.add_argument("--docs", type=int, default=1000, help="합성 서류 수")
+    ap.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최솟값 보고)")
+    args = ap.parse_args()
+
+    module = load_target(args.target)
+    docs = synth_documents(args.docs)
+    chars = sum(len(d) for d in docs)
+
+    new_results = [extract_all(module, d) for d in docs]
+    restore = legacy_engine(module)
+    try:
+        old_results = [extract_all(module, d) for d in docs]
+        t_old = timed(lambda: [extract_all(module, d) for d in docs], args.repeat)
+    finally:
+        restore()
+    t_new = timed(lambda: [extract_all(module, d) for d in docs], args.repeat)
+
+    if new_results != old_results:
+        bad = sum(a != b for a, b in zip(new_results, old_results))
+        sys.exit(f"❌ 추출 결과 불일치: {bad}/{len(docs)}건")
+
+    print(f"대상: {args.target}  |  서류 {len(docs)}건 / {chars / 1024:.0f} KB  |  결과 일치 ✓")
+    print(f"  기존 패턴별 re.search 순회 : {t_old * 1e3:9.2f} ms  ({t_old / len(docs) * 1e6:7.1f} µs/건)")
+    print(f"  사전 컴파일 + 리터럴 검사  : {t_new * 1e3:9.2f} ms  ({t_new / len(docs) * 1e6:7.1f} µs/건)")
+    print(f"  속도 향상                  : {t_old / t_new:9.2f}×")
+
+
+if __name__ == "__main__":
+    main()
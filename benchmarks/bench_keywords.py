@@ -0,0 +1,82 @@
+"""
+키워드 판별 마이크로 벤치마크 — KeywordMatcher 1회 스캔 vs 분류별 any(kw in text) 순회
+
+  python benchmarks/bench_keywords.py                 # api/hanyang_core.py (API 코어)
+  python benchmarks/bench_keywords.py --target app    # app.py (Streamlit 버전)
+
+서류 분류(classify)·자격증·병역 판별을 합성 서류 전체에 수행하며,
+두 방식의 판별 결과가 완전히 같은지 먼저 검증한 뒤 시간을 잰다.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_field_extraction import load_target, synth_documents, timed  # noqa: E402
+
+
+def legacy_judge(module, text: str) -> tuple:
+    """기존 방식: 키워드 목록마다 any(kw in text) — 자격증은 소문자 비교"""
+    def has(kws):
+        return any(kw in text for kw in kws)
+
+    if has(module.DOC_ELIGIBILITY_KW):
+        kind = "eligibility"
+    elif has(module.DOC_ENROLLMENT_KW):
+        kind = "enrollment"
+    elif has(module.DOC_TRANSCRIPT_KW):
+        kind = "transcript"
+    elif has(module.CERT_KEYWORDS) or has(module.VOLUNTEER_KEYWORDS) or has(module.MILITARY_KEYWORDS):
+        kind = "bonus"
+    else:
+        kind = "unknown"
+    lower = text.lower()
+    cert = any(kw.lower() in lower for kw in module.CERT_KEYWORDS)
+    return kind, cert, has(module.MILITARY_KEYWORDS)
+
+
+def matcher_judge(module, text: str) -> tuple:
+    p = module.PDFParser
+    return p.classify(text), p.check_certificate(text), p.check_military(text)
+
+
+def edge_cases(module) -> list:
+    """키워드 경계·포함·대소문자 조합 — 합성 서류에 드문 경우 보강"""
+    words = (module.DOC_ELIGIBILITY_KW + module.DOC_ENROLLMENT_KW + module.DOC_TRANSCRIPT_KW
+             + module.CERT_KEYWORDS + module.VOLUNTEER_KEYWORDS + module.MILITARY_KEYWORDS)
+    cases = ["", "해당 없음", "toeic 700", "Toefl", "opic IM2"]
+    for a in words:
+        cases += [a, a.lower(), f"x{a}y"]
+        for b in words:
+            cases.append(a + b)
+            cases.append(a[:-1] + b if len(a) > 1 else b)
+    return cases
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--target", choices=["api", "app"], default="api")
+    ap.add_argument("--docs", type=int, default=1000, help="합성 서류 수")
+    ap.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최솟값 보고)")
+    args = ap.parse_args()
+
+    module = load_target(args.target)
+    docs = synth_documents(args.docs)
+
+    for text in docs + edge_cases(module):
+        old, new = legacy_judge(module, text), matcher_judge(module, text)
+        if old != new:
+            sys.exit(f"❌ 판별 결과 불일치: {text[:40]!r} → 기존 {old} / 매처 {new}")
+
+    t_old = timed(lambda: [legacy_judge(module, d) for d in docs], args.repeat)
+    t_new = timed(lambda: [matcher_judge(module, d) for d in docs], args.repeat)
+
+    print(f"대상: {args.target}  |  서류 {len(docs)}건  |  결과 일치 ✓")
+    print(f"  분류별 any(kw in text) 순회 : {t_old * 1e3:9.2f} ms  ({t_old / len(docs) * 1e6:7.1f} µs/건)")
+    print(f"  KeywordMatcher 1회 스캔     : {t_new * 1e3:9.2f} ms  ({t_new / len(docs) * 1e6:7.1f} µs/건)")
+    print(f"  속도 향상                   : {t_old / t_new:9.2f}×")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+전체 처리 파이프라인 벤치마크 — DocumentProcessor.process → 선발 → 직렬화
+
+  python benchmarks/bench_pipeline.py                                  # 신청자 50·200·1000명, 두 백엔드
+  python benchmarks/bench_pipeline.py --applicants 5000 20000 --target api
+  python benchmarks/bench_pipeline.py --zip 신청서류.zip --target app   # 기존 ZIP 측정
+  python benchmarks/bench_pipeline.py --bundle-pages 8 --compare-early-exit   # 2단계 추출 on/off 비교
+
+대상:
+  api : api/hanyang_core.py + api/index.py — 직렬화 = 응답 JSON (_dumps)
+  app : app.py                             — 직렬화 = 전체 자격자 CSV (다운로드 버튼과 같은 경로)
+PDF 백엔드는 양쪽 모두 HANYANG_PDF_BACKEND(기본 auto)로 고르며, 표의 대상 이름 옆에 표시한다.
+
+make_corpus.py로 합성 ZIP을 만든 뒤 (대상 × 신청자 수)마다 별도 하위 프로세스에서 한 번 실행한다.
+하위 프로세스마다 따로 재므로 최대 RSS가 다른 측정과 섞이지 않고, 임포트 비용은 측정에서 빠진다.
+추출 캐시는 기본적으로 끈다 (--cache 로 켜면 같은 ZIP 2회차부터 캐시 적중).
+
+단계별 시간은 해당 함수를 감싼 계측기로 재며, 안쪽 단계 시간은 바깥 단계에서 뺀다.
+  unzip      ZIP 열기·목록·항목 읽기(압축 해제)
+  extract    PDF 텍스트 추출 (마스킹 포함)
+  classify   서류 분류
+  fields     필드 추출 (서류별 필드 + 실명 보정)
+  scoring    점수 계산
+  selection  제외·정렬·순위 (전체 순위 포함)
+  serialize  응답 직렬화
+  other      위에 속하지 않는 나머지 (병합·로그 등)
+단계 분해를 위해 추출은 순차(워커 0)로 실행한다. --workers N 이면 총 시간과 처리량만 의미가 있다.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+from make_corpus import build_corpus  # noqa: E402
+
+STAGES = ["unzip", "extract", "classify", "fields", "scoring", "selection", "serialize"]
+
+
+# ──────────────────────────────────────────────────────────────────────
+# 단계 계측 — 중첩 호출은 안쪽 단계에만 반영 (배타 시간)
+# ──────────────────────────────────────────────────────────────────────
+class StageTimer:
+    def __init__(self):
+        self.totals: Dict[str, float] = {s: 0.0 for s in STAGES}
+        self._stack: List[list] = []   # [단계, 시작 시각, 안쪽 단계 누적]
+
+    def wrap(self, stage: str, fn: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            self._stack.append([stage, time.perf_counter(), 0.0])
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                name, start, inner = self._stack.pop()
+                elapsed = time.perf_counter() - start
+                self.totals[name] += elapsed - inner
+                if self._stack:
+                    self._stack[-1][2] += elapsed
+        return timed
+
+
+def _patch_static(cls, attr: str, timer: StageTimer, stage: str) -> None:
+    setattr(cls, attr, staticmethod(timer.wrap(stage, getattr(cls, attr))))
+
+
+def _instrument(module, timer: StageTimer) -> None:
+    """대상 모듈의 단계별 함수를 계측기로 감싼다 (하위 프로세스 안에서만 호출)"""
+    core = sys.modules.get("hanyang_core", module)   # app.py도 추출·ZIP 읽기는 공용 코어에서 수행
+    parser = core.PDFParser
+    _patch_static(parser, "extract_text", timer, "extract")
+    if hasattr(core, "_extract_isolated"):   # 격리 추출: 하위 프로세스 왕복 포함
+        core._extract_isolated = timer.wrap("extract", core._extract_isolated)
+    _patch_static(parser, "classify", timer, "classify")
+    _patch_static(module.PDFParser, "extract_name", timer, "fields")
+    resolver = module.FieldResolver
+    resolver.resolve = timer.wrap("fields", resolver.resolve)
+
+    open_zip = core._open_zip
+
+    def timed_open(src):
+        zf = timer.wrap("unzip", open_zip)(src)
+        zf.namelist = timer.wrap("unzip", zf.namelist)
+        zf.read = timer.wrap("unzip", zf.read)
+        return zf
+    core._open_zip = timed_open
+
+    scoring = module.ScoringEngine
+    for attr in ("calculate", "calculate_all"):
+        if hasattr(scoring, attr):
+            _patch_static(scoring, attr, timer, "scoring")
+
+
+def run_child(target: str, zip_path: str, workers: int) -> Dict[str, Any]:
+    """하위 프로세스: 대상 모듈로 ZIP 1회 처리 후 단계별 시간·RSS 반환"""
+    import resource
+    import logging
+
+    if target == "api":
+        sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "api"))
+        import hanyang_core as module
+        import index as api   # 응답 직렬화 (_selection_payload·_dumps)
+    else:
+        sys.path.insert(0, os.path.dirname(BENCH_DIR))
+        import app as module
+    # 터미널 출력 핸들러만 제거 (처리 로그 버퍼는 실제와 같이 유지)
+    for lg in (logging.getLogger("hanyang_api"), logging.getLogger("hanyang_scholarship")):
+        lg.handlers = [h for h in lg.handlers if not isinstance(getattr(h, "stream", None), type(sys.stderr))]
+
+    timer = StageTimer()
+    _instrument(module, timer)
+    t0 = time.perf_counter()
+    applicants = module.DocumentProcessor(workers=workers).process(zip_path)
+    t_process = time.perf_counter() - t0
+
+    t1 = time.perf_counter()
+    ranking = module.rank_scholars(applicants, module.MAX_SCHOLARS, set())
+    full = ranking.all
+    timer.totals["selection"] += time.perf_counter() - t1
+
+    t2 = time.perf_counter()
+    if target == "api":
+        payload = api._selection_payload(applicants, ranking, False)
+        out_bytes = len(api._dumps(payload))
+    else:
+        out_bytes = len(full.to_csv(index=False).encode("utf-8-sig")) if len(full) else 0
+    timer.totals["serialize"] += time.perf_counter() - t2
+
+    total = time.perf_counter() - t0
+    with module._open_zip(zip_path) as zf:
+        pdfs = sum(1 for n in zf.namelist() if n.lower().endswith(".pdf") and "__MACOSX" not in n)
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        rss_kb //= 1024   # macOS는 바이트 단위
+    return {"target": target, "applicants": len(applicants), "eligible": len(ranking), "pdfs": pdfs,
+            "process_sec": t_process, "total_sec": total, "stages": timer.totals,
+            "other_sec": max(total - sum(timer.totals.values()), 0.0),
+            "pdfs_per_sec": pdfs / t_process if t_process else 0.0,
+            "peak_rss_mb": rss_kb / 1024, "output_bytes": out_bytes,
+            "backend": "+".join(b.name for b in module._pdf_chain)}
+
+
+# ──────────────────────────────────────────────────────────────────────
+# 상위 프로세스 — 코퍼스 생성, 하위 프로세스 실행, 표 출력
+# ──────────────────────────────────────────────────────────────────────
+def measure(target: str, zip_path: str, workers: int, cache: bool, early_exit: str = "1") -> Dict[str, Any]:
+    env = dict(os.environ, HANYANG_EARLY_EXIT=early_exit, HANYANG_CACHE_MAX_MB="256" if cache else "0")
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", target, zip_path, "--workers", str(workers)],
+        env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        sys.exit(f"❌ {target} 측정 실패:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def print_table(rows: List[Dict[str, Any]]) -> None:
+    head = (f"{'대상':<19}{'신청자':>7}{'PDF':>7}" + "".join(f"{s:>10}" for s in STAGES + ["other"])
+            + f"{'합계(s)':>10}{'PDF/s':>9}{'RSS MB':>9}")
+    print(head)
+    print("─" * len(head))
+    for r in rows:
+        stages = [r["stages"][s] for s in STAGES] + [r["other_sec"]]
+        print(f"{r['label']:<19}{r['applicants']:>7}{r['pdfs']:>7}"
+              + "".join(f"{v:>10.3f}" for v in stages)
+              + f"{r['total_sec']:>10.2f}{r['pdfs_per_sec']:>9.0f}{r['peak_rss_mb']:>9.0f}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--applicants", type=int, nargs="+", default=[50, 200, 1000],
+                    help="합성 코퍼스 신청자 수 목록 (50 ~ 20000)")
+    ap.add_argument("--layout", choices=["folder", "filename", "mixed"], default="mixed")
+    ap.add_argument("--bundle-pages", type=int, default=0, help="확인서 뒤 첨부 쪽 수 (make_corpus.py 참고)")
+    ap.add_argument("--compare-early-exit", action="store_true",
+                    help="2단계 추출(HANYANG_EARLY_EXIT) 끈 상태도 함께 측정")
+    ap.add_argument("--zip", help="합성 코퍼스 대신 측정할 기존 ZIP")
+    ap.add_argument("--target", choices=["api", "app", "both"], default="both")
+    ap.add_argument("--workers", type=int, default=0, help="PDF 병렬 추출 워커 수 (0 = 순차, 단계 분해 가능)")
+    ap.add_argument("--cache", action="store_true", help="추출 캐시 사용 (기본: 끔)")
+    ap.add_argument("--json", help="측정 결과를 JSON 파일로 저장")
+    ap.add_argument("--child", nargs=2, metavar=("TARGET", "ZIP"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child[0], args.child[1], args.workers)))
+        return
+
+    targets = ["api", "app"] if args.target == "both" else [args.target]
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="hanyang_bench_") as tmp:
+        if args.zip:
+            corpora = [args.zip]
+        else:
+            corpora = []
+            for n in args.applicants:
+                if not 50 <= n <= 20000:
+                    sys.exit(f"❌ 신청자 수는 50 ~ 20000 범위여야 합니다: {n}")
+                path = os.path.join(tmp, f"corpus_{n}.zip")
+                t0 = time.perf_counter()
+                info = build_corpus(path, n, args.layout, bundle_pages=args.bundle_pages)
+                print(f"코퍼스 생성: 신청자 {n}명 / PDF {info['pdfs']}건 / "
+                      f"{info['bytes'] / 1024 / 1024:.1f} MB ({time.perf_counter() - t0:.1f}초)")
+                corpora.append(path)
+        modes = ["1", "0"] if args.compare_early_exit else [os.environ.get("HANYANG_EARLY_EXIT", "1")]
+        for path in corpora:
+            for target in targets:
+                for early in modes:
+                    row = measure(target, path, args.workers, args.cache, early)
+                    row["label"] = f"{target}{'' if early != '0' else ' 전체'} ({row['backend']})"
+                    rows.append(row)
+    print()
+    print_table(rows)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+점수 계산 마이크로 벤치마크 — ScoringEngine.calculate_batch (NumPy) vs 신청자별 calculate()
+
+  python benchmarks/bench_scoring.py                   # app.py, 신청자 20,000명
+  python benchmarks/bench_scoring.py --applicants 100000 --repeat 3
+
+무작위 신청자와 round(x, 2) 경계값(x*100 이 .5 에 걸치는 학점 조합)을 섞어 시간을 잰다.
+두 경로의 점수 필드가 비트 단위까지 같은지는 tests/test_scoring.py에서 검증한다.
+[점수] 로그 비용을 빼고 계산만 비교하도록 측정 중에는 로거를 끈다.
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_field_extraction import MAJORS, load_target, timed  # noqa: E402
+
+def synth_applicants(module, n: int, seed: int = 11) -> list:
+    """무작위 신청자 n명 + 반올림 경계 학점 조합"""
+    rnd = random.Random(seed)
+    out = []
+    for i in range(n):
+        grad = rnd.choice([0.0, 65.0, 120.0, 130.0, 140.0])
+        if i % 5 == 0:
+            # 이수율×50 이 소수 셋째 자리 5로 끝나도록 — round()와 np.round 가 갈리기 쉬운 값
+            comp = round(grad * rnd.randint(0, 20000) / 1e6 * 20 + 0.005, 3)
+        else:
+            comp = rnd.uniform(0, 150)
+        out.append(module.ApplicantData(
+            applicant_key=f"a{i}", name=f"신청자{i}", grade=rnd.choice([0, 1, 2, 3, 4, 5]),
+            major=rnd.choice(MAJORS + ["", "AI융합학부", "경제학과"]),
+            completed_credits=comp, graduation_credits=grad,
+            has_certificate=rnd.random() < 0.4, volunteer_hours=rnd.choice([0, 20, 49.9, 50, 80])))
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--applicants", type=int, default=20000, help="합성 신청자 수")
+    ap.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최솟값 보고)")
+    args = ap.parse_args()
+
+    module = load_target("app")
+    module.logger.disabled = True
+    engine = module.ScoringEngine
+    base = synth_applicants(module, args.applicants)
+
+    scalar, batch = copy.deepcopy(base), copy.deepcopy(base)
+
+    t_old = timed(lambda: [engine.calculate(a) for a in scalar], args.repeat)
+    t_new = timed(lambda: engine.calculate_all(batch), args.repeat)
+    # 열 배열을 미리 만들어 둔 경우 (what-if 재계산) — 객체 읽기·쓰기 없이 계산만
+    cols = dict(grade=[a.grade for a in base], completed_credits=[a.completed_credits for a in base],
+                graduation_credits=[a.graduation_credits for a in base],
+                has_certificate=[a.has_certificate for a in base],
+                volunteer_hours=[a.volunteer_hours for a in base],
+                is_stem=[b.bonus_stem for b in batch])
+    cols = {k: module.np.asarray(v) for k, v in cols.items()}
+    t_cols = timed(lambda: engine.calculate_batch(**cols), args.repeat)
+
+    n = len(base)
+    print(f"신청자 {n}명")
+    print(f"  신청자별 calculate()      : {t_old * 1e3:9.2f} ms  ({t_old / n * 1e6:6.2f} µs/명)")
+    print(f"  calculate_all (NumPy 일괄) : {t_new * 1e3:9.2f} ms  ({t_new / n * 1e6:6.2f} µs/명)")
+    print(f"  calculate_batch (열 배열)  : {t_cols * 1e3:9.2f} ms  ({t_cols / n * 1e6:6.2f} µs/명)")
+    print(f"  속도 향상 (일괄 / 열 배열) : {t_old / t_new:9.2f}× / {t_old / t_cols:.1f}×")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+테스트 공용 설정 — api/(코어·서버), 저장소 루트(app.py), benchmarks/(합성 PDF 작성기)를 임포트 경로에 추가.
+
+추출 캐시와 결과 DB는 끈다 (테스트가 사용자 캐시 폴더·data/ 를 읽거나 채우지 않도록, 모듈 임포트 전에 설정).
+"""
+
+import io
+import os
+import sys
+import zipfile
+from typing import Dict, List
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (os.path.join(ROOT, "api"), ROOT, os.path.join(ROOT, "benchmarks")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+os.environ["HANYANG_CACHE_MAX_MB"] = "0"
+os.environ["HANYANG_RUN_DB"] = ""
+
+from make_corpus import text_pdf  # noqa: E402
+
+
+def make_zip(files: Dict[str, List[str]]) -> bytes:
+    """{ZIP 내 경로: 1쪽 본문 줄 목록} → 텍스트 PDF를 담은 ZIP 바이트"""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for path, lines in files.items():
+            zf.writestr(path, text_pdf([lines]))
+    return buf.getvalue()
+
+
+@pytest.fixture
+def core():
+    import hanyang_core
+    return hanyang_core
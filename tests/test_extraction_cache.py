@@ -0,0 +1,79 @@
+"""추출 캐시 — 마스킹 규칙·추출 한도가 다르면 항목을 공유하지 않음, 소유자 전용·기본 비활성·만료"""
+
+import os
+import subprocess
+import sys
+import time
+
+from make_corpus import text_pdf
+
+PDF = text_pdf([["자립지원 대상자 확인서", "연락처: 010-1234-5678", "입금 계좌: 110-123456-7890"]])
+
+
+def _cache(core, tmp_path, backend="pypdf-test"):
+    return core.ExtractionCache(str(tmp_path), 1 << 20, backend)
+
+
+def test_key_depends_on_masking_rules(core, tmp_path):
+    import app
+
+    cache = _cache(core, tmp_path)
+    assert core._masker.fingerprint != app._MASKER.fingerprint
+    assert cache.key(PDF, core._masker.fingerprint) != cache.key(PDF, app._MASKER.fingerprint)
+    assert core.MaskingEngine(core.MASKING_RULES, 10).fingerprint == core._masker.fingerprint
+
+
+def test_key_depends_on_backend_and_limits(core, tmp_path):
+    a = _cache(core, tmp_path, "pypdf-4.0-early-p300-c2000000")
+    b = _cache(core, tmp_path, "pypdf-4.0-early-p10-c2000000")
+    assert a.key(PDF) != b.key(PDF)
+
+
+def test_api_entry_does_not_leak_unmasked_account_to_app(core, tmp_path, monkeypatch):
+    import app
+
+    monkeypatch.setattr(core, "_extract_cache", _cache(core, tmp_path))
+    api_text, hit = core.PDFParser.extract_text_cached(PDF)
+    assert not hit and "110-123456-7890" in api_text
+    app_text, hit = core.PDFParser.extract_text_cached(PDF, app._MASKER)
+    assert not hit and "110-******-7890" in app_text
+    assert core.PDFParser.extract_text_cached(PDF, app._MASKER) == (app_text, True)
+
+
+def test_disabled_by_default(core):
+    env = {k: v for k, v in os.environ.items() if k != "HANYANG_CACHE_MAX_MB"}
+    out = subprocess.run([sys.executable, "-c", "import hanyang_core as c; print(c._extract_cache.enabled)"],
+                         cwd=os.path.dirname(core.__file__), env=env, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_entries_are_owner_only(core, tmp_path):
+    cache = _cache(core, tmp_path / "cache")
+    assert cache.enabled
+    key = cache.key(PDF)
+    cache.put(key, "본문")
+    path = cache._path(key)
+    assert os.stat(tmp_path / "cache").st_mode & 0o777 == 0o700
+    assert os.stat(os.path.dirname(path)).st_mode & 0o777 == 0o700
+    assert os.stat(path).st_mode & 0o777 == 0o600
+
+
+def test_shared_directory_disables_cache(core, tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    assert not _cache(core, shared).enabled
+
+
+def test_entries_expire_after_ttl(core, tmp_path):
+    cache = core.ExtractionCache(str(tmp_path / "cache"), 1 << 20, "pypdf-test", ttl=60)
+    old, new = cache.key(b"old"), cache.key(b"new")
+    cache.put(old, "오래된 본문")
+    past = time.time() - 120
+    os.utime(cache._path(old), (past, past))
+    assert cache.get(old) is None and not os.path.exists(cache._path(old))
+    cache.put(old, "오래된 본문")
+    os.utime(cache._path(old), (past, past))
+    fresh = core.ExtractionCache(cache.directory, cache.max_bytes, cache.backend, ttl=60)
+    fresh.put(new, "새 본문")   # 첫 저장 때 이전 실행이 남긴 만료 항목 정리
+    assert not os.path.exists(cache._path(old)) and fresh.get(new) == "새 본문"
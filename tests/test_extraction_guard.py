@@ -0,0 +1,23 @@
+"""격리 추출 — 하위 프로세스 시작 방식, 마스킹 규칙 전달"""
+
+from make_corpus import text_pdf
+
+
+def test_guard_does_not_fork(core):
+    guard = core.ExtractionGuard(30, 0)
+    try:
+        text = guard.extract(text_pdf([["성적증명서", "연락처: 010-1234-5678"]]), False)
+        assert guard._proc._start_method in ("forkserver", "spawn")
+    finally:
+        guard.close()
+    assert "성적증명서" in text and "010-****-5678" in text
+
+
+def test_guard_uses_given_masker(core):
+    masker = core.MaskingEngine([(r"(\d{3})-(\d{4})-(\d{4})", r"\1-####-\3")], min_digits=10)
+    guard = core.ExtractionGuard(30, 0)
+    try:
+        text = guard.extract(text_pdf([["번호: 123-4567-8901"]]), False, masker)
+    finally:
+        guard.close()
+    assert "123-####-8901" in text
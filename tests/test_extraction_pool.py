@@ -0,0 +1,103 @@
+"""추출 워커 풀 — fork 없이 기동, 앱별 마스킹 규칙 전달, 순차 처리와 같은 결과"""
+
+import io
+import time
+import zipfile
+from dataclasses import asdict
+
+from conftest import make_zip
+
+ACCOUNT = "입금 계좌: 110-123456-7890"
+
+
+def _sample_zip(n: int = 10) -> bytes:
+    files = {}
+    for i in range(n):
+        name = f"신청자{i:02d}"
+        files[f"{name}/확인서.pdf"] = ["자립지원 대상자 확인서", f"성명: 김민{'준서'[i % 2]}", ACCOUNT]
+        files[f"{name}/재학증명서.pdf"] = ["재학증명서", f"{i % 4 + 1}학년", "전공: 컴퓨터공학과"]
+    return make_zip(files)
+
+
+def test_pool_does_not_fork(core):
+    assert core._mp_context().get_start_method() in ("forkserver", "spawn")
+    pool = core.ExtractionPool(2)
+    try:
+        assert pool._executor()._mp_context.get_start_method() != "fork"
+    finally:
+        pool._discard(pool._executor())
+
+
+def test_pool_uses_app_masking_rules(core):
+    import app
+
+    with zipfile.ZipFile(io.BytesIO(_sample_zip())) as zf:
+        pdfs = zf.namelist()
+        sequential = [(fp, *core._extract_entry(zf, fp, app._MASKER)[:2]) for fp in pdfs]
+        pool = core.ExtractionPool(2)
+        try:
+            pooled = [item[:3] for item in pool.extract(zf, pdfs, app._MASKER)]
+        finally:
+            pool._discard(pool._executor())
+    assert pooled == sequential
+    eligibility = [text for _, text, dt in pooled if dt == "eligibility"]
+    assert eligibility and all("110-******-7890" in t and "123456" not in t for t in eligibility)
+
+
+def test_app_parallel_matches_sequential():
+    import app
+
+    data = _sample_zip()
+    sequential = app.DocumentProcessor(workers=0).process(data)
+    parallel = app.DocumentProcessor(workers=2).process(data)
+    assert [asdict(a) for a in parallel] == [asdict(a) for a in sequential]
+
+
+def _children_after_extract(pdf_bytes: bytes) -> int:
+    """워커 안에서 추출한 뒤 살아 있는 하위 프로세스 수 (격리 추출 프로세스를 띄웠으면 1)"""
+    import multiprocessing
+    import hanyang_core
+
+    hanyang_core._extract_bytes(pdf_bytes)
+    return len(multiprocessing.active_children())
+
+
+def _stuck_on_slow(fp: str, pdf_bytes: bytes, masker):
+    """경로에 'slow'가 든 PDF에서 멈추는 워커 작업 — 그 밖에는 실제 _extract_pooled"""
+    import time
+    import hanyang_core
+
+    if "slow" in fp:
+        time.sleep(60)
+    return hanyang_core._extract_pooled(fp, pdf_bytes, masker)
+
+
+def test_pool_worker_does_not_start_guard(core):
+    from make_corpus import text_pdf
+
+    assert core.PDF_TIMEOUT_SEC > 0
+    pool = core.ExtractionPool(1)
+    try:
+        assert pool._executor().submit(_children_after_extract, text_pdf([["재학증명서"]])).result() == 0
+    finally:
+        pool._discard(pool._executor())
+
+
+def test_pool_timeout_skips_stuck_pdf(core, monkeypatch):
+    monkeypatch.setattr(core, "PDF_TIMEOUT_SEC", 1.0)
+    monkeypatch.setattr(core, "_extract_pooled", _stuck_on_slow)
+    files = {f"신청자{i:02d}/재학증명서.pdf": ["재학증명서", f"{i % 4 + 1}학년"] for i in range(8)}
+    files["신청자03/slow.pdf"] = ["성적증명서"]
+    pool = core.ExtractionPool(2)
+    start = time.perf_counter()
+    try:
+        with zipfile.ZipFile(io.BytesIO(make_zip(files))) as zf:
+            items = list(pool.extract(zf, zf.namelist()))
+    finally:
+        pool._discard(pool._executor(), kill=True)
+    assert time.perf_counter() - start < 15
+    assert [item[0] for item in items] == list(files)
+    errors = {fp: err for fp, _, _, err, _ in items if err}
+    assert list(errors) == ["신청자03/slow.pdf"] and "처리 시간" in errors["신청자03/slow.pdf"]
+    assert all(dt == "enrollment" for fp, _, dt, err, _ in items if not err)
+    assert pool.started == 2
@@ -0,0 +1,193 @@
+"""
+FieldResolver — 서류를 ZIP 순서대로 하나씩 적용하던 이전 방식(_apply / _apply_document)과 같은 결과.
+
+무작위 서류 묶음(빈 값·0 값·같은 종류 여러 건 포함)을 두 방식에 넣어 신청자 필드 전체를 비교한다.
+이전 방식은 아래 _api_apply·_app_apply에 그대로 옮겨 둠 (서류 종류는 파이프라인처럼 classify로 결정).
+"""
+
+import random
+from dataclasses import asdict
+
+import pytest
+
+CASES = 3000
+
+_LINES = [
+    "자립지원 대상자 확인서", "재학증명서", "성적증명서", "봉사활동 확인서", "가산점 증빙 서류",
+    "성명: 김민준", "이름: 이서연", "학생명: 박지호",
+    "1학년 재학 중", "3학년", "학년: 4", "학년: 2",
+    "전공: 컴퓨터공학과", "학과: 경영학과", "학부: 기계공학부",
+    "취득학점: 0", "취득학점: 45", "이수학점: 95.5", "누적학점: 130",
+    "졸업기준학점: 0", "졸업기준학점: 65", "졸업학점: 100", "졸업기준학점: 130",
+    "전체평점: 0.00", "전체평점: 3.75", "GPA: 4.10", "평점: 2.50",
+    "주소: 서울특별시 강남구 테헤란로 123", "주소: 부산광역시 해운대구 45", "거주지: 대전광역시 유성구 7",
+    "수업연한: 2년", "수업연한: 3년", "수업연한: 4년", "학교: 한국전문대학", "학교: 한국전문대학 3년제",
+    "학교: 한국대학교", "4년제",
+    "정보처리기사 자격증", "TOEIC 855", "봉사시간: 0시간", "봉사시간: 12시간", "봉사시간: 55시간",
+    "120시간", "병역사항: 만기전역", "위와 같이 증명합니다.",
+]
+
+
+def _documents(rnd: random.Random):
+    return ["\n".join(rnd.choice(_LINES) for _ in range(rnd.randint(0, 6))) or "빈 서류"
+            for _ in range(rnd.randint(1, 6))]
+
+
+def _api_apply(p, doc_keywords, a, dt: str, text: str) -> None:
+    """api/index.py DocumentProcessor._apply (FieldResolver 도입 전)"""
+    if not a.region:
+        r = p.extract_region(text)
+        if r: a.region = r
+    mg = p.extract_max_grade(text)
+    if mg and mg != a.max_grade and mg in (2, 3, 4): a.max_grade = mg
+    if dt == "eligibility": a.is_eligible = True
+    elif dt == "enrollment":
+        a.has_enrollment = True
+        g = p.extract_grade(text); a.grade = g if g else a.grade
+        m = p.extract_major(text); a.major = m if m else a.major
+    elif dt == "transcript":
+        a.has_transcript = True
+        comp, grad = p.extract_credits(text)
+        if comp is not None: a.completed_credits = comp
+        if grad is not None:
+            a.graduation_credits = grad
+            if a.max_grade == 4 and grad < 90: a.max_grade = 2
+            elif a.max_grade == 4 and grad < 115: a.max_grade = 3
+        gpa = p.extract_gpa(text)
+        if gpa is not None: a.gpa = gpa
+        if a.grade == 0:
+            g = p.extract_grade(text)
+            if g: a.grade = g
+        if not a.major:
+            m = p.extract_major(text)
+            if m: a.major = m
+    elif dt == "bonus":
+        a.has_bonus_doc = True
+        if p.check_certificate(text): a.has_certificate = True
+        h = p.extract_volunteer_hours(text)
+        if h > 0: a.volunteer_hours = max(a.volunteer_hours, h)
+        if p.check_military(text): a.is_military = True
+    else:
+        if "eligibility" in doc_keywords.scan(text): a.is_eligible = True
+        if a.grade == 0:
+            g = p.extract_grade(text)
+            if g: a.grade = g
+        if not a.major:
+            m = p.extract_major(text)
+            if m: a.major = m
+        comp, grad = p.extract_credits(text)
+        if comp and a.completed_credits == 0: a.completed_credits = comp
+        if grad: a.graduation_credits = grad
+        gpa = p.extract_gpa(text)
+        if gpa and a.gpa == 0: a.gpa = gpa
+        if p.check_certificate(text): a.has_certificate = True
+        h = p.extract_volunteer_hours(text)
+        if h > 0: a.volunteer_hours = max(a.volunteer_hours, h)
+        if p.check_military(text): a.is_military = True
+
+
+def _app_apply(p, doc_keywords, a, dt: str, text: str) -> None:
+    """app.py DocumentProcessor._apply_document (FieldResolver 도입 전)"""
+    if dt == "eligibility":
+        a.is_eligible = True
+    elif dt == "enrollment":
+        a.has_enrollment = True
+        grade = p.extract_grade(text)
+        if grade:
+            a.grade = grade
+        major = p.extract_major(text)
+        if major:
+            a.major = major
+    elif dt == "transcript":
+        a.has_transcript = True
+        completed, graduation = p.extract_credits(text)
+        if completed is not None:
+            a.completed_credits = completed
+        if graduation is not None:
+            a.graduation_credits = graduation
+        gpa = p.extract_gpa(text)
+        if gpa is not None:
+            a.gpa = gpa
+        if a.grade == 0:
+            g = p.extract_grade(text)
+            if g:
+                a.grade = g
+        if not a.major:
+            m = p.extract_major(text)
+            if m:
+                a.major = m
+    elif dt == "bonus":
+        a.has_bonus_doc = True
+        if p.check_certificate(text):
+            a.has_certificate = True
+        hours = p.extract_volunteer_hours(text)
+        if hours > 0:
+            a.volunteer_hours = max(a.volunteer_hours, hours)
+        if p.check_military(text):
+            a.is_military = True
+    else:
+        if "eligibility" in doc_keywords.scan(text):
+            a.is_eligible = True
+        if a.grade == 0:
+            g = p.extract_grade(text)
+            if g:
+                a.grade = g
+        if not a.major:
+            m = p.extract_major(text)
+            if m:
+                a.major = m
+        completed, graduation = p.extract_credits(text)
+        if completed is not None and a.completed_credits == 0:
+            a.completed_credits = completed
+        if graduation is not None:
+            a.graduation_credits = graduation
+        gpa = p.extract_gpa(text)
+        if gpa is not None and a.gpa == 0:
+            a.gpa = gpa
+        if p.check_certificate(text):
+            a.has_certificate = True
+        hours = p.extract_volunteer_hours(text)
+        if hours > 0:
+            a.volunteer_hours = max(a.volunteer_hours, hours)
+        if p.check_military(text):
+            a.is_military = True
+
+
+def _reference(mod, apply, docs):
+    """이전 방식 — 서류마다 필드 적용, 끝난 뒤 서류 종류별로 이어 붙인 원문에서 실명 보정"""
+    from hanyang_core import DOC_KEYWORDS
+
+    p = mod.PDFParser
+    a = mod.ApplicantData(applicant_key="key", name="key")
+    texts = {}
+    for text in docs:
+        dt = p.classify(text)
+        texts[dt] = texts[dt] + "\n" + text if dt in texts else ("\n" + text if apply is _api_apply else text)
+        apply(p, DOC_KEYWORDS, a, dt, text)
+    for text in texts.values():
+        name = p.extract_name(text)
+        if name:
+            a.name = name
+            break
+    return a
+
+
+def _resolved(mod, docs):
+    a = mod.ApplicantData(applicant_key="key", name="key")
+    r = mod.FieldResolver(a)
+    for i, text in enumerate(docs):
+        r.add(f"key/{i}.pdf", mod.PDFParser.classify(text), text)
+    r.resolve()
+    return a
+
+
+@pytest.mark.parametrize("target", ["api", "app"])
+def test_resolver_matches_sequential_apply(target):
+    import hanyang_core
+    import app
+
+    mod, apply = (hanyang_core, _api_apply) if target == "api" else (app, _app_apply)
+    rnd = random.Random(15)
+    for _ in range(CASES):
+        docs = _documents(rnd)
+        assert asdict(_resolved(mod, docs)) == asdict(_reference(mod, apply, docs)), docs
@@ -0,0 +1,76 @@
+"""비동기 작업(/api/jobs) — 대기·실행 중 작업 수 한도, 업로드 응답 로그는 그 요청의 것만"""
+
+import io
+import os
+import threading
+import time
+
+from conftest import make_zip
+
+
+def test_submit_rejected_when_full(monkeypatch):
+    import index
+
+    release = threading.Event()
+    spooled = []
+
+    def blocked(zp, excl, include_all, progress=None, events=None, encode=lambda r: r):
+        spooled.append(zp)
+        release.wait(10)
+        return encode({"success": True}), 200
+
+    monkeypatch.setattr(index, "_process_captured", blocked)
+    monkeypatch.setattr(index, "_job_runner", index.JobRunner(1, 32, 3600, max_active=2))
+    client = index.app.test_client()
+    data = make_zip({"신청자/재학증명서.pdf": ["재학증명서", "3학년"]})
+    post = lambda: client.post("/api/jobs", data={"file": (io.BytesIO(data), "서류.zip")})
+    try:
+        first, second = post(), post()
+        assert first.status_code == second.status_code == 202
+        full = post()
+        assert full.status_code == 429 and full.get_json()["jobs_full"] and full.headers["Retry-After"]
+    finally:
+        release.set()
+    job_id = first.get_json()["job_id"]
+    for _ in range(100):
+        if index._job_runner.get(job_id).finished is not None and not index._job_runner.full:
+            break
+        time.sleep(0.05)
+    assert post().status_code == 202
+    index._job_runner._pool.shutdown(wait=True)
+    assert not any(os.path.exists(zp) for zp in spooled)
+
+
+def test_upload_log_has_only_its_own_lines(monkeypatch):
+    import index
+
+    def process(zp, excl, include_all, progress=None, events=None):
+        index.logger.info("이 요청의 로그")
+        other = threading.Thread(target=index.logger.info, args=("다른 요청의 로그",))
+        other.start()
+        other.join()
+        return {"success": True}, 200
+
+    monkeypatch.setattr(index, "_process_upload", process)
+    client = index.app.test_client()
+    data = make_zip({"신청자/재학증명서.pdf": ["재학증명서", "3학년"]})
+    for _ in range(2):
+        log = client.post("/api/upload", data={"file": (io.BytesIO(data), "서류.zip")}).get_json()["log"]
+        assert log.count("이 요청의 로그") == 1 and "다른 요청의 로그" not in log
+
+
+def test_job_failure_is_reported_as_error(monkeypatch):
+    import index
+
+    def broken(zp, excl, include_all, progress=None, events=None, encode=lambda r: r):
+        raise RuntimeError("처리 실패")
+
+    monkeypatch.setattr(index, "_process_captured", broken)
+    monkeypatch.setattr(index, "_job_runner", index.JobRunner(1, 32, 3600))
+    client = index.app.test_client()
+    data = make_zip({"신청자/재학증명서.pdf": ["재학증명서", "3학년"]})
+    job_id = client.post("/api/jobs", data={"file": (io.BytesIO(data), "서류.zip")}).get_json()["job_id"]
+    index._job_runner._pool.shutdown(wait=True)
+    assert client.get(f"/api/jobs/{job_id}").get_json()["status"] == "error"
+    result = client.get(f"/api/jobs/{job_id}/result")
+    assert result.status_code == 500 and result.get_json() == {"success": False, "error": "처리 실패"}
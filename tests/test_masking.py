@@ -0,0 +1,46 @@
+"""
+마스킹 — MaskingEngine 1회 스캔이 기존 규칙별 re.sub 연쇄(benchmarks/bench_masking.py LEGACY_RULES)와 같은 결과.
+
+숫자(유니코드 숫자 포함)·공백·줄바꿈·하이픈(-, –)·별표·한글이 뒤섞인 무작위 문자열,
+주민등록번호·전화번호·계좌번호가 겹치거나 이어 붙은 문자열, 합성 성적증명서 본문으로 비교한다.
+"""
+
+import random
+
+import pytest
+
+from bench_masking import legacy_mask, transcripts
+
+CASES = 50000
+
+ALPHABET = list("0123456789" * 6) + list("  \n\t--–*") + ["가", "학", "A", "٣", "３", "　", ":"]
+PIECES = ["010-1234-5678", "010 - 123 - 4567", "01012345678", "990101-1234567", "9901011234567",
+          "990101 – 2345678", "123-456789-1234", "1234-5678-9012345", "2024-1학기", "4.5", "120"]
+
+
+def random_cases(n: int, seed: int = 11):
+    """무작위 문자열 + 알려진 형식을 이어 붙이거나 잘라 붙인 문자열"""
+    rnd = random.Random(seed)
+    for _ in range(n):
+        if rnd.random() < 0.5:
+            yield "".join(rnd.choice(ALPHABET) for _ in range(rnd.randint(0, 60)))
+        else:
+            parts = []
+            for _ in range(rnd.randint(1, 5)):
+                piece = rnd.choice(PIECES)
+                if rnd.random() < 0.3:
+                    cut = rnd.randint(0, len(piece))
+                    piece = piece[:cut] if rnd.random() < 0.5 else piece[cut:]
+                parts.append(piece)
+                parts.append(rnd.choice(["", "", " ", "-", "\n", "*", "가", "7", "12"]))
+            yield "".join(parts)
+
+
+@pytest.mark.parametrize("target", ["api", "app"])
+def test_engine_matches_legacy_rules(target):
+    if target == "api":
+        from hanyang_core import mask_sensitive as mask
+    else:
+        from app import mask_sensitive_info as mask
+    for text in list(random_cases(CASES)) + transcripts(50):
+        assert mask(text) == legacy_mask(target, text), text
@@ -0,0 +1,142 @@
+"""결과 보관 — 실행 위치와 무관한 DB 경로, 회차 삭제(신청자 행 포함), 보관 기간 정리, 동시 재선발"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+from contextlib import closing
+
+import pytest
+
+
+@pytest.fixture
+def api(core, tmp_path, monkeypatch):
+    import index
+
+    db = index.RunDB(str(tmp_path / "data" / "runs.sqlite3"), "api", keep_days=30)
+    monkeypatch.setattr(index, "_run_store", index.RunStore(4, 3600, db))
+    return index
+
+
+def _count(path, table: str) -> int:
+    with closing(sqlite3.connect(path)) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _save(index, n: int = 12) -> str:
+    applicants = index.core.make_demo_applicants(n)
+    return index._run_store.put(applicants, index.core.rank_scholars(applicants, index.core.MAX_SCHOLARS))
+
+
+def test_default_path_is_shared_data_dir(tmp_path):
+    env = {k: v for k, v in os.environ.items() if k not in ("HANYANG_RUN_DB", "HANYANG_DATA_DIR", "VERCEL")}
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = "import sys; sys.path[:0]=[{!r},{!r}]; import index, app; print(index.RUN_DB_PATH); print(app.RUN_DB_PATH)"
+    out = subprocess.run([sys.executable, "-c", code.format(os.path.join(root, "api"), root)],
+                         cwd=tmp_path, env=env, capture_output=True, text=True, check=True)
+    api_path, app_path = out.stdout.split()[-2:]
+    assert api_path == app_path == os.path.join(root, "data", "hanyang_runs.sqlite3")
+
+
+def test_delete_endpoint_cascades(api):
+    rid = _save(api)
+    path = api._run_store.db.path
+    assert _count(path, "applicants") == 12
+    assert os.stat(os.path.dirname(path)).st_mode & 0o777 == 0o700
+    client = api.app.test_client()
+    assert client.delete(f"/api/runs/{rid}").get_json()["success"]
+    assert _count(path, "runs") == 0 and _count(path, "applicants") == 0
+    assert client.delete(f"/api/runs/{rid}").status_code == 404
+    assert client.get(f"/api/runs/{rid}").status_code == 404
+
+
+def test_save_prunes_expired_runs(api):
+    old = _save(api)
+    path = api._run_store.db.path
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.execute("UPDATE runs SET created='2000-01-01T00:00:00' WHERE id=?", (old,))
+    new = _save(api)
+    with closing(sqlite3.connect(path)) as conn:
+        assert [r for (r,) in conn.execute("SELECT id FROM runs")] == [new]
+        assert {r for (r,) in conn.execute("SELECT DISTINCT run_id FROM applicants")} == {new}
+
+
+def test_app_and_api_share_one_store(api):
+    import app
+    from hanyang_runs import RunDB
+
+    assert app.RunDB is api.RunDB is RunDB
+    api_db = api._run_store.db
+    app_db = RunDB(api_db.path, "app")
+    api_id = _save(api)
+    applicants = app.make_demo_applicants(5)
+    ranking = app.rank_scholars(applicants, app.MAX_SCHOLARS, set())
+    assert app_db.save("app-run", applicants, ranking, set())
+    assert [r["result_id"] for r in app_db.recent()] == ["app-run"]
+    assert [r["result_id"] for r in api_db.recent(20)] == [api_id]
+    assert app_db.recent()[0].keys() == api_db.recent(20)[0].keys()
+    loaded, _ = app_db.load("app-run", app.ApplicantData)
+    assert [type(a) for a in loaded] == [app.ApplicantData] * 5 and loaded[0].name == applicants[0].name
+    assert app_db.load(api_id, app.ApplicantData) is None
+    assert set(ranking.top["성명"]) <= api_db.selected_names()
+    assert app_db.delete("app-run") and not app_db.delete("app-run") and not app_db.delete(api_id)
+    with closing(sqlite3.connect(api_db.path)) as conn:
+        assert {r for (r,) in conn.execute("SELECT DISTINCT run_id FROM applicants")} == {api_id}
+
+
+def _selected(path):
+    with closing(sqlite3.connect(path)) as conn:
+        return conn.execute("SELECT seq, rank FROM applicants WHERE selected=1 ORDER BY rank").fetchall()
+
+
+def test_save_stores_top_ranks_without_full_sort(api):
+    applicants = api.core.make_demo_applicants(60)
+    ranking = api.core.rank_scholars(applicants, 5)
+    api._run_store.put(applicants, ranking)
+    assert ranking._order is None
+    seq = {id(a): i for i, a in enumerate(applicants)}
+    assert _selected(api._run_store.db.path) == [(seq[id(a)], i) for i, a in enumerate(ranking._top, 1)]
+    assert _count(api._run_store.db.path, "applicants") == 60
+
+
+def test_update_rewrites_only_changed_rows(api):
+    applicants = api.core.make_demo_applicants(60)
+    ranking = api.core.rank_scholars(applicants, 5)
+    rid = api._run_store.put(applicants, ranking)
+    db = api._run_store.db
+    first = ranking._top[0].name
+    for excluded in ({first}, set()):
+        ranking = api.core.rank_scholars(applicants, 5, excluded)
+        db.update(rid, applicants, ranking, excluded)
+        seq = {id(a): i for i, a in enumerate(applicants)}
+        assert _selected(db.path) == [(seq[id(a)], i) for i, a in enumerate(ranking._top, 1)]
+        loaded, loaded_excl = db.load(rid, api.core.ApplicantData)
+        assert loaded_excl == excluded
+        assert [a.parse_notes for a in loaded] == [a.parse_notes for a in applicants]
+
+
+def test_concurrent_rescore_responses_are_consistent(api):
+    core = api.core
+    applicants = core.make_demo_applicants(200)
+    rid = api._run_store.put(applicants, core.rank_scholars(applicants, core.MAX_SCHOLARS))
+    names = {a.name for a in applicants}
+    top = {r["성명"] for r in api._run_store.get(rid).ranking.top}
+    lists = [sorted(top), []]
+    failures = []
+
+    def worker(i: int) -> None:
+        client = api.app.test_client()
+        for j in range(10):
+            excl = set(lists[(i + j) % 2])
+            body = client.post("/api/rescore", json={"result_id": rid, "excluded_names": sorted(excl)}).get_json()
+            marked = {w["name"] for w in body["warnings"] if core.EXCLUDED_NOTE in w["note"]}
+            if {r["성명"] for r in body["results"]} & excl or marked != names & excl:
+                failures.append((i, j))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not failures
@@ -0,0 +1,23 @@
+"""점수 계산 — ScoringEngine.calculate_all(NumPy 일괄)이 신청자별 calculate()와 비트 단위까지 같은 결과 (round 경계값 포함)"""
+
+import copy
+
+from bench_scoring import synth_applicants
+
+SCORE_FIELDS = ("grade_score", "completion_rate", "completion_score", "bonus_stem",
+                "bonus_cert", "bonus_volunteer", "bonus_score", "total_score")
+
+
+def test_batch_matches_scalar(monkeypatch):
+    import app
+
+    monkeypatch.setattr(app.logger, "disabled", True)
+    base = synth_applicants(app, 20000)
+    scalar, batch = copy.deepcopy(base), copy.deepcopy(base)
+    for a in scalar:
+        app.ScoringEngine.calculate(a)
+    app.ScoringEngine.calculate_all(batch)
+    for s, b in zip(scalar, batch):
+        for f in SCORE_FIELDS:
+            sv, bv = getattr(s, f), getattr(b, f)
+            assert type(sv) is type(bv) and sv == bv, (s.name, f, sv, bv)